@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -42,6 +43,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'loginapi.middleware.RequestTimingMiddleware',
+    'loginapi.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -82,6 +85,110 @@ DATABASES = {
     }
 }
 
+# DB_PROFILE=production: WAL so readers don't wait on writers, a busy timeout
+# instead of "database is locked", write transactions that take the lock up
+# front (BEGIN IMMEDIATE), mmap'd reads and persistent connections.
+SQLITE_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA mmap_size=268435456',  # 256 MiB
+    'PRAGMA cache_size=-65536',  # 64 MiB
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA foreign_keys=ON',
+]
+
+if os.environ.get('DB_PROFILE') == 'production':
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ';'.join(SQLITE_PRAGMAS),
+            'timeout': 20,  # seconds; sets busy_timeout
+            'transaction_mode': 'IMMEDIATE',
+        },
+    })
+
+# Read replica for list/stats endpoints (see loginapi.routers). Locally any
+# copy of the primary file works, e.g. DB_REPLICA_PATH=db-replica.sqlite3.
+if os.environ.get('DB_REPLICA_PATH'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': BASE_DIR / os.environ['DB_REPLICA_PATH'],
+        # Tests use the primary's test database instead of a separate copy
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['loginapi.routers.ReplicaRouter']
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'backendapi-default',
+    },
+    # Shared between worker processes on the same host
+    'files': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache' / 'django',
+    },
+}
+
+# Per-user cache for the polled dashboard endpoints (stats, profile completion,
+# recent applications). Set DASHBOARD_CACHE_ALIAS=files to use the file-based cache.
+DASHBOARD_CACHE = {
+    'ALIAS': os.environ.get('DASHBOARD_CACHE_ALIAS', 'default'),
+    'TTL': 30,  # seconds
+}
+
+
+# Email
+# Messages are queued in the OutboundEmail table and delivered by
+# `manage.py send_queued_mail`. Use the file backend (EMAIL_FILE_PATH) or a
+# local SMTP stand-in such as aiosmtpd to test delivery.
+
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
+
+EMAIL_OUTBOX = {
+    'BATCH_SIZE': 100,
+    'MAX_ATTEMPTS': 5,
+    'BACKOFF_SECONDS': 30,  # doubles after every failed attempt
+    'MAX_BACKOFF_SECONDS': 3600,
+    'LEASE_SECONDS': 300,  # a claimed batch is retried if the worker dies
+    'RETENTION_DAYS': 7,  # sent/failed rows are then deleted by purge_outbox
+}
+
+
+# REST framework
+# Read endpoints opt into loginapi.authentication.ClaimsJWTAuthentication,
+# which builds request.user from token claims without a DB query.
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'loginapi.authentication.RevocableJWTAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+    ],
+    # orjson-backed when installed, stdlib json otherwise; same output except
+    # for float formatting (see FastJSONRenderer)
+    'DEFAULT_RENDERER_CLASSES': [
+        'loginapi.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'loginapi.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# Revoked token ids / per-user revocation times. The default (locmem) cache is
+# per process; point this at a shared cache when running several workers
+# (`manage.py check --deploy` warns about it, loginapi.W001).
+JWT_REVOCATION_CACHE = os.environ.get('JWT_REVOCATION_CACHE', 'default')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -102,6 +209,16 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Login password hashing pool. WORKERS=0 hashes inline in the request thread;
+# otherwise at most WORKERS logins hash at once, QUEUE more may wait, and the
+# rest get a 503 straight away. Timings are served at /api/hash-metrics/.
+LOGIN_HASH_POOL = {
+    'WORKERS': int(os.environ.get('LOGIN_HASH_WORKERS', 0)),
+    'QUEUE': int(os.environ.get('LOGIN_HASH_QUEUE', 16)),
+    'TIMEOUT': 10,  # seconds
+}
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -119,10 +236,48 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded files (resumes)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'loginapi.User'
 
-CORS_ALLOW_ALL_ORIGINS = True
\ No newline at end of file
+CORS_ALLOW_ALL_ORIGINS = True
+
+# Dashboard stats: serve per-user numbers from the DashboardCounter table
+# (kept current by signals; rebuild with `manage.py rebuild_stats_counters`)
+STATS_USE_COUNTERS = False
+
+# Recent-applications feed. BUFFER keeps the last SIZE rows per user in this
+# process's memory (rebuilt from the database after MAX_AGE seconds, since
+# other processes' writes aren't seen); off by default.
+RECENT_APPLICATIONS_FEED = {
+    'SIZE': 5,
+    'BUFFER': os.environ.get('RECENT_FEED_BUFFER') == '1',
+    'MAX_AGE': 60,
+}
+
+# Per-request timings (loginapi.middleware.RequestTimingMiddleware): per-route
+# histograms at /metrics for the sampled share of requests (SAMPLE_RATE, off
+# unless set), and optionally a Server-Timing header. The header reveals db,
+# hash and query-count timings, so even when SERVER_TIMING is on it is only
+# sent to staff users and to requests with "X-Metrics-Token: <token>".
+# /metrics answers 404 until METRICS_TOKEN is set, then requires
+# "Authorization: Bearer <token>".
+REQUEST_METRICS = {
+    'ENABLED': True,
+    'SAMPLE_RATE': float(os.environ.get('REQUEST_METRICS_SAMPLE_RATE', 0.0)),
+    'SERVER_TIMING': os.environ.get('REQUEST_METRICS_SERVER_TIMING') == '1',
+    'TOKEN': os.environ.get('METRICS_TOKEN', ''),
+}
+
+# gzip for clients that accept it (loginapi.middleware.CompressionMiddleware),
+# for responses of at least MIN_SIZE bytes; streamed exports are always gzipped.
+RESPONSE_COMPRESSION = {
+    'ENABLED': os.environ.get('RESPONSE_COMPRESSION', '1') == '1',
+    'MIN_SIZE': int(os.environ.get('RESPONSE_COMPRESSION_MIN_SIZE', 1024)),
+}
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class LoginapiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'loginapi'
+
+    def ready(self):
+        from . import checks, request_metrics, signals  # noqa: F401
@@ -0,0 +1,92 @@
+from functools import wraps
+
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.request import Request
+
+from . import feeds
+from .authentication import ClaimsJWTAuthentication
+from .cache import acached_dashboard
+from .models import Application, User
+from .pagination import ApplicationPagination
+from .read_serializers import read_plan
+from .renderers import json_response
+from .routers import replica_reads
+from .serializers import ApplicationSerializer
+from .stats import adashboard_stats
+from .views import requested_fields, scope_applications
+
+
+# ----------------------------
+# Async (ASGI) read endpoints
+# ----------------------------
+# Plain Django async views: DRF's APIView is sync-only, so under ASGI every
+# DRF request holds a worker thread. These use the async ORM and cache APIs
+# and only authenticate from token claims, so a request waiting on the
+# database costs a coroutine, not a thread.
+def async_read_view(handler):
+    """GET-only, JWT-claims-authenticated async view; APIExceptions become JSON errors."""
+    @wraps(handler)
+    async def view(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return json_response({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+        try:
+            result = await ClaimsJWTAuthentication().aauthenticate(request)
+            if result is None:
+                raise NotAuthenticated()
+            request.user, request.auth = result
+            with replica_reads():
+                return await handler(request, *args, **kwargs)
+        except APIException as exc:
+            response = json_response(
+                exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail},
+                status=exc.status_code,
+            )
+            if exc.status_code == 401:
+                response["WWW-Authenticate"] = 'Bearer realm="api"'
+            return response
+    return view
+
+
+@async_read_view
+@acached_dashboard("stats")
+async def stats_view(request):
+    return await adashboard_stats(request.user)
+
+
+@async_read_view
+@acached_dashboard("profile-completion")
+async def profile_completion_view(request):
+    complete = await User.objects.filter(pk=request.user.id).values_list("profile_complete", flat=True).afirst()
+    return {
+        "profile_complete": bool(complete),
+        "message": "Complete your profile editing & build your custom Resume" if not complete else ""
+    }
+
+
+@async_read_view
+@acached_dashboard("recent-applications")
+async def recent_applications_view(request):
+    return await feeds.arecent_applications(request.user)
+
+
+async def application_page(request, queryset, absolute_urls=False):
+    drf_request = Request(request)
+    plan = read_plan(ApplicationSerializer, requested_fields(drf_request, ApplicationSerializer))
+    paginator = ApplicationPagination()
+    page = await paginator.apaginate_queryset(plan.values(queryset, "id", "applied_at"), drf_request)
+    results = plan.serialize(page, request if absolute_urls else None)
+    return json_response({"next": paginator.get_next_link(), "results": results})
+
+
+# Job seeker: own applications (ApplicationView.get; relative resume URLs)
+@async_read_view
+async def my_applications_view(request):
+    return await application_page(request, Application.objects.filter(applicant_id=request.user.id))
+
+
+# Recruiter/Admin: applications in scope (AllApplicationsView; absolute resume URLs)
+@async_read_view
+async def all_applications_view(request):
+    return await application_page(
+        request, scope_applications(request.user, Application.objects.all()), absolute_urls=True
+    )
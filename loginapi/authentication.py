@@ -0,0 +1,136 @@
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.functional import cached_property
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+# User attributes copied into every token so read endpoints need no User query.
+# Changing one revokes the user's tokens, so only rarely changing ones belong here
+# (not profile_complete, which flips in the middle of onboarding).
+CLAIM_FIELDS = ("email", "role", "is_staff", "is_superuser")
+
+
+def issue_access_token(user):
+    refresh = RefreshToken.for_user(user)
+    for field in CLAIM_FIELDS:
+        refresh[field] = getattr(user, field)
+    return refresh.access_token
+
+
+# ---------------------------
+# Revocation list
+# ---------------------------
+def get_revocation_cache():
+    return caches[getattr(settings, "JWT_REVOCATION_CACHE", "default")]
+
+
+def revoke_token(token):
+    """Revoke a single token (by jti) until it would have expired anyway."""
+    remaining = int(token["exp"] - time.time())
+    if remaining > 0:
+        get_revocation_cache().set(f"jwt:revoked:{token[jwt_settings.JTI_CLAIM]}", True, timeout=remaining)
+
+
+def revoke_user_tokens(user_id):
+    """Revoke every token issued to a user up to now (password reset, role change...)."""
+    lifetime = int(jwt_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+    get_revocation_cache().set(f"jwt:revoked-before:{user_id}", int(time.time()), timeout=lifetime)
+
+
+def revocation_keys(token):
+    return (
+        f"jwt:revoked:{token.get(jwt_settings.JTI_CLAIM)}",
+        f"jwt:revoked-before:{token.get(jwt_settings.USER_ID_CLAIM)}",
+    )
+
+
+def check_revoked(token, found):
+    jti_key, user_key = revocation_keys(token)
+    if jti_key in found:
+        return True
+    # iat has one-second resolution, so a token from the revocation second is revoked too.
+    return user_key in found and token.get("iat", 0) <= found[user_key]
+
+
+def is_revoked(token):
+    return check_revoked(token, get_revocation_cache().get_many(revocation_keys(token)))
+
+
+async def ais_revoked(token):
+    return check_revoked(token, await get_revocation_cache().aget_many(revocation_keys(token)))
+
+
+# ---------------------------
+# Authentication classes
+# ---------------------------
+class RevocableJWTAuthentication(JWTAuthentication):
+    """simplejwt authentication that also honours the revocation list."""
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if is_revoked(token):
+            raise InvalidToken("Token has been revoked")
+        return token
+
+
+class ClaimsUser(TokenUser):
+    """Lightweight request.user built from token claims, without a database query."""
+
+    @cached_property
+    def id(self):
+        # simplejwt stores the user id claim as a string; User ids are integers.
+        return int(self.token[jwt_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def email(self):
+        return self.token.get("email", "")
+
+    @cached_property
+    def role(self):
+        return self.token["role"]
+
+    def __str__(self):
+        return f"{self.email} ({self.role})"
+
+
+class ClaimsJWTAuthentication(RevocableJWTAuthentication):
+    """
+    DB-free JWT authentication for read endpoints.
+
+    Tokens issued by issue_access_token() carry the user's role and flags, so
+    request.user is a ClaimsUser and no User row is loaded. Tokens without
+    those claims (issued before they were added) fall back to the DB lookup.
+    Views using it must refer to the user by ``request.user.id``.
+    """
+
+    def get_user(self, validated_token):
+        if "role" not in validated_token:
+            return super().get_user(validated_token)
+        return ClaimsUser(validated_token)
+
+    async def aauthenticate(self, request):
+        """authenticate() for async views: returns (user, token) or None, raises AuthenticationFailed."""
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        # Signature/expiry checks are CPU-only; the revocation lookup uses the async cache API.
+        token = JWTAuthentication.get_validated_token(self, raw_token)
+        if await ais_revoked(token):
+            raise InvalidToken("Token has been revoked")
+        if "role" not in token:
+            return await sync_to_async(super().get_user)(token), token
+        return ClaimsUser(token), token
+
+
+# For read-only views: token claims first, then the regular session/basic auth.
+CLAIMS_AUTHENTICATION = [ClaimsJWTAuthentication, SessionAuthentication, BasicAuthentication]
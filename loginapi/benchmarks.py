@@ -0,0 +1,260 @@
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import django
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+from django.utils import timezone
+
+from .authentication import issue_access_token
+from .models import Application, Company, Job, PasswordResetToken, User
+from .seeding import SEED_PASSWORD
+
+
+# ---------------------------
+# Endpoint benchmark plan
+# ---------------------------
+@dataclass
+class Fixtures:
+    """Seeded rows the benchmark requests refer to."""
+    admin: User
+    recruiter: User
+    seeker: User
+    job_id: int
+    application_id: int
+    company_id: int
+
+    @classmethod
+    def load(cls, prefix="seed"):
+        emails = {"email__startswith": f"{prefix}-", "email__endswith": "@example.com"}
+        admin = User.objects.filter(role="Admin", **emails).first()
+        application = (
+            Application.objects.select_related("job__recruiter", "applicant")
+            .filter(job__recruiter__email__startswith=f"{prefix}-", applicant__email__startswith=f"{prefix}-")
+            .first()
+        )
+        company = Company.objects.filter(name__startswith=f"{prefix.title()} Company").first()
+        if admin is None or application is None or company is None:
+            raise LookupError(f"No seeded data for prefix {prefix!r}; run `manage.py seed_data` first")
+        return cls(
+            admin=admin,
+            recruiter=application.job.recruiter,
+            seeker=application.applicant,
+            job_id=application.job_id,
+            application_id=application.pk,
+            company_id=company.pk,
+        )
+
+
+@dataclass
+class Route:
+    method: str = "get"
+    role: Optional[str] = "seeker"  # admin / recruiter / seeker, or None for anonymous
+    kwargs: Optional[Callable] = None  # fixtures -> URL kwargs
+    data: Optional[Callable] = None  # (fixtures, iteration) -> request body
+    query: str = ""
+    multipart: bool = False
+    fresh_token: bool = False  # for endpoints that revoke the token they are called with
+    max_requests: Optional[int] = None  # cap for deliberately slow endpoints (password hashing)
+    url_name: Optional[str] = None  # when the ROUTES key is not the URL name (a second case for one URL)
+
+    def path(self, name, fixtures):
+        """URL of the route stored under ``name`` in ROUTES."""
+        return reverse(self.url_name or name, kwargs=self.kwargs(fixtures) if self.kwargs else None) + self.query
+
+
+def company_id(fixtures):
+    return {"id": fixtures.company_id}
+
+
+def valid_reset(fixtures, iteration):
+    # Issued before the request is timed; rolled back with it
+    token = PasswordResetToken.issue_for(fixtures.seeker).token
+    return {"token": str(token), "new_password": "Bench-pass-123", "confirm_password": "Bench-pass-123"}
+
+
+def resume_upload(fixtures, iteration):
+    return {
+        "job": fixtures.job_id,
+        "name": "Bench Applicant",
+        "email": "bench@example.com",
+        "phone": "+15550000000",
+        "resume": SimpleUploadedFile("resume.pdf", b"%PDF-1.4 benchmark resume", content_type="application/pdf"),
+    }
+
+
+# Keyed by URL name in loginapi/urls.py (or by a case name with ``url_name``
+# set). Every request runs in a transaction that is rolled back, so write
+# endpoints can be measured repeatedly. Files they store land in a temporary
+# MEDIA_ROOT that run() deletes afterwards.
+ROUTES = {
+    "signup": Route("post", None, data=lambda f, i: {
+        "email": f"bench-signup-{i}@example.com", "username": f"bench-signup-{i}",
+        "password": "Bench-pass-123", "confirm_password": "Bench-pass-123", "role": "Job Seeker",
+    }, max_requests=5),
+    "login": Route("post", None, data=lambda f, i: {
+        "email": f.seeker.email, "password": SEED_PASSWORD, "role": f.seeker.role,
+    }, max_requests=5),
+    "logout": Route("post", fresh_token=True),
+    "forgot-password": Route("post", None, data=lambda f, i: {"email": f.seeker.email}),
+    "reset-password": Route("post", None, data=valid_reset, max_requests=5),
+    "reset-password-invalid": Route("post", None, url_name="reset-password", data=lambda f, i: {
+        "token": "not-a-token", "new_password": "Bench-pass-123",
+    }),
+    "apply-job": Route("post", data=resume_upload, multipart=True),
+    "applications": Route(),
+    "all-applications": Route(role="recruiter"),
+    "applications-batch-status": Route("post", "recruiter", data=lambda f, i: {
+        "ids": [f.application_id], "status": "accepted" if i % 2 else "rejected",
+    }),
+    "applications-export": Route(role="recruiter", query="?output=ndjson"),
+    "application-detail": Route(role="recruiter", kwargs=lambda f: {"pk": f.application_id}),
+    "application-detail-patch": Route("patch", "recruiter", url_name="application-detail", data=lambda f, i: {
+        "status": "accepted" if i % 2 else "rejected",
+    }, kwargs=lambda f: {"pk": f.application_id}),
+    "company-info": Route("post", None, data=lambda f, i: {"name": "Bench Co", "industry": "Software"}),
+    "founding-info": Route("patch", None, kwargs=company_id, data=lambda f, i: {"founded_year": 1990 + i % 30}),
+    "social-media": Route("patch", None, kwargs=company_id, data=lambda f, i: {"twitter": f"https://x.com/bench{i}"}),
+    "contact-info": Route("patch", None, kwargs=company_id, data=lambda f, i: {"phone": f"555-{i:04d}"}),
+    "company-complete": Route("patch", None, kwargs=company_id),
+    "company-create": Route("post", None, data=lambda f, i: {"name": "Bench Co", "industry": "Software"}),
+    "company-onboarding": Route(role=None, kwargs=company_id),
+    "stats": Route(),
+    "profile-completion": Route(),
+    "recent-applications": Route(role="recruiter"),
+    "cache-stats": Route(role="admin"),
+    "hash-metrics": Route(role="admin"),
+    "jobs-list": Route(role=None, query="?page_size=20"),
+    "jobs-detail": Route(role=None, kwargs=lambda f: {"pk": f.job_id}),
+    "jobs-facets": Route(role=None, query="?is_remote=true"),
+    "jobs-search": Route(role=None, query="?q=python"),
+    "jobs-create": Route("post", "recruiter", data=lambda f, i: {"title": f"Bench job {i}", "tags": "python, sql"}),
+    "async-stats": Route(),
+    "async-profile-completion": Route(),
+    "async-recent-applications": Route(role="recruiter"),
+    "async-applications": Route(),
+    "async-all-applications": Route(role="recruiter"),
+}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def route_names():
+    return {
+        pattern.name for pattern in get_resolver("loginapi.urls").url_patterns
+        if getattr(pattern, "name", None)
+    }
+
+
+def covered_names(routes):
+    """URL names exercised by ``routes``."""
+    return {route.url_name or name for name, route in routes.items()}
+
+
+class EndpointBenchmark:
+    """Times every planned route through the test client; see run()."""
+
+    def __init__(self, fixtures, requests=50, warmup=3, routes=None):
+        self.fixtures = fixtures
+        self.requests = requests
+        self.warmup = warmup
+        self.routes = ROUTES if routes is None else routes
+        self.client = Client()
+        self.tokens = {}
+
+    def token_for(self, route):
+        user = getattr(self.fixtures, route.role)
+        if route.fresh_token:
+            return issue_access_token(user)
+        if route.role not in self.tokens:
+            self.tokens[route.role] = issue_access_token(user)
+        return self.tokens[route.role]
+
+    def prepare(self, route, iteration):
+        """Headers and body of one request, built before it is timed (inside its rolled-back transaction)."""
+        headers = {}
+        if route.role is not None:
+            headers["Authorization"] = f"Bearer {self.token_for(route)}"
+        data = route.data(self.fixtures, iteration) if route.data else None
+        return headers, data
+
+    def call(self, route, path, headers, data):
+        send = getattr(self.client, route.method)
+        if route.method == "get":
+            return send(path, headers=headers)
+        if route.multipart:
+            return send(path, data or {}, headers=headers)
+        return send(path, data or {}, content_type="application/json", headers=headers)
+
+    def measure(self, route, path, iteration):
+        with transaction.atomic():
+            headers, data = self.prepare(route, iteration)
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = self.call(route, path, headers, data)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        return response.status_code, elapsed, len(queries.captured_queries)
+
+    def run_route(self, name, route):
+        path = route.path(name, self.fixtures)
+        count = min(self.requests, route.max_requests or self.requests)
+        timings, query_counts, statuses = [], [], {}
+        for iteration in range(self.warmup + count):
+            status_code, elapsed, queries = self.measure(route, path, iteration)
+            if iteration < self.warmup:
+                continue
+            timings.append(elapsed)
+            query_counts.append(queries)
+            statuses[str(status_code)] = statuses.get(str(status_code), 0) + 1
+        timings.sort()
+        return {
+            "method": route.method.upper(),
+            "path": path,
+            "requests": count,
+            "status_codes": statuses,
+            "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+            "mean_ms": round(sum(timings) / count * 1000, 3),
+            "queries_mean": round(sum(query_counts) / count, 2),
+            "queries_max": max(query_counts),
+        }
+
+    def run(self):
+        """Benchmark every route and return a JSON-serializable report.
+
+        Requests run one at a time, so the report gives latency only.
+        """
+        with tempfile.TemporaryDirectory(prefix="bench-media-") as media_root, override_settings(MEDIA_ROOT=media_root):
+            endpoints = {name: self.run_route(name, route) for name, route in self.routes.items()}
+        return {
+            "meta": {
+                "timestamp": timezone.now().isoformat(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "requests_per_endpoint": self.requests,
+                "warmup": self.warmup,
+                "dataset": {
+                    "users": User.objects.count(),
+                    "jobs": Job.objects.count(),
+                    "applications": Application.objects.count(),
+                    "companies": Company.objects.count(),
+                },
+            },
+            "endpoints": endpoints,
+            "unbenchmarked": sorted(route_names() - covered_names(self.routes)),
+        }
@@ -0,0 +1,169 @@
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+from .renderers import json_response
+
+GLOBAL_SCOPE = "all"
+# Version owner for data derived from all jobs (search facets)
+JOBS_SCOPE = "jobs"
+
+
+# ---------------------------
+# Dashboard response cache
+# ---------------------------
+class CacheCounters:
+    """Process-local hit/miss counters for sizing the dashboard cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+counters = CacheCounters()
+
+
+def get_config():
+    config = {"ALIAS": "default", "TTL": 30, "KEY_PREFIX": "dash"}
+    config.update(getattr(settings, "DASHBOARD_CACHE", {}))
+    return config
+
+
+def get_dashboard_cache():
+    return caches[get_config()["ALIAS"]]
+
+
+def version_key(owner):
+    return f"{get_config()['KEY_PREFIX']}:ver:{owner}"
+
+
+def new_version():
+    # Time-based so a version key that was evicted never restarts at a number
+    # that older cached entries still carry.
+    return time.time_ns()
+
+
+def get_versions(cache, owners):
+    keys = {owner: version_key(owner) for owner in owners}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for owner, key in keys.items():
+        if key not in found:
+            cache.add(key, new_version(), timeout=None)
+            found[key] = cache.get(key)
+        versions[owner] = found[key]
+    return versions
+
+
+async def aget_versions(cache, owners):
+    keys = {owner: version_key(owner) for owner in owners}
+    found = await cache.aget_many(keys.values())
+    versions = {}
+    for owner, key in keys.items():
+        if key not in found:
+            await cache.aadd(key, new_version(), timeout=None)
+            found[key] = await cache.aget(key)
+        versions[owner] = found[key]
+    return versions
+
+
+def response_owners(user):
+    # Admin dashboards read global totals, so they also depend on the global version.
+    return [user.id, GLOBAL_SCOPE] if user.role == "Admin" else [user.id]
+
+
+def build_response_key(scope, owners, versions):
+    suffix = ":".join(f"{owner}.{versions[owner]}" for owner in owners)
+    return f"{get_config()['KEY_PREFIX']}:{scope}:{suffix}"
+
+
+def response_key(cache, scope, user):
+    owners = response_owners(user)
+    return build_response_key(scope, owners, get_versions(cache, owners))
+
+
+async def aresponse_key(cache, scope, user):
+    owners = response_owners(user)
+    return build_response_key(scope, owners, await aget_versions(cache, owners))
+
+
+def invalidate(*owners):
+    """Bump the cache version of each user id (and/or GLOBAL_SCOPE), orphaning their entries."""
+    cache = get_dashboard_cache()
+    for owner in {owner for owner in owners if owner is not None}:
+        key = version_key(owner)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, new_version(), timeout=None)
+        counters.incr("invalidations")
+
+
+def cached_dashboard(scope):
+    """Cache a per-user GET handler's 200 response data for DASHBOARD_CACHE['TTL'] seconds."""
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            cache = get_dashboard_cache()
+            key = response_key(cache, scope, request.user)
+            data = cache.get(key)
+            if data is not None:
+                counters.incr("hits")
+                return Response(data, headers={"X-Cache": "HIT"})
+
+            counters.incr("misses")
+            response = handler(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, timeout=get_config()["TTL"])
+                response["X-Cache"] = "MISS"
+            return response
+        return wrapper
+    return decorator
+
+
+def acached_dashboard(scope):
+    """
+    cached_dashboard() for async function views whose handler returns the payload.
+
+    Keys are shared with the sync views, so both serve each other's entries.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(request, *args, **kwargs):
+            cache = get_dashboard_cache()
+            key = await aresponse_key(cache, scope, request.user)
+            data = await cache.aget(key)
+            if data is not None:
+                counters.incr("hits")
+                return json_response(data, headers={"X-Cache": "HIT"})
+
+            counters.incr("misses")
+            data = await handler(request, *args, **kwargs)
+            await cache.aset(key, data, timeout=get_config()["TTL"])
+            return json_response(data, headers={"X-Cache": "MISS"})
+        return wrapper
+    return decorator
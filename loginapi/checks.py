@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Cache backends whose contents are not shared between server processes
+PER_PROCESS_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+# A deployment check (`manage.py check --deploy`): a per-process cache is fine
+# for runserver and tests, and only wrong once several workers serve requests.
+@register(Tags.caches, Tags.security, deploy=True)
+def check_revocation_cache(app_configs, **kwargs):
+    alias = getattr(settings, "JWT_REVOCATION_CACHE", "default")
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend not in PER_PROCESS_CACHES:
+        return []
+    return [Warning(
+        f"JWT_REVOCATION_CACHE uses the '{alias}' cache ({backend}), which is not shared between processes.",
+        hint=(
+            "Revoked tokens stay valid on every other worker. Point JWT_REVOCATION_CACHE at a "
+            "shared cache (Redis, Memcached, database) when running more than one process."
+        ),
+        id="loginapi.W001",
+    )]
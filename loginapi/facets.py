@@ -0,0 +1,99 @@
+import hashlib
+import json
+
+from django.db.models import Count, Q
+
+from . import cache as dashboard_cache
+from .filters import filter_jobs
+
+FACET_FIELDS = ("job_type", "job_level", "is_remote", "location_country", "education")
+# Lower edges of the salary histogram buckets; the last bucket is open-ended
+SALARY_EDGES = (0, 25000, 50000, 75000, 100000, 150000, 200000)
+SALARY_FIELDS = ("min_salary", "max_salary")
+
+
+# Facet-cache hits/misses, kept apart from the dashboard response cache's
+counters = dashboard_cache.CacheCounters()
+
+
+# ---------------------------
+# Job search facets
+# ---------------------------
+def bucket_filter(field, index):
+    """Rows whose ``field`` falls in SALARY_EDGES bucket ``index`` (NULLs in none)."""
+    condition = Q(**{f"{field}__isnull": False})
+    if index > 0:
+        condition &= Q(**{f"{field}__gte": SALARY_EDGES[index]})
+    if index + 1 < len(SALARY_EDGES):
+        condition &= Q(**{f"{field}__lt": SALARY_EDGES[index + 1]})
+    return condition
+
+
+def bucket_label(index):
+    lower = SALARY_EDGES[index]
+    if index + 1 < len(SALARY_EDGES):
+        return {"from": lower, "to": SALARY_EDGES[index + 1]}
+    return {"from": lower, "to": None}
+
+
+def compute_facets(queryset):
+    """
+    Count every facet and both salary histograms.
+
+    One GROUP BY per facet column, so each result has a row per distinct
+    value of that column only, and one conditional aggregate for the total
+    and the histogram buckets: a fixed number of small queries whatever the
+    mix of values.
+    """
+    queryset = queryset.order_by()
+    aggregates = queryset.aggregate(
+        total=Count("pk"),
+        **{
+            f"{field}_{index}": Count("pk", filter=bucket_filter(field, index))
+            for field in SALARY_FIELDS
+            for index in range(len(SALARY_EDGES))
+        },
+    )
+    facets = {
+        field: {row[field]: row["count"] for row in queryset.values(field).annotate(count=Count("pk"))}
+        for field in FACET_FIELDS
+    }
+
+    return {
+        "count": aggregates["total"],
+        "facets": {
+            field: [
+                {"value": value, "count": count}
+                for value, count in sorted(values.items(), key=lambda item: (-item[1], str(item[0])))
+            ]
+            for field, values in facets.items()
+        },
+        "salary": {
+            field: [
+                {**bucket_label(index), "count": aggregates[f"{field}_{index}"]}
+                for index in range(len(SALARY_EDGES))
+            ]
+            for field in SALARY_FIELDS
+        },
+    }
+
+
+def facets_key(cache, filters):
+    version = dashboard_cache.get_versions(cache, [dashboard_cache.JOBS_SCOPE])[dashboard_cache.JOBS_SCOPE]
+    normalized = json.dumps(sorted(filters.items()), default=str)
+    digest = hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()
+    return f"{dashboard_cache.get_config()['KEY_PREFIX']}:facets:{version}:{digest}"
+
+
+def job_facets(queryset, filters):
+    """Facets for validated /jobs/ filters; returns ``(data, cache_hit)``."""
+    cache = dashboard_cache.get_dashboard_cache()
+    key = facets_key(cache, filters)
+    data = cache.get(key)
+    if data is not None:
+        counters.incr("hits")
+        return data, True
+    counters.incr("misses")
+    data = compute_facets(filter_jobs(queryset, filters))
+    cache.set(key, data, timeout=dashboard_cache.get_config()["TTL"])
+    return data, False
@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from .models import Application
+from .serializers import RecentApplicationSerializer
+
+GLOBAL_FEED = "all"
+
+
+# ---------------------------
+# Recent applications feed
+# ---------------------------
+def get_config():
+    config = {"SIZE": 5, "BUFFER": False, "MAX_AGE": 60, "MAX_USERS": 10000}
+    config.update(getattr(settings, "RECENT_APPLICATIONS_FEED", {}))
+    return config
+
+
+def feed_owner(user):
+    if user.role in ("Recruiter", "Job Seeker"):
+        return user.id
+    return GLOBAL_FEED  # admin sees all
+
+
+def recent_applications_queryset(user):
+    """Top-N query; each branch walks an (owner, -applied_at, -id) index and joins the job row."""
+    queryset = Application.objects.select_related("job").only(
+        "status", "applied_at",
+        "job__title", "job__company", "job__job_type", "job__location_city",
+        "job__location_country", "job__is_remote", "job__min_salary", "job__max_salary",
+        "job__salary_type",
+    )
+    if user.role == "Recruiter":
+        queryset = queryset.filter(job__recruiter_id=user.id)
+    elif user.role == "Job Seeker":
+        queryset = queryset.filter(applicant_id=user.id)
+    return queryset.order_by("-applied_at", "-id")[:get_config()["SIZE"]]
+
+
+def load_recent_applications(user):
+    return list(RecentApplicationSerializer(recent_applications_queryset(user), many=True).data)
+
+
+class RingBuffers:
+    """
+    Per-owner bounded deques of serialized feed rows, held in this process.
+
+    New applications are pushed onto the buffers that are already warm; any
+    other change discards the affected buffers. Other processes don't see
+    those pushes, so a buffer is also rebuilt from the database once it is
+    MAX_AGE seconds old. At most MAX_USERS buffers are kept (least recently
+    used are dropped first).
+
+    A push or discard that lands while an owner's rows are being loaded
+    marks that load stale, and its rows are then returned but not kept: the
+    query may have run before the change committed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffers = OrderedDict()  # owner -> (warmed_at, deque)
+        self._loads = {}  # owner -> in-flight loads, each {"stale": bool}
+
+    def peek(self, owner, config):
+        """The buffered rows for ``owner``, or None when it is cold or too old."""
+        with self._lock:
+            entry = self._buffers.get(owner)
+            if entry is None or time.monotonic() - entry[0] >= config["MAX_AGE"]:
+                return None
+            self._buffers.move_to_end(owner)
+            return list(entry[1])
+
+    @contextmanager
+    def loading(self, owner):
+        """Register a database load of ``owner``'s rows; pass the yielded load to fill()."""
+        load = {"stale": False}
+        with self._lock:
+            self._loads.setdefault(owner, []).append(load)
+        try:
+            yield load
+        finally:
+            with self._lock:
+                loads = self._loads[owner]
+                loads.remove(load)
+                if not loads:
+                    del self._loads[owner]
+
+    def _mark_stale(self, owners):
+        for owner in owners:
+            for load in self._loads.get(owner, ()):
+                load["stale"] = True
+
+    def fill(self, owner, rows, config, load=None):
+        with self._lock:
+            if load is not None and load["stale"]:
+                return
+            self._buffers[owner] = (time.monotonic(), deque(rows, maxlen=config["SIZE"]))
+            self._buffers.move_to_end(owner)
+            while len(self._buffers) > config["MAX_USERS"]:
+                self._buffers.popitem(last=False)
+
+    def get(self, owner, loader, config):
+        rows = self.peek(owner, config)
+        if rows is None:
+            with self.loading(owner) as load:
+                rows = loader()
+                self.fill(owner, rows, config, load)
+        return rows
+
+    def push(self, owners, row):
+        with self._lock:
+            self._mark_stale(owners)
+            for owner in owners:
+                entry = self._buffers.get(owner)
+                if entry is not None:
+                    entry[1].appendleft(row)
+
+    def discard(self, *owners):
+        with self._lock:
+            self._mark_stale(owners)
+            for owner in owners:
+                self._buffers.pop(owner, None)
+
+    def clear(self):
+        with self._lock:
+            self._mark_stale(list(self._loads))
+            self._buffers.clear()
+
+
+buffers = RingBuffers()
+
+
+def buffer_enabled():
+    return get_config()["BUFFER"]
+
+
+def recent_applications(user):
+    config = get_config()
+    if not config["BUFFER"]:
+        return load_recent_applications(user)
+    return buffers.get(feed_owner(user), lambda: load_recent_applications(user), config)
+
+
+async def arecent_applications(user):
+    """recent_applications() on the async ORM."""
+    config = get_config()
+    owner = feed_owner(user)
+    rows = buffers.peek(owner, config) if config["BUFFER"] else None
+    if rows is None:
+        with buffers.loading(owner) as load:
+            applications = [application async for application in recent_applications_queryset(user)]
+            # The job rows came with the same query, so rendering does no I/O.
+            rows = list(RecentApplicationSerializer(applications, many=True).data)
+            if config["BUFFER"]:
+                buffers.fill(owner, rows, config, load)
+    return rows
+
+
+def push_application(application, recruiter_id):
+    """Put a newly created application at the head of every warm buffer that lists it."""
+    row = RecentApplicationSerializer(application).data
+    buffers.push([application.applicant_id, recruiter_id, GLOBAL_FEED], dict(row))
@@ -0,0 +1,39 @@
+from .serializers import JobFilterSerializer
+
+
+# ---------------------------
+# Job search filters
+# ---------------------------
+EXACT_FILTERS = ["location_country", "location_city", "is_remote", "job_type", "job_level"]
+
+
+def parse_job_filters(query_params):
+    """Validate the /jobs/ query parameters; raises ValidationError (400) on bad input."""
+    serializer = JobFilterSerializer(data=query_params)
+    serializer.is_valid(raise_exception=True)
+    return {key: value for key, value in serializer.validated_data.items() if value is not None}
+
+
+def filter_jobs(queryset, filters):
+    """Apply validated filters so that every lookup can use the Job indexes."""
+    exact = {key: filters[key] for key in EXACT_FILTERS if key in filters}
+    if exact:
+        queryset = queryset.filter(**exact)
+
+    # Salary range: keep jobs whose advertised range overlaps the requested one.
+    if "min_salary" in filters:
+        queryset = queryset.filter(max_salary__gte=filters["min_salary"])
+    if "max_salary" in filters:
+        queryset = queryset.filter(min_salary__lte=filters["max_salary"])
+
+    # Indexed joins: Job.employer, and the tag_set link table through the unique Tag.name
+    if "company" in filters:
+        queryset = queryset.filter(employer_id=filters["company"])
+    if "tag" in filters:
+        queryset = queryset.filter(tag_set__name=filters["tag"])
+
+    if "expires_after" in filters:
+        queryset = queryset.filter(expiration_date__gte=filters["expires_after"])
+    if "expires_before" in filters:
+        queryset = queryset.filter(expiration_date__lte=filters["expires_before"])
+    return queryset
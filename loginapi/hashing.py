@@ -0,0 +1,148 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import get_hasher
+from django.db import close_old_connections
+
+from . import request_metrics
+
+# Upper bounds (seconds) of the hash-time histogram buckets
+BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PoolFull(Exception):
+    """Raised when every hashing worker is busy and the wait queue is full."""
+
+
+# ---------------------------
+# Hash-time metrics
+# ---------------------------
+class HashMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+            self.rejected = 0
+            self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds):
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+            for index, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    self.buckets[index] += 1
+                    break
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "count": self.count,
+                "rejected": self.rejected,
+                "total_seconds": round(self.total, 6),
+                "mean_seconds": round(self.total / self.count, 6) if self.count else 0.0,
+                "max_seconds": round(self.max, 6),
+                # Cumulative counts, Prometheus-style
+                "buckets": {
+                    str(bound): sum(self.buckets[:index + 1]) for index, bound in enumerate(BUCKETS)
+                },
+            }
+
+
+metrics = HashMetrics()
+
+
+# ---------------------------
+# Bounded hashing pool
+# ---------------------------
+class BoundedExecutor:
+    """
+    Thread pool with a fixed number of workers and a bounded wait queue.
+
+    PBKDF2 runs in C with the GIL released, so a few threads keep that many
+    cores busy; once ``workers + queue_size`` calls are in flight, new calls
+    fail fast with PoolFull instead of queueing without limit.
+    """
+
+    def __init__(self, workers, queue_size, timeout=None):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="login-hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+
+    def run(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            raise PoolFull()
+        try:
+            future = self._executor.submit(self._call, fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        return future.result(timeout=self.timeout)
+
+    def _call(self, fn, *args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # Worker threads hold their own DB connections; honour CONN_MAX_AGE.
+            close_old_connections()
+            # Freed before the result is published, so a caller that got its
+            # result can always run again right away.
+            self._slots.release()
+
+
+@lru_cache(maxsize=None)
+def get_executor():
+    config = getattr(settings, "LOGIN_HASH_POOL", None) or {}
+    workers = config.get("WORKERS", 0)
+    if not workers:
+        return None
+    return BoundedExecutor(workers, config.get("QUEUE", workers * 4), config.get("TIMEOUT"))
+
+
+def timed_authenticate(request, **credentials):
+    start = time.perf_counter()
+    try:
+        return authenticate(request, **credentials)
+    finally:
+        metrics.observe(time.perf_counter() - start)
+
+
+def authenticate_bounded(request, **credentials):
+    """authenticate() through the hashing pool when configured; raises PoolFull when saturated."""
+    executor = get_executor()
+    # Includes time spent queued for a worker; reported in Server-Timing as "hash".
+    with request_metrics.timed("hash"):
+        if executor is None:
+            return timed_authenticate(request, **credentials)
+        try:
+            return executor.run(timed_authenticate, request, **credentials)
+        except (PoolFull, TimeoutError):
+            # A call that outlives LOGIN_HASH_POOL['TIMEOUT'] counts as saturation too.
+            metrics.reject()
+            raise PoolFull()
+
+
+def hasher_info():
+    hasher = get_hasher()
+    executor = get_executor()
+    return {
+        "algorithm": hasher.algorithm,
+        "iterations": getattr(hasher, "iterations", None),
+        "pool": {"workers": executor.workers, "queue": executor.queue_size} if executor else None,
+    }
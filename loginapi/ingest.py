@@ -0,0 +1,106 @@
+from django.conf import settings
+from django.db import transaction
+
+from . import cache as dashboard_cache
+from . import feeds, stats
+from .models import Application, Job
+from .search import get_search_backend
+from .taxonomy import link_employers, sync_tags
+
+# Never overwritten by an upsert
+PRESERVED_FIELDS = {"id", "recruiter", "external_id", "created_at"}
+
+
+# ---------------------------
+# Bulk job ingestion
+# ---------------------------
+def upsert_fields(supplied=None):
+    """
+    Columns an upsert overwrites: all of them, or only those a partial row
+    ``supplied`` (plus the ones derived from it) so omitted fields are kept.
+    """
+    names = [
+        field.name for field in Job._meta.concrete_fields
+        if field.name not in PRESERVED_FIELDS
+    ]
+    if supplied is None:
+        return names
+    supplied = {*supplied, "updated_at"}
+    if "company" in supplied:
+        supplied.add("employer")
+    return [name for name in names if name in supplied]
+
+
+def batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def bulk_write_jobs(recruiter_id, rows, upsert=False, batch_size=None):
+    """
+    Write validated job payloads with one multi-row INSERT per batch.
+
+    All batches and their search-index writes share one transaction, so a
+    failure leaves nothing behind. With ``upsert``, rows whose (recruiter,
+    external_id) already exists are updated in place via INSERT ... ON
+    CONFLICT DO UPDATE, overwriting only the fields each row supplied.
+    Returns ``(jobs, updated_count)``.
+    """
+    batch_size = batch_size or getattr(settings, "BULK_JOB_BATCH_SIZE", 500)
+    jobs = [Job(recruiter_id=recruiter_id, **row) for row in rows]
+    external_ids = [job.external_id for job in jobs if job.external_id]
+
+    # Rows supplying the same fields can share an INSERT ... ON CONFLICT statement.
+    row_fields = [tuple(upsert_fields(row)) if upsert else () for row in rows]
+    groups = {}
+    for job, fields in zip(jobs, row_fields):
+        groups.setdefault(fields, []).append(job)
+
+    backend = get_search_backend()
+    with transaction.atomic():
+        existing = set()
+        if upsert and external_ids:
+            existing = set(
+                Job.objects.filter(recruiter_id=recruiter_id, external_id__in=external_ids)
+                .values_list("external_id", flat=True)
+            )
+        link_employers(jobs)
+        for fields, group in groups.items():
+            options = {}
+            if upsert:
+                options = {"update_conflicts": True, "unique_fields": ["recruiter", "external_id"], "update_fields": fields}
+            for batch in batches(group, batch_size):
+                Job.objects.bulk_create(batch, **options)
+
+        # Partially updated jobs only hold the supplied fields; reload them before indexing.
+        full = tuple(upsert_fields())
+        stale = {
+            job.pk: index for index, (job, fields) in enumerate(zip(jobs, row_fields))
+            if job.external_id in existing and fields != full
+        }
+        for job in Job.objects.filter(pk__in=list(stale)):
+            jobs[stale[job.pk]] = job
+
+        # bulk_create() sends no signals, so keep the index and tags in step here.
+        for batch in batches(jobs, batch_size):
+            backend.index_jobs(batch)
+            sync_tags(batch, replace=upsert)
+
+        # Updated jobs may appear in their applicants' recent-application feeds
+        updated = [job.pk for job in jobs if job.external_id in existing]
+        applicants = set(
+            Application.objects.filter(job_id__in=updated).values_list("applicant_id", flat=True)
+        ) if updated else set()
+
+    if stats.counters_enabled() and jobs:
+        stats.refresh_counters(recruiter_id)
+
+    def invalidate():
+        dashboard_cache.invalidate(
+            recruiter_id, *applicants, dashboard_cache.GLOBAL_SCOPE, dashboard_cache.JOBS_SCOPE
+        )
+        if updated:
+            feeds.buffers.discard(recruiter_id, *applicants, feeds.GLOBAL_FEED)
+
+    transaction.on_commit(invalidate)
+    return jobs, len(existing)
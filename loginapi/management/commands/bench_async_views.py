@@ -0,0 +1,97 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client, override_settings
+
+from loginapi.authentication import issue_access_token
+from loginapi.models import User
+
+# (sync path, async path) pairs, relative to /api/
+ENDPOINTS = [
+    ("stats/", "async/stats/"),
+    ("profile-completion/", "async/profile-completion/"),
+    ("recent-applications/", "async/recent-applications/"),
+    ("applications/", "async/applications/"),
+    ("applications/all/", "async/applications/all/"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare throughput of the sync DRF read endpoints and their async twins "
+        "in-process, at a fixed number of concurrent requests."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", required=True, help="User to authenticate as.")
+        parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint and mode.")
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"No user with email {options['email']!r}")
+        headers = {"Authorization": f"Bearer {issue_access_token(user)}"}
+        results = []
+        # The test clients send Host: testserver.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for sync_path, async_path in ENDPOINTS:
+                results.append(self.bench_pair(sync_path, async_path, headers, options))
+
+
+        if options["json"]:
+            self.stdout.write(json.dumps({
+                "requests": options["requests"],
+                "concurrency": options["concurrency"],
+                "results": results,
+            }, indent=2))
+            return
+        self.stdout.write(f"{'endpoint':<24}{'sync req/s':>12}{'async req/s':>13}{'speedup':>9}")
+        for row in results:
+            self.stdout.write(
+                f"{row['endpoint']:<24}{row['sync_rps']:>12}{row['async_rps']:>13}{row['speedup']:>9}"
+            )
+
+    def bench_pair(self, sync_path, async_path, headers, options):
+        sync_rps = self.bench_sync(f"/api/{sync_path}", headers, options)
+        async_rps = asyncio.run(self.bench_async(f"/api/{async_path}", headers, options))
+        return {
+            "endpoint": sync_path,
+            "sync_rps": round(sync_rps, 1),
+            "async_rps": round(async_rps, 1),
+            "speedup": round(async_rps / sync_rps, 2) if sync_rps else None,
+        }
+
+    @staticmethod
+    def ensure_ok(response, path):
+        if response.status_code != 200:
+            raise CommandError(f"GET {path} returned {response.status_code}")
+
+    def bench_sync(self, path, headers, options):
+        # One thread per concurrent request, as a threaded WSGI/ASGI worker would do.
+        def hit(_):
+            response = Client().get(path, headers=headers)
+            self.ensure_ok(response, path)
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            start = time.perf_counter()
+            list(pool.map(hit, range(options["requests"])))
+            return options["requests"] / (time.perf_counter() - start)
+
+    async def bench_async(self, path, headers, options):
+        slots = asyncio.Semaphore(options["concurrency"])
+        client = AsyncClient()
+
+        async def hit():
+            async with slots:
+                response = await client.get(path, headers=headers)
+            self.ensure_ok(response, path)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(hit() for _ in range(options["requests"])))
+        return options["requests"] / (time.perf_counter() - start)
@@ -0,0 +1,50 @@
+import json
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from loginapi.benchmarks import ROUTES, EndpointBenchmark, Fixtures
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every loginapi route against seeded data (see seed_data) and "
+        "report p50/p95/p99 latency and query counts as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--prefix", default="seed", help="Prefix the data was seeded with.")
+        parser.add_argument("--requests", type=int, default=50, help="Measured requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--only", nargs="+", metavar="URL_NAME", help="Benchmark only these routes.")
+        parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+
+    def handle(self, *args, **options):
+        try:
+            fixtures = Fixtures.load(options["prefix"])
+        except LookupError as exc:
+            raise CommandError(str(exc))
+        routes = ROUTES
+        if options["only"]:
+            unknown = set(options["only"]) - set(ROUTES)
+            if unknown:
+                raise CommandError(f"Unknown route(s): {', '.join(sorted(unknown))}")
+            routes = {name: ROUTES[name] for name in options["only"]}
+
+        # Expected 4xx responses (e.g. reset-password with a bogus token) would log on every request.
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        # The test client sends Host: testserver; DEBUG keeps connection.queries for counting.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], DEBUG=True):
+            report = EndpointBenchmark(
+                fixtures, requests=options["requests"], warmup=options["warmup"], routes=routes
+            ).run()
+
+        payload = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as handle:
+                handle.write(payload + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Wrote {len(report['endpoints'])} endpoints to {options['output']}"))
+        else:
+            self.stdout.write(payload)
@@ -0,0 +1,89 @@
+import io
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.text import compress_string
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from loginapi.models import Application, Job
+from loginapi.parsers import FastJSONParser
+from loginapi.read_serializers import read_plan
+from loginapi.renderers import FastJSONRenderer, orjson
+from loginapi.serializers import ApplicationSerializer, JobCreateSerializer
+
+# (name, serializer, queryset in list order)
+PAYLOADS = [
+    ("applications", ApplicationSerializer, lambda: Application.objects.order_by("-applied_at", "-id")),
+    ("jobs", JobCreateSerializer, lambda: Job.objects.order_by("-created_at", "-id")),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSONRenderer/JSONParser with the orjson-backed ones on "
+        "list payloads, and report payload size with and without gzip."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Rows per payload.")
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement; the median is reported.")
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stderr.write("orjson is not installed; FastJSONRenderer uses the stdlib json module.")
+        results = []
+        for name, serializer_class, get_queryset in PAYLOADS:
+            plan = read_plan(serializer_class)
+            rows = plan.serialize(plan.values(get_queryset()[:options["rows"]]))
+            if not rows:
+                raise CommandError(f"No {name} to render; run `manage.py seed_data` first")
+            results.append(self.bench_payload(name, {"next": None, "results": rows}, options["repeat"]))
+
+        if options["json"]:
+            self.stdout.write(json.dumps({
+                "repeat": options["repeat"],
+                "orjson": orjson is not None,
+                "results": results,
+            }, indent=2))
+            return
+        self.stdout.write(
+            f"{'payload':<14}{'rows':>6}{'bytes':>10}{'gzip':>9}{'ratio':>7}{'gzip ms':>9}"
+            f"{'render ms':>11}{'fast':>8}{'parse ms':>10}{'fast':>8}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['payload']:<14}{row['rows']:>6}{row['bytes']:>10}{row['gzip_bytes']:>9}"
+                f"{row['gzip_ratio']:>7}{row['gzip_ms']:>9}{row['render_ms']:>11}{row['fast_render_ms']:>8}"
+                f"{row['parse_ms']:>10}{row['fast_parse_ms']:>8}"
+            )
+
+    def bench_payload(self, name, data, repeat):
+        body = JSONRenderer().render(data)
+        if FastJSONRenderer().render(data) != body:
+            raise CommandError(f"{name}: FastJSONRenderer output differs from JSONRenderer")
+        compressed = compress_string(body)
+        return {
+            "payload": name,
+            "rows": len(data["results"]),
+            "bytes": len(body),
+            "gzip_bytes": len(compressed),
+            "gzip_ratio": round(len(body) / len(compressed), 2),
+            "gzip_ms": self.median_ms(lambda: compress_string(body), repeat),
+            "render_ms": self.median_ms(lambda: JSONRenderer().render(data), repeat),
+            "fast_render_ms": self.median_ms(lambda: FastJSONRenderer().render(data), repeat),
+            "parse_ms": self.median_ms(lambda: JSONParser().parse(io.BytesIO(body)), repeat),
+            "fast_parse_ms": self.median_ms(lambda: FastJSONParser().parse(io.BytesIO(body)), repeat),
+        }
+
+    @staticmethod
+    def median_ms(fn, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return round(statistics.median(timings) * 1000, 3)
@@ -0,0 +1,86 @@
+import json
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from loginapi.models import Application, Job
+from loginapi.read_serializers import read_plan
+from loginapi.serializers import ApplicationSerializer, JobCreateSerializer
+
+# (name, serializer, queryset in list order)
+TARGETS = [
+    ("applications", ApplicationSerializer, lambda: Application.objects.order_by("-applied_at", "-id")),
+    ("jobs", JobCreateSerializer, lambda: Job.objects.order_by("-created_at", "-id")),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare ModelSerializer and the values()-based read plan on the list "
+        "serializers: fetch + serialize time per 1000 rows, same output checked."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Rows per run.")
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per mode; the median is reported.")
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        # APIRequestFactory sends Host: testserver.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results = self.run(options["rows"], options["repeat"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"repeat": options["repeat"], "results": results}, indent=2))
+            return
+        self.stdout.write(f"{'serializer':<24}{'rows':>7}{'DRF ms/1k':>12}{'fast ms/1k':>12}{'speedup':>9}")
+        for row in results:
+            self.stdout.write(
+                f"{row['serializer']:<24}{row['rows']:>7}{row['drf_ms_per_1k']:>12}"
+                f"{row['fast_ms_per_1k']:>12}{row['speedup']:>9}"
+            )
+
+    def run(self, rows, repeat):
+        # Absolute resume URLs, as AllApplicationsView returns them
+        request = Request(APIRequestFactory().get("/api/applications/all/"))
+        results = []
+        for name, serializer_class, get_queryset in TARGETS:
+            queryset = get_queryset()[:rows]
+            count = queryset.count()
+            if not count:
+                raise CommandError(f"No {name} to serialize; run `manage.py seed_data` first")
+            plan = read_plan(serializer_class)
+
+            def drf():
+                return serializer_class(list(queryset), many=True, context={"request": request}).data
+
+            def fast():
+                return plan.serialize(list(plan.values(queryset)), request)
+
+            if JSONRenderer().render(drf()) != JSONRenderer().render(fast()):
+                raise CommandError(f"{name}: read plan output differs from {serializer_class.__name__}")
+            drf_ms = self.per_thousand(drf, count, repeat)
+            fast_ms = self.per_thousand(fast, count, repeat)
+            results.append({
+                "serializer": serializer_class.__name__,
+                "rows": count,
+                "drf_ms_per_1k": drf_ms,
+                "fast_ms_per_1k": fast_ms,
+                "speedup": round(drf_ms / fast_ms, 2),
+            })
+        return results
+
+    @staticmethod
+    def per_thousand(fn, count, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return round(statistics.median(timings) * 1000 * 1000 / count, 3)
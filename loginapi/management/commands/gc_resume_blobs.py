@@ -0,0 +1,81 @@
+import os
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from loginapi.models import Application, ResumeBlob
+from loginapi.storage import DIGEST_NAME, resume_storage
+
+
+class Command(BaseCommand):
+    help = "Delete resume blobs that no application references any more."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--grace-hours", type=float, default=24,
+                            help="Keep unreferenced blobs used within this many hours (uploads still in flight).")
+        parser.add_argument("--recount", action="store_true",
+                            help="Recompute ref_count from the Application table first.")
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["grace_hours"])
+        dry_run = options["dry_run"]
+
+        if options["recount"] and not dry_run:
+            refs = (
+                Application.objects.filter(resume=OuterRef("name"))
+                .values("resume").annotate(total=Count("id")).values("total")
+            )
+            ResumeBlob.objects.update(ref_count=Coalesce(Subquery(refs), 0))
+
+        # ref_count picks the candidates; the EXISTS check guards against drift.
+        orphans = ResumeBlob.objects.filter(ref_count__lte=0, last_used_at__lt=cutoff).exclude(
+            Exists(Application.objects.filter(resume=OuterRef("name")))
+        )
+        removed = freed = 0
+        for blob in orphans.iterator():
+            if not dry_run and not self.delete_blob(orphans, blob):
+                continue
+            removed += 1
+            freed += blob.size
+
+        stray = self.remove_stray_files(cutoff.timestamp(), dry_run)
+        verb = "Would remove" if dry_run else "Removed"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {removed} blobs ({freed} bytes) and {stray} stray files"
+        ))
+
+    @staticmethod
+    def delete_blob(orphans, blob):
+        """Delete the row only if it is still an orphan, and its file once that has committed."""
+        with transaction.atomic():
+            # An application may have referenced the blob since it was listed.
+            deleted, _ = orphans.filter(pk=blob.pk).delete()
+            if deleted:
+                transaction.on_commit(lambda: resume_storage.delete(blob.name))
+        return bool(deleted)
+
+    def remove_stray_files(self, cutoff, dry_run):
+        """Delete old content-addressed files with no ResumeBlob row and leftover temp files."""
+        root = resume_storage.path("resumes")
+        if not os.path.isdir(root):
+            return 0
+        known = set(ResumeBlob.objects.values_list("name", flat=True))
+        removed = 0
+        for directory, _, filenames in os.walk(root):
+            incoming = os.path.basename(directory) == resume_storage.incoming_dir
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, resume_storage.location).replace(os.sep, "/")
+                if not incoming and (not DIGEST_NAME.match(filename) or name in known):
+                    continue
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                if not dry_run:
+                    os.unlink(path)
+                removed += 1
+        return removed
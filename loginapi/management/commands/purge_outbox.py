@@ -0,0 +1,14 @@
+from loginapi.outbox import expired_messages
+
+from .purge_reset_tokens import Command as PurgeCommand
+
+
+class Command(PurgeCommand):
+    help = (
+        "Delete sent and failed outbox emails older than EMAIL_OUTBOX['RETENTION_DAYS'] "
+        "(they may contain reset links), in bounded batches."
+    )
+
+    def handle(self, *args, **options):
+        emails = self.purge(expired_messages(), options)
+        self.stdout.write(self.style.SUCCESS(f"Purged {emails} old outbox emails"))
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from loginapi.models import PasswordResetToken
+
+
+class Command(BaseCommand):
+    help = "Delete expired password reset tokens in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--sleep", type=float, default=0.0,
+                            help="Seconds to pause between batches to let other writers in.")
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        tokens = self.purge(PasswordResetToken.objects.filter(expires_at__lte=now), options)
+        self.stdout.write(self.style.SUCCESS(f"Purged {tokens} expired reset tokens"))
+
+    @staticmethod
+    def purge(expired, options):
+        total = 0
+        while True:
+            # Each batch is its own short transaction, so the write lock is
+            # held for one bounded DELETE at a time.
+            ids = list(expired.values_list("id", flat=True)[:options["batch_size"]])
+            if not ids:
+                break
+            with transaction.atomic():
+                deleted, _ = expired.model.objects.filter(id__in=ids).delete()
+            total += deleted
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+        return total
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from loginapi.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the job full-text search index from the Job table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        total = backend.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {total} jobs with {type(backend).__name__}"
+        ))
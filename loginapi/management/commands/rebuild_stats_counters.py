@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from loginapi.models import User
+from loginapi.stats import refresh_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the materialized dashboard counters from the Job and Application tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids",
+                            help="Only rebuild these user ids (repeatable).")
+
+    def handle(self, *args, **options):
+        user_ids = options["user_ids"] or User.objects.values_list("id", flat=True).iterator()
+        total = 0
+        for user_id in user_ids:
+            refresh_counters(user_id)
+            total += 1
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt counters for {total} users"))
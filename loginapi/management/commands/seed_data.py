@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from loginapi.models import User
+from loginapi.seeding import SEED_PASSWORD, seed
+
+
+class Command(BaseCommand):
+    help = "Seed users, companies, jobs and applications for load tests and benchmarks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--companies", type=int, default=20)
+        parser.add_argument("--jobs", type=int, default=500)
+        parser.add_argument("--applications", type=int, default=2000)
+        parser.add_argument("--prefix", default="seed", help="Prefix for seeded emails and names.")
+        parser.add_argument("--random-seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if User.objects.filter(email__startswith=f"{prefix}-", email__endswith="@example.com").exists():
+            raise CommandError(f"Users with prefix {prefix!r} already exist; pass another --prefix")
+        counts = seed(
+            users=options["users"],
+            companies=options["companies"],
+            jobs=options["jobs"],
+            applications=options["applications"],
+            prefix=prefix,
+            random_seed=options["random_seed"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            "Seeded " + ", ".join(f"{count} {name}" for name, count in counts.items())
+            + f" (password: {SEED_PASSWORD!r}, admin: {prefix}-0@example.com)"
+        ))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loginapi', '0005_job_fts_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('jobs_posted', models.IntegerField(default=0)),
+                ('applications_received', models.IntegerField(default=0)),
+                ('pending_received', models.IntegerField(default=0)),
+                ('applications_sent', models.IntegerField(default=0)),
+                ('accepted', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('pending', models.IntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:18
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def keep_latest_token_per_user(apps, schema_editor):
+    PasswordResetToken = apps.get_model('loginapi', 'PasswordResetToken')
+    latest = (
+        PasswordResetToken.objects.values('user')
+        .annotate(latest_id=Max('id'))
+        .values_list('latest_id', flat=True)
+    )
+    PasswordResetToken.objects.exclude(id__in=list(latest)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loginapi', '0009_outboundemail'),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_latest_token_per_user, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='passwordresettoken',
+            index=models.Index(fields=['expires_at'], name='reset_token_expiry_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='passwordresettoken',
+            constraint=models.UniqueConstraint(fields=('user',), name='reset_token_one_per_user'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loginapi', '0011_job_external_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,75 @@
+from django.db import migrations, transaction
+
+BATCH_SIZE = 500
+
+
+def parse_tags(text, max_length=50):
+    # Frozen copy of taxonomy.parse_tags()
+    names = []
+    for part in (text or "").split(","):
+        name = " ".join(part.split()).lower()[:max_length]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def backfill_job_relations(apps, schema_editor):
+    """
+    Link existing jobs to Company rows and Tag rows.
+
+    Walks the job table by primary key in batches, each in its own short
+    transaction, so writers are never blocked for the whole backfill.
+    """
+    Company = apps.get_model('loginapi', 'Company')
+    Job = apps.get_model('loginapi', 'Job')
+    Tag = apps.get_model('loginapi', 'Tag')
+    Link = Job.tag_set.through
+
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                Job.objects.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'company', 'tags', 'employer_id')[:BATCH_SIZE]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+
+            names = {company for _, company, _, employer_id in batch if company and employer_id is None}
+            employers = dict(
+                Company.objects.filter(name__in=names).order_by('-id').values_list('name', 'id')
+            )
+            jobs_by_employer = {}
+            for job_id, company, _, employer_id in batch:
+                if employer_id is None and company in employers:
+                    jobs_by_employer.setdefault(employers[company], []).append(job_id)
+            for employer_id, job_ids in jobs_by_employer.items():
+                Job.objects.filter(id__in=job_ids).update(employer_id=employer_id)
+
+            tags_by_job = {job_id: parse_tags(tags) for job_id, _, tags, _ in batch}
+            tag_names = set().union(*tags_by_job.values())
+            Tag.objects.bulk_create([Tag(name=name) for name in tag_names], ignore_conflicts=True)
+            tag_ids = dict(Tag.objects.filter(name__in=tag_names).values_list('name', 'id'))
+            Link.objects.bulk_create(
+                [
+                    Link(job_id=job_id, tag_id=tag_ids[name])
+                    for job_id, names in tags_by_job.items()
+                    for name in names
+                ],
+                ignore_conflicts=True,
+            )
+
+
+class Migration(migrations.Migration):
+    # Batches commit individually; see backfill_job_relations().
+    atomic = False
+
+    dependencies = [
+        ('loginapi', '0014_job_employer_and_tags'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_job_relations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:12
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_created_at(apps, schema_editor):
+    ResumeBlob = apps.get_model('loginapi', 'ResumeBlob')
+    ResumeBlob.objects.update(last_used_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loginapi', '0016_application_job_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeblob',
+            name='last_used_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop),
+    ]
@@ -5,6 +5,8 @@ import uuid
 from django.utils import timezone
 from datetime import timedelta
 
+from .storage import get_resume_storage
+
 
 def one_hour_from_now():
     return timezone.now() + timedelta(hours=1)
@@ -14,6 +16,26 @@ class PasswordResetToken(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField(default=one_hour_from_now)
 
+    class Meta:
+        indexes = [
+            # Used by `manage.py purge_reset_tokens`
+            models.Index(fields=["expires_at"], name="reset_token_expiry_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["user"], name="reset_token_one_per_user"),
+        ]
+
+    @classmethod
+    def issue_for(cls, user):
+        """Create or replace the user's single live token with one upsert."""
+        token = cls(user=user, token=uuid.uuid4(), expires_at=one_hour_from_now())
+        cls.objects.bulk_create(
+            [token],
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["token", "created_at", "expires_at"],
+        )
+        return token
 
     def __str__(self):
         return f"{self.user.email} - {self.token}"
@@ -56,6 +78,23 @@ class Company(models.Model):
     phone = models.CharField(max_length=20, blank=True, null=True)
     address = models.TextField(blank=True, null=True)
     status = models.CharField(max_length=20, default="incomplete")  # incomplete or completed
+    version = models.PositiveIntegerField(default=1)  # bumped on every write; exposed as the ETag
+
+    class Meta:
+        indexes = [
+            # Resolves Job.company names to Company rows
+            models.Index(fields=["name"], name="company_name_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+# ---------------------------
+# Job Tag Model
+# ---------------------------
+class Tag(models.Model):
+    name = models.CharField(max_length=50, unique=True)  # normalized, see taxonomy.parse_tags()
 
     def __str__(self):
         return self.name
@@ -67,8 +106,12 @@ class Company(models.Model):
 class Job(models.Model):
     title = models.CharField(max_length=255)
     company = models.CharField(max_length=255, blank=True)
+    # Company row matching ``company``; set from the name when not given
+    employer = models.ForeignKey(Company, on_delete=models.SET_NULL, null=True, blank=True, related_name="jobs")
     recruiter = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="jobs")
     tags = models.CharField(max_length=255, blank=True)
+    # ``tags`` split into rows, kept in sync by taxonomy.sync_job_relations()
+    tag_set = models.ManyToManyField(Tag, blank=True, related_name="jobs")
     role = models.CharField(max_length=100, blank=True)
 
     min_salary = models.IntegerField(null=True, blank=True)
@@ -90,12 +133,30 @@ class Job(models.Model):
     benefits = models.JSONField(default=list, blank=True)
     description = models.TextField(blank=True)
     apply_method = models.CharField(max_length=50, blank=True)
+    # Id of the posting in the recruiter's ATS; the upsert key for bulk syncs
+    external_id = models.CharField(max_length=100, null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination order for /jobs/
+            models.Index(fields=["-created_at", "-id"], name="job_created_id_idx"),
+            # Search filters, each ending in the pagination order
+            models.Index(fields=["location_country", "location_city", "-created_at", "-id"], name="job_location_idx"),
+            models.Index(fields=["is_remote", "-created_at", "-id"], name="job_remote_idx"),
+            models.Index(fields=["job_type", "job_level", "-created_at", "-id"], name="job_type_level_idx"),
+            models.Index(fields=["employer", "-created_at", "-id"], name="job_employer_idx"),
+            models.Index(fields=["min_salary", "max_salary"], name="job_salary_idx"),
+            models.Index(fields=["expiration_date"], name="job_expiration_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["recruiter", "external_id"], name="job_recruiter_external_id_uniq"),
+        ]
+
     def __str__(self):
-        return f"{self.title} at {self.recruiter.username}"
+        return f"{self.title} at {self.company}"
 
 
 # ---------------------------
@@ -107,7 +168,7 @@ class Application(models.Model):
     name = models.CharField(max_length=200)
     email = models.EmailField()
     phone = models.CharField(max_length=20)
-    resume = models.FileField(upload_to="resumes/")
+    resume = models.FileField(upload_to="resumes/", storage=get_resume_storage)
     cover_letter = models.TextField(blank=True)
     status = models.CharField(
         max_length=50,
@@ -115,6 +176,85 @@ class Application(models.Model):
         default='pending'
     )
     applied_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination order for application lists
+            models.Index(fields=["-applied_at", "-id"], name="application_applied_idx"),
+            models.Index(fields=["applicant", "-applied_at", "-id"], name="application_applicant_idx"),
+            # Recruiter-side recent feed: per job, newest first
+            models.Index(fields=["job", "-applied_at", "-id"], name="application_job_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} - job #{self.job_id}"
+
+
+# ---------------------------
+# Dashboard counters (materialized per-user stats)
+# ---------------------------
+class DashboardCounter(models.Model):
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="dashboard_counter"
+    )
+    # Recruiter side
+    jobs_posted = models.IntegerField(default=0)
+    applications_received = models.IntegerField(default=0)
+    pending_received = models.IntegerField(default=0)
+    # Job seeker side
+    applications_sent = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    pending = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Counters for user {self.user_id}"
+
+
+# ---------------------------
+# Deduplicated resume files
+# ---------------------------
+class ResumeBlob(models.Model):
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    name = models.CharField(max_length=255, unique=True)  # path inside the resume storage
+    size = models.BigIntegerField()
+    ref_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped whenever an upload reuses the blob; gc_resume_blobs' grace period counts from here
+    last_used_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
+
+# ---------------------------
+# Email outbox (sent by `manage.py send_queued_mail`)
+# ---------------------------
+class OutboundEmail(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    # When the message is next due; for "sending" rows this is the end of the worker's lease.
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claim_token = models.UUIDField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
 
     def __str__(self):
-        return f"{self.name} - {self.job.title}"
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
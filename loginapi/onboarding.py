@@ -0,0 +1,53 @@
+import re
+
+from django.db.models import F
+
+from .models import Company
+from .taxonomy import link_company_jobs
+
+
+class VersionConflict(Exception):
+    """The company changed since the client (or this request) last read it."""
+
+
+# ---------------------------
+# Company onboarding writes
+# ---------------------------
+def company_etag(company):
+    return f'"company-{company.pk}-v{company.version}"'
+
+
+def parse_if_match(header):
+    """Return the version named by an If-Match header, or None when absent or '*'."""
+    if not header or header.strip() == "*":
+        return None
+    match = re.search(r"-v(\d+)\"?\s*$", header)
+    if match is None:
+        raise VersionConflict()
+    return int(match.group(1))
+
+
+def save_company_changes(company, data, expected_version=None):
+    """
+    Write only the columns in ``data`` whose values differ from ``company``.
+
+    The UPDATE is conditional on the version that was read, so a concurrent
+    writer makes it match no row and VersionConflict is raised instead of
+    silently overwriting. Returns the list of changed field names.
+    """
+    if expected_version is not None and expected_version != company.version:
+        raise VersionConflict()
+    changed = {field: value for field, value in data.items() if getattr(company, field) != value}
+    if not changed:
+        return []
+    updated = Company.objects.filter(pk=company.pk, version=company.version).update(
+        **changed, version=F("version") + 1
+    )
+    if not updated:
+        raise VersionConflict()
+    for field, value in changed.items():
+        setattr(company, field, value)
+    company.version += 1
+    if "name" in changed:
+        link_company_jobs(company)
+    return list(changed)
@@ -0,0 +1,135 @@
+import uuid
+from contextlib import suppress
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+
+# ---------------------------
+# Email outbox
+# ---------------------------
+def get_config():
+    config = {
+        "BATCH_SIZE": 100,
+        "MAX_ATTEMPTS": 5,
+        "BACKOFF_SECONDS": 30,
+        "MAX_BACKOFF_SECONDS": 3600,
+        "LEASE_SECONDS": 300,
+        "RETENTION_DAYS": 7,
+    }
+    config.update(getattr(settings, "EMAIL_OUTBOX", {}))
+    return config
+
+
+def enqueue_mail(subject, message, from_email, recipient_list):
+    """Queue an email for the outbox worker instead of sending it in the request."""
+    return OutboundEmail.objects.create(
+        subject=subject, body=message, from_email=from_email, to=list(recipient_list)
+    )
+
+
+def expired_messages(config=None):
+    """Sent or given-up messages past RETENTION_DAYS; deleted by `manage.py purge_outbox`."""
+    config = config or get_config()
+    cutoff = timezone.now() - timedelta(days=config["RETENTION_DAYS"])
+    return OutboundEmail.objects.filter(status__in=["sent", "failed"], created_at__lte=cutoff)
+
+
+def backoff_delay(attempts, config):
+    seconds = config["BACKOFF_SECONDS"] * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, config["MAX_BACKOFF_SECONDS"]))
+
+
+def claim_batch(batch_size, config):
+    """
+    Lease up to ``batch_size`` due messages to this worker.
+
+    Claiming is a conditional UPDATE tagged with a fresh token, so concurrent
+    workers never get the same row. A worker that dies leaves its rows in
+    "sending" until the lease runs out, after which they are due again.
+    """
+    now = timezone.now()
+    due = Q(status__in=["pending", "sending"], next_attempt_at__lte=now)
+    ids = list(OutboundEmail.objects.filter(due).order_by("next_attempt_at").values_list("id", flat=True)[:batch_size])
+    if not ids:
+        return []
+    token = uuid.uuid4()
+    OutboundEmail.objects.filter(due, id__in=ids).update(
+        status="sending",
+        claim_token=token,
+        next_attempt_at=now + timedelta(seconds=config["LEASE_SECONDS"]),
+    )
+    return list(OutboundEmail.objects.filter(claim_token=token, status="sending"))
+
+
+def build_message(message, connection):
+    return EmailMessage(
+        subject=message.subject,
+        body=message.body,
+        from_email=message.from_email,
+        to=message.to,
+        connection=connection,
+    )
+
+
+def record_failure(message, exc):
+    message.attempts += 1
+    message.last_error = f"{type(exc).__name__}: {exc}"
+
+
+def send_batch(batch_size=None, connection=None):
+    """Send one batch of due messages over a single backend connection; returns (sent, failed)."""
+    config = get_config()
+    messages = claim_batch(batch_size or config["BATCH_SIZE"], config)
+    if not messages:
+        return 0, 0
+
+    connection = connection or get_connection()
+    sent, failed = [], []
+    try:
+        for index, message in enumerate(messages):
+            try:
+                connection.open()
+            except Exception as exc:
+                # Backend unreachable: count an attempt for the rest of the batch and stop.
+                for pending in messages[index:]:
+                    record_failure(pending, exc)
+                failed.extend(messages[index:])
+                break
+            try:
+                build_message(message, connection).send(fail_silently=False)
+            except Exception as exc:
+                record_failure(message, exc)
+                failed.append(message)
+                # The connection may be unusable after an error; reopen for the next one.
+                with suppress(Exception):
+                    connection.close()
+            else:
+                message.attempts += 1
+                sent.append(message)
+    finally:
+        with suppress(Exception):
+            connection.close()
+
+    now = timezone.now()
+    for message in sent:
+        message.status = "sent"
+        message.sent_at = now
+        message.last_error = ""
+        # Bodies can carry password reset links; don't keep them once delivered.
+        message.body = ""
+    for message in failed:
+        if message.attempts >= config["MAX_ATTEMPTS"]:
+            message.status = "failed"
+        else:
+            message.status = "pending"
+            message.next_attempt_at = now + backoff_delay(message.attempts, config)
+    OutboundEmail.objects.bulk_update(
+        sent + failed, ["status", "attempts", "sent_at", "last_error", "next_attempt_at", "body"]
+    )
+    return len(sent), len(failed)
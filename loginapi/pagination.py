@@ -0,0 +1,111 @@
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+# ---------------------------
+# Keyset (seek) pagination
+# ---------------------------
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over a (timestamp, id) pair, newest first.
+
+    Each page is fetched with ``WHERE (ts, id) < (last_ts, last_id)`` instead of
+    ``OFFSET``, so deep pages cost the same as the first one as long as an index
+    on ``(ts DESC, id DESC)`` exists.
+    """
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    timestamp_field = "created_at"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, item):
+        if isinstance(item, dict):
+            timestamp, pk = item[self.timestamp_field], item["id"]
+        else:
+            timestamp, pk = getattr(item, self.timestamp_field), item.pk
+        raw = json.dumps([timestamp.isoformat(), pk]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            timestamp, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            timestamp = parse_datetime(timestamp)
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if timestamp is None:
+            raise NotFound(self.invalid_cursor_message)
+        return timestamp, pk
+
+    def page_queryset(self, queryset, request):
+        self.request = request
+        self.current_page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        queryset = queryset.order_by(f"-{self.timestamp_field}", "-id")
+        if cursor is not None:
+            timestamp, pk = cursor
+            queryset = queryset.filter(
+                Q(**{f"{self.timestamp_field}__lt": timestamp})
+                | Q(**{self.timestamp_field: timestamp, "id__lt": pk})
+            )
+        # Fetch one extra row to learn whether a next page exists.
+        return queryset[:self.current_page_size + 1]
+
+    def finish_page(self, rows):
+        self.has_next = len(rows) > self.current_page_size
+        rows = rows[:self.current_page_size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if self.has_next else None
+        return rows
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.finish_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request):
+        return self.finish_page([row async for row in self.page_queryset(queryset, request)])
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class ApplicationPagination(KeysetPagination):
+    timestamp_field = "applied_at"
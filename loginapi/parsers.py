@@ -0,0 +1,40 @@
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, orjson
+
+# orjson reads integers beyond 64 bits as floats; the json module keeps them
+# exact, so bodies with a run of 19+ digits are left to it. Mapping every
+# digit to 0 turns that check into a substring search.
+ALL_ZEROS = bytes.maketrans(b"123456789", b"000000000")
+LONG_DIGITS = b"0" * 19
+
+
+# ---------------------------
+# JSON parsing
+# ---------------------------
+class FastJSONParser(JSONParser):
+    """
+    JSONParser backed by orjson when it is installed; stdlib json otherwise.
+
+    Bodies with 19+ digit runs and anything orjson refuses (lone surrogates,
+    a BOM, numbers out of float range) are re-parsed by the stdlib parser, so
+    results and errors match JSONParser.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        # orjson always rejects NaN/Infinity, which is what STRICT_JSON asks for.
+        if orjson is None or not self.strict:
+            return super().parse(stream, media_type, parser_context)
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        raw = stream.read()
+        # orjson reads UTF-8 only
+        if encoding.lower() in ("utf-8", "utf8") and LONG_DIGITS not in raw.translate(ALL_ZEROS):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # the stdlib parser either accepts it or raises DRF's usual error
+        return super().parse(io.BytesIO(raw), media_type, parser_context)
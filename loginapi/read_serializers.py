@@ -0,0 +1,121 @@
+from functools import lru_cache
+
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# Fields whose to_representation() returns the database value unchanged
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+# ---------------------------
+# values()-based read path
+# ---------------------------
+class FileURL:
+    """FileField.to_representation() for a stored file name instead of a FieldFile."""
+
+    def __init__(self, storage, use_url, request=None):
+        self.storage = storage
+        self.use_url = use_url
+        self.request = request
+
+    def bind(self, request):
+        return FileURL(self.storage, self.use_url, request)
+
+    def __call__(self, name):
+        if not name:
+            return None
+        if not self.use_url:
+            return name
+        url = self.storage.url(name)
+        return self.request.build_absolute_uri(url) if self.request is not None else url
+
+
+class ISODateTime:
+    """DateTimeField.to_representation() with the field's timezone looked up once per call, not per row."""
+
+    def __init__(self, field, timezone=None):
+        self.field = field
+        self.timezone = timezone
+
+    def bind(self, request):
+        field = self.field
+        return ISODateTime(field, field.timezone if hasattr(field, "timezone") else field.default_timezone())
+
+    def __call__(self, value):
+        if self.timezone is None or value.tzinfo is None:
+            return self.field.to_representation(value)
+        value = value.astimezone(self.timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+
+class ReadPlan:
+    """
+    Read-only twin of a ModelSerializer that works on values() rows.
+
+    The serializer's fields are resolved once into (output name, values() key,
+    converter) columns; serialize() then only runs the converters that change
+    a value (dates, files, JSON), so no model instances or per-row field
+    lookups are involved. Output matches ``serializer_class(...).data`` for
+    serializers made of plain model fields.
+    """
+
+    def __init__(self, serializer_class, fields=None):
+        serializer = serializer_class() if fields is None else serializer_class(fields=fields)
+        model = serializer.Meta.model
+        self.columns = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source == "*" or "." in field.source:
+                raise ValueError(f"{serializer_class.__name__}.{name} is not a plain model field")
+            model_field = model._meta.get_field(field.source)
+            self.columns.append((name, model_field.attname, self.converter(field, model_field)))
+        self.keys = [key for _, key, _ in self.columns]
+
+    @staticmethod
+    def converter(field, model_field):
+        if isinstance(field, serializers.FileField):
+            return FileURL(model_field.storage, getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL))
+        if isinstance(field, PASSTHROUGH_FIELDS):
+            return None
+        if isinstance(field, serializers.DateTimeField):
+            if getattr(field, "format", api_settings.DATETIME_FORMAT) == ISO_8601:
+                return ISODateTime(field)
+        return field.to_representation
+
+    def values(self, queryset, *extra):
+        """The queryset as values() rows with every column, plus ``extra`` keys (pagination)."""
+        return queryset.values(*dict.fromkeys([*self.keys, *extra]))
+
+    def serialize(self, rows, request=None):
+        """Like ``serializer_class(instances, many=True, context={"request": request}).data``."""
+        columns = [
+            (name, key, convert.bind(request) if hasattr(convert, "bind") else convert)
+            for name, key, convert in self.columns
+        ]
+        data = []
+        for row in rows:
+            item = {}
+            for name, key, convert in columns:
+                value = row[key]
+                item[name] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+
+@lru_cache(maxsize=256)
+def get_read_plan(serializer_class, fields=None):
+    return ReadPlan(serializer_class, None if fields is None else list(fields))
+
+
+def read_plan(serializer_class, fields=None):
+    """Cached ReadPlan for a serializer and an optional ``?fields=`` projection."""
+    return get_read_plan(serializer_class, None if fields is None else frozenset(fields))
@@ -0,0 +1,50 @@
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # optional; the renderer falls back to the stdlib json module
+    orjson = None
+
+
+# ---------------------------
+# JSON rendering
+# ---------------------------
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson when it is installed.
+
+    Produces the same bytes as DRF's compact renderer (dates, ``Z`` for UTC,
+    escaped U+2028/U+2029) for everything but floats. Indented output,
+    ASCII-only output and values orjson rejects (ints over 64 bits, lone
+    surrogates, unknown types) go through the stdlib renderer instead.
+
+    Floats are not checked, since that means walking every payload and
+    costs most of the speedup; no serializer here produces them outside
+    the small metrics responses. orjson writes exponents as 1e16 / 0.00001
+    (repr() gives 1e+16 / 1e-05; same values), and NaN/Infinity as null
+    where JSONRenderer raises ValueError under STRICT_JSON.
+    """
+    options = 0 if orjson is None else orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=encoders.JSONEncoder().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Keep the output a strict JavaScript subset, like JSONRenderer does.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
+
+
+def json_response(data, status=200, headers=None):
+    """JSON HttpResponse for plain Django views, rendered like the DRF ones."""
+    return HttpResponse(
+        FastJSONRenderer().render(data), status=status, content_type="application/json", headers=headers
+    )
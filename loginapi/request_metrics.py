@@ -0,0 +1,214 @@
+import hmac
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# Upper bounds (seconds) of the per-route histogram buckets
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current = ContextVar("request_timings", default=None)
+
+
+def get_config():
+    config = {"ENABLED": True, "SAMPLE_RATE": 0.0, "SERVER_TIMING": False, "TOKEN": ""}
+    config.update(getattr(settings, "REQUEST_METRICS", {}))
+    return config
+
+
+# ---------------------------
+# Per-request timings
+# ---------------------------
+class RequestTimings:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.sql = 0.0
+        self.view_start = None
+        self.view_end = None
+        self.extra = {}  # e.g. {"hash": seconds}
+
+    def add(self, name, seconds):
+        self.extra[name] = self.extra.get(name, 0.0) + seconds
+
+    def finish(self):
+        end = time.perf_counter()
+        view_start = self.view_start or self.start
+        view_end = self.view_end or end
+        return {
+            "total": end - self.start,
+            "db": self.sql,
+            "view": view_end - view_start,
+            # DRF responses are rendered (JSON-encoded) after the view returns.
+            "render": end - view_end if self.view_end else 0.0,
+            **self.extra,
+        }
+
+
+def begin(sample_rate):
+    """Start timing this request (returns the ContextVar token), or None when not sampled."""
+    if sample_rate < 1.0 and random.random() >= sample_rate:
+        return None
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def end(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def timed(name):
+    """Add the block's duration to the current request under ``name`` (if it is sampled)."""
+    timings = _current.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings.add(name, time.perf_counter() - start)
+
+
+def sql_timer(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.queries += 1
+        timings.sql += time.perf_counter() - start
+
+
+@receiver(connection_created)
+def install_sql_timer(sender, connection, **kwargs):
+    # Installed once per connection and keyed off a ContextVar, so it also sees
+    # queries the async ORM runs on sync_to_async threads.
+    if sql_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(sql_timer)
+
+
+def may_see_timings(request, config):
+    """Server-Timing goes only to staff and to callers presenting the metrics token."""
+    token = config["TOKEN"]
+    supplied = request.headers.get("X-Metrics-Token")
+    if token and supplied is not None and hmac.compare_digest(supplied.encode(), token.encode()):
+        return True
+    # DRF copies the authenticated user onto the Django request
+    user = getattr(request, "user", None)
+    return bool(user is not None and user.is_staff)
+
+
+def server_timing(durations, queries):
+    entries = []
+    for name, seconds in durations.items():
+        entry = f"{name};dur={seconds * 1000:.2f}"
+        if name == "db":
+            entry += f';desc="{queries} queries"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+
+# ---------------------------
+# Per-route aggregates
+# ---------------------------
+class Histogram:
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.buckets[index] += 1
+                break
+
+
+class RouteMetrics:
+    """Process-local per-route histograms, rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}  # (phase, route, method) -> Histogram
+            self.queries = {}  # (route, method) -> total query count
+            self.responses = {}  # (route, method, status) -> count
+
+    def record(self, route, method, status, durations, queries):
+        with self._lock:
+            for phase in ("total", "db", "view", "render"):
+                key = (phase, route, method)
+                if key not in self.histograms:
+                    self.histograms[key] = Histogram()
+                self.histograms[key].observe(durations[phase])
+            self.queries[(route, method)] = self.queries.get((route, method), 0) + queries
+            key = (route, method, str(status))
+            self.responses[key] = self.responses.get(key, 0) + 1
+
+    def render(self):
+        with self._lock:
+            lines = [
+                "# HELP http_request_phase_seconds Request time by phase (total, db, view, render).",
+                "# TYPE http_request_phase_seconds histogram",
+            ]
+            for (phase, route, method), histogram in sorted(self.histograms.items()):
+                lines.extend(histogram_lines(
+                    "http_request_phase_seconds", histogram,
+                    {"phase": phase, "route": route, "method": method},
+                ))
+            lines += [
+                "# HELP http_request_queries_total SQL queries executed.",
+                "# TYPE http_request_queries_total counter",
+            ]
+            for (route, method), total in sorted(self.queries.items()):
+                lines.append(sample("http_request_queries_total", {"route": route, "method": method}, total))
+            lines += [
+                "# HELP http_requests_total Sampled requests by response status.",
+                "# TYPE http_requests_total counter",
+            ]
+            for (route, method, status), total in sorted(self.responses.items()):
+                labels = {"route": route, "method": method, "status": status}
+                lines.append(sample("http_requests_total", labels, total))
+        return lines
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def sample(name, labels, value):
+    if labels:
+        rendered = ",".join(f'{key}="{escape_label(label)}"' for key, label in labels.items())
+        return f"{name}{{{rendered}}} {value}"
+    return f"{name} {value}"
+
+
+def histogram_lines(name, histogram, labels, bounds=BUCKETS):
+    lines = []
+    cumulative = 0
+    for bound, count in zip(bounds, histogram.buckets):
+        cumulative += count
+        lines.append(sample(f"{name}_bucket", {**labels, "le": str(bound)}, cumulative))
+    lines.append(sample(f"{name}_bucket", {**labels, "le": "+Inf"}, histogram.count))
+    lines.append(sample(f"{name}_sum", labels, round(histogram.sum, 6)))
+    lines.append(sample(f"{name}_count", labels, histogram.count))
+    return lines
+
+
+routes = RouteMetrics()
@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+REPLICA_ALIAS = "replica"
+
+_use_replica = ContextVar("use_replica", default=False)
+
+
+# ---------------------------
+# Read-replica routing
+# ---------------------------
+@contextmanager
+def replica_reads():
+    """
+    Send ORM reads made inside this block/handler to the replica, if one is configured.
+
+    Only for read-only list and stats handlers: the replica may lag the
+    primary, so anything that reads its own writes must stay on the primary.
+    """
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+class ReplicaRouter:
+    """Writes always go to the primary; reads go to the replica only inside replica_reads()."""
+
+    def db_for_read(self, model, **hints):
+        if not (_use_replica.get() and replica_configured()):
+            return None
+        # Inside a transaction on the primary, keep reading from it.
+        if connections["default"].in_atomic_block:
+            return None
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
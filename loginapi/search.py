@@ -0,0 +1,201 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils.html import escape
+from django.utils.module_loading import import_string
+
+from .models import Job
+
+
+# Match markers written by the index; stripped from indexed text so user
+# content can never contain them.
+MATCH_OPEN = "\x02"
+MATCH_CLOSE = "\x03"
+
+
+@dataclass
+class SearchHit:
+    job_id: int
+    rank: float
+    # title and snippet are safe HTML, see render_highlight()
+    title: str
+    snippet: str
+
+
+def tokenize(query):
+    return re.findall(r"\w+", query or "")
+
+
+def strip_markers(text):
+    return (text or "").replace(MATCH_OPEN, "").replace(MATCH_CLOSE, "")
+
+
+def render_highlight(text):
+    """HTML-escape indexed text, then turn the match markers into <mark> tags."""
+    return escape(text).replace(MATCH_OPEN, "<mark>").replace(MATCH_CLOSE, "</mark>")
+
+
+# ---------------------------
+# Backends
+# ---------------------------
+class BaseSearchBackend:
+    """Interface for job full-text search backends."""
+
+    def setup(self):
+        pass
+
+    def index_jobs(self, jobs):
+        raise NotImplementedError
+
+    def remove_jobs(self, job_ids):
+        raise NotImplementedError
+
+    def rebuild(self, queryset=None, batch_size=1000):
+        raise NotImplementedError
+
+    def search(self, query, limit=20):
+        raise NotImplementedError
+
+
+class BasicSearchBackend(BaseSearchBackend):
+    """
+    Index-free fallback for databases without a full-text backend yet.
+
+    Matches every term with ``icontains``; results are returned unranked.
+    """
+
+    def index_jobs(self, jobs):
+        pass
+
+    def remove_jobs(self, job_ids):
+        pass
+
+    def rebuild(self, queryset=None, batch_size=1000):
+        return 0
+
+    def search(self, query, limit=20):
+        terms = tokenize(query)
+        if not terms:
+            return []
+        queryset = Job.objects.all()
+        for term in terms:
+            queryset = queryset.filter(
+                Q(title__icontains=term) | Q(tags__icontains=term) | Q(description__icontains=term)
+            )
+        hits = []
+        for job_id, title, description in queryset.values_list("id", "title", "description")[:limit]:
+            hits.append(SearchHit(
+                job_id=job_id, rank=0.0, title=escape(title), snippet=escape(description[:200])
+            ))
+        return hits
+
+
+class SQLiteFTS5Backend(BaseSearchBackend):
+    """
+    SQLite FTS5 index over Job.title, Job.tags and Job.description.
+
+    The index lives in a standalone FTS5 table keyed by the job id (rowid) and
+    is ranked with BM25, weighting title over tags over description.
+    """
+    table = "loginapi_job_fts"
+    weights = (10.0, 5.0, 1.0)
+    snippet_tokens = 16
+
+    def setup(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} "
+                "USING fts5(title, tags, description, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+    @staticmethod
+    def document(row):
+        pk, title, tags, description = row
+        return (pk, strip_markers(title), strip_markers(tags), strip_markers(description))
+
+    def index_jobs(self, jobs):
+        rows = [self.document((job.pk, job.title, job.tags, job.description)) for job in jobs]
+        if not rows:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(f"DELETE FROM {self.table} WHERE rowid = %s", [(row[0],) for row in rows])
+            cursor.executemany(
+                f"INSERT INTO {self.table}(rowid, title, tags, description) VALUES (%s, %s, %s, %s)", rows
+            )
+
+    def remove_jobs(self, job_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(f"DELETE FROM {self.table} WHERE rowid = %s", [(pk,) for pk in job_ids])
+
+    def rebuild(self, queryset=None, batch_size=1000):
+        if queryset is None:
+            queryset = Job.objects.all()
+        self.setup()
+        total = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+            batch = []
+            for row in queryset.values_list("id", "title", "tags", "description").iterator(chunk_size=batch_size):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    self._insert(cursor, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                self._insert(cursor, batch)
+                total += len(batch)
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('optimize')")
+        return total
+
+    def _insert(self, cursor, rows):
+        cursor.executemany(
+            f"INSERT INTO {self.table}(rowid, title, tags, description) VALUES (%s, %s, %s, %s)",
+            [self.document(row) for row in rows],
+        )
+
+    @staticmethod
+    def match_expression(query):
+        terms = tokenize(query)
+        if not terms:
+            return None
+        # Quote every term so user input can't inject FTS5 syntax; the last one
+        # is a prefix match to support search-as-you-type.
+        quoted = ['"%s"' % term.replace('"', '""') for term in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def search(self, query, limit=20):
+        expression = self.match_expression(query)
+        if expression is None:
+            return []
+        weights = ", ".join(str(weight) for weight in self.weights)
+        sql = (
+            f"SELECT rowid, bm25({self.table}, {weights}) AS rank, "
+            f"highlight({self.table}, 0, %s, %s), "
+            f"snippet({self.table}, 2, %s, %s, '…', {self.snippet_tokens}) "
+            f"FROM {self.table} WHERE {self.table} MATCH %s ORDER BY rank LIMIT %s"
+        )
+        params = [MATCH_OPEN, MATCH_CLOSE, MATCH_OPEN, MATCH_CLOSE, expression, limit]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [
+                # bm25() is "lower is better"; flip it so clients can sort descending.
+                SearchHit(job_id=pk, rank=-rank, title=render_highlight(title), snippet=render_highlight(snippet))
+                for pk, rank, title, snippet in cursor.fetchall()
+            ]
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    path = getattr(settings, "JOB_SEARCH_BACKEND", None)
+    if path is None:
+        path = (
+            "loginapi.search.SQLiteFTS5Backend"
+            if connection.vendor == "sqlite"
+            else "loginapi.search.BasicSearchBackend"
+        )
+    return import_string(path)()
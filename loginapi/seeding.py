@@ -0,0 +1,166 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from . import stats
+from .models import Application, Company, Job, User
+from .search import get_search_backend
+from .taxonomy import link_employers, sync_tags
+
+SEED_PASSWORD = "seed-password"
+
+INDUSTRIES = ["Software", "Finance", "Healthcare", "Retail", "Logistics", "Education", "Media"]
+TITLES = [
+    "Backend Engineer", "Frontend Developer", "Data Analyst", "Product Manager", "DevOps Engineer",
+    "QA Engineer", "UX Designer", "Mobile Developer", "Data Engineer", "Support Specialist",
+]
+TAGS = ["python", "django", "react", "sql", "aws", "docker", "kotlin", "go", "figma", "excel", "rust", "java"]
+LOCATIONS = [
+    ("USA", "New York"), ("USA", "Austin"), ("Germany", "Berlin"), ("UK", "London"),
+    ("India", "Bengaluru"), ("Canada", "Toronto"), ("Netherlands", "Amsterdam"),
+]
+JOB_TYPES = ["Full-time", "Part-time", "Contract", "Internship"]
+JOB_LEVELS = ["Entry", "Mid", "Senior", "Lead"]
+EDUCATION = ["High School", "Bachelor", "Master", "PhD"]
+STATUSES = ["pending", "pending", "pending", "accepted", "rejected"]
+
+
+# ---------------------------
+# Benchmark / load-test data
+# ---------------------------
+def seed_users(rng, count, prefix, password_hash):
+    """One admin, ~10% recruiters, the rest job seekers."""
+    users = []
+    for index in range(count):
+        if index == 0:
+            role = "Admin"
+        elif index % 10 == 1:
+            role = "Recruiter"
+        else:
+            role = "Job Seeker"
+        users.append(User(
+            username=f"{prefix}-{index}",
+            email=f"{prefix}-{index}@example.com",
+            name=f"Seed User {index}",
+            role=role,
+            is_staff=role == "Admin",
+            profile_complete=rng.random() < 0.6,
+            password=password_hash,
+        ))
+    return users
+
+
+def seed_companies(rng, count, prefix):
+    return [
+        Company(
+            name=f"{prefix.title()} Company {index}",
+            industry=rng.choice(INDUSTRIES),
+            website=f"https://{prefix}-{index}.example.com",
+            founded_year=rng.randint(1950, 2024),
+            status=rng.choice(["incomplete", "completed"]),
+        )
+        for index in range(count)
+    ]
+
+
+def seed_jobs(rng, count, recruiters, companies, now):
+    jobs = []
+    for index in range(count):
+        country, city = rng.choice(LOCATIONS)
+        low = rng.randrange(20000, 150000, 5000)
+        jobs.append(Job(
+            title=rng.choice(TITLES),
+            company=rng.choice(companies).name if companies else "",
+            recruiter_id=rng.choice(recruiters).pk,
+            tags=", ".join(rng.sample(TAGS, rng.randint(1, 4))),
+            role=rng.choice(TITLES),
+            min_salary=low,
+            max_salary=low + rng.randrange(5000, 60000, 5000),
+            salary_type="Yearly",
+            education=rng.choice(EDUCATION),
+            experience=f"{rng.randint(0, 10)} years",
+            job_type=rng.choice(JOB_TYPES),
+            job_level=rng.choice(JOB_LEVELS),
+            vacancies=rng.randint(1, 5),
+            expiration_date=(now + timedelta(days=rng.randint(-30, 90))).date(),
+            location_country=country,
+            location_city=city,
+            is_remote=rng.random() < 0.3,
+            description=f"Seeded job {index}. " + " ".join(rng.sample(TAGS, 3)),
+            apply_method="Internal",
+        ))
+    return jobs
+
+
+def seed_applications(rng, count, seekers, jobs):
+    return [
+        Application(
+            job_id=rng.choice(jobs).pk,
+            applicant_id=rng.choice(seekers).pk,
+            name=f"Applicant {index}",
+            email=f"applicant-{index}@example.com",
+            phone=f"+1555{index:07d}"[:20],
+            resume=f"resumes/seed/{index % 50}.pdf",
+            cover_letter="Seeded application",
+            status=rng.choice(STATUSES),
+        )
+        for index in range(count)
+    ]
+
+
+def spread_timestamps(rng, model, field, objects, now, days=180):
+    # auto_now_add ignores values passed to bulk_create; backdate afterwards.
+    updates = []
+    for obj in objects:
+        setattr(obj, field, now - timedelta(seconds=rng.randint(0, days * 86400)))
+        updates.append(obj)
+    model.objects.bulk_update(updates, [field], batch_size=500)
+
+
+def seed(users=200, companies=20, jobs=500, applications=2000, prefix="seed", random_seed=0, batch_size=1000):
+    """
+    Insert a realistic dataset with bulk_create and return the created counts.
+
+    Everything bulk_create skips (search index, tag rows, employer links,
+    dashboard counters) is done here in batches as well. All users share
+    the password SEED_PASSWORD, hashed once.
+    """
+    rng = random.Random(random_seed)
+    now = timezone.now()
+    with transaction.atomic():
+        user_rows = User.objects.bulk_create(
+            seed_users(rng, users, prefix, make_password(SEED_PASSWORD)), batch_size=batch_size
+        )
+        company_rows = Company.objects.bulk_create(seed_companies(rng, companies, prefix), batch_size=batch_size)
+
+        recruiters = [user for user in user_rows if user.role == "Recruiter"]
+        seekers = [user for user in user_rows if user.role == "Job Seeker"]
+        job_rows = seed_jobs(rng, jobs if recruiters else 0, recruiters, company_rows, now)
+        backend = get_search_backend()
+        for start in range(0, len(job_rows), batch_size):
+            batch = job_rows[start:start + batch_size]
+            link_employers(batch)
+            Job.objects.bulk_create(batch)
+            backend.index_jobs(batch)
+            sync_tags(batch, replace=False)
+        spread_timestamps(rng, Job, "created_at", job_rows, now)
+
+        application_rows = Application.objects.bulk_create(
+            seed_applications(rng, applications if seekers and job_rows else 0, seekers, job_rows),
+            batch_size=batch_size,
+        )
+        spread_timestamps(rng, Application, "applied_at", application_rows, now)
+
+        if stats.counters_enabled():
+            for user in user_rows:
+                stats.refresh_counters(user.pk)
+
+    return {
+        "users": len(user_rows),
+        "companies": len(company_rows),
+        "jobs": len(job_rows),
+        "applications": len(application_rows),
+    }
@@ -1,4 +1,5 @@
 # Login 
+import zlib
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from django.contrib.auth import authenticate
@@ -7,6 +8,7 @@ from .models import Application
 from .models import User
 from .models import Company
 from .models import Job
+from .taxonomy import parse_tags
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -62,17 +64,40 @@ class ResetPasswordSerializer(serializers.Serializer):
         return data
 
 
+# Field projection (?fields=a,b)
+class DynamicFieldsMixin:
+    """Takes an optional ``fields`` argument that limits which fields are serialized."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
 # ApplyJob
 
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Application
         fields = [
             "id", "job", "applicant", "name", "email", "phone",
             "resume", "cover_letter", "status", "applied_at"
         ]
-        read_only_fields = ["status", "applied_at"]
+        read_only_fields = ["applicant", "status", "applied_at"]
+
+class ApplicationStatusBatchSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000)
+    status = serializers.ChoiceField(choices=Application._meta.get_field("status").choices)
+
+    def to_internal_value(self, data):
+        # Accept "Rejected" as well as "rejected"
+        if isinstance(data, dict) and isinstance(data.get("status"), str):
+            data = {**data, "status": data["status"].lower()}
+        return super().to_internal_value(data)
+
 
 # Company
 
@@ -102,6 +127,19 @@ class CompanyCompleteSerializer(serializers.ModelSerializer):
         model = Company
         fields = ['id', 'status']
 
+# All wizard steps in one payload
+class CompanyOnboardingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Company
+        fields = [
+            'id', 'name', 'industry', 'website',
+            'founder_name', 'founded_year', 'headquarters',
+            'linkedin', 'twitter',
+            'email', 'phone', 'address',
+            'status', 'version',
+        ]
+        read_only_fields = ['id', 'version']
+
 
 
 # Recent applications serializer
@@ -109,19 +147,32 @@ class RecentApplicationSerializer(serializers.ModelSerializer):
     title = serializers.CharField(source='job.title')
     company = serializers.CharField(source='job.company')
     logoColor = serializers.SerializerMethodField()
-    type = serializers.CharField(source='job.type')
-    location = serializers.CharField(source='job.location')
-    salary = serializers.CharField(source='job.salary')
-    date = serializers.DateTimeField(source='applied_on', format="%Y-%m-%d")
+    type = serializers.CharField(source='job.job_type')
+    location = serializers.SerializerMethodField()
+    salary = serializers.SerializerMethodField()
+    date = serializers.DateTimeField(source='applied_at', format="%Y-%m-%d")
     
     class Meta:
         model = Application
         fields = ['title', 'company', 'logoColor', 'type', 'location', 'salary', 'date', 'status']
 
     def get_logoColor(self, obj):
-        # Example: generate color based on company name hash
+        # crc32 rather than hash(): str hashes differ between processes
         colors = ['#f56a00', '#7265e6', '#ffbf00', '#00a2ae']
-        return colors[hash(obj.job.company) % len(colors)]
+        return colors[zlib.crc32(obj.job.company.encode()) % len(colors)]
+
+    def get_location(self, obj):
+        job = obj.job
+        if job.is_remote:
+            return "Remote"
+        return ", ".join(part for part in (job.location_city, job.location_country) if part)
+
+    def get_salary(self, obj):
+        job = obj.job
+        amounts = [str(amount) for amount in (job.min_salary, job.max_salary) if amount is not None]
+        if not amounts:
+            return ""
+        return " ".join(part for part in (" - ".join(amounts), job.salary_type) if part)
 
 
 
@@ -129,9 +180,47 @@ class RecentApplicationSerializer(serializers.ModelSerializer):
 class JobCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Job
-        fields = '__all__'
+        # tag_set mirrors the ``tags`` string; reading it per job would be an N+1
+        exclude = ['tag_set']
         read_only_fields = ['id', 'recruiter']
 
+    def validate_external_id(self, value):
+        # Bulk writes (context["bulk"]) check the whole list with one query instead
+        request = self.context.get('request')
+        if value and request is not None and not self.context.get('bulk'):
+            existing = Job.objects.filter(recruiter_id=request.user.id, external_id=value)
+            if self.instance is not None:
+                existing = existing.exclude(pk=self.instance.pk)
+            if existing.exists():
+                raise serializers.ValidationError("A job with this external_id already exists.")
+        return value
+
     def create(self, validated_data):
         validated_data['recruiter'] = self.context['request'].user
         return super().create(validated_data)
+
+
+# Job search filters (query parameters of /jobs/)
+class JobFilterSerializer(serializers.Serializer):
+    location_country = serializers.CharField(required=False)
+    location_city = serializers.CharField(required=False)
+    is_remote = serializers.BooleanField(required=False, allow_null=True, default=None)
+    job_type = serializers.CharField(required=False)
+    job_level = serializers.CharField(required=False)
+    min_salary = serializers.IntegerField(required=False, min_value=0)
+    max_salary = serializers.IntegerField(required=False, min_value=0)
+    expires_after = serializers.DateField(required=False)
+    expires_before = serializers.DateField(required=False)
+    company = serializers.IntegerField(required=False, min_value=1)
+    tag = serializers.CharField(required=False)
+
+    def validate_tag(self, value):
+        names = parse_tags(value)
+        if len(names) != 1:
+            raise serializers.ValidationError("Give exactly one tag")
+        return names[0]
+
+    def validate(self, data):
+        if "min_salary" in data and "max_salary" in data and data["min_salary"] > data["max_salary"]:
+            raise serializers.ValidationError("min_salary cannot be greater than max_salary")
+        return data
@@ -0,0 +1,234 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from . import cache as dashboard_cache
+from . import feeds
+from . import stats
+from .authentication import CLAIM_FIELDS, revoke_user_tokens
+from .models import Application, Company, Job, ResumeBlob, User
+from .search import get_search_backend
+from .taxonomy import link_company_jobs, link_employers, sync_tags
+
+
+# ---------------------------
+# Job search index sync
+# ---------------------------
+@receiver(post_save, sender=Job)
+def index_job(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    get_search_backend().index_jobs([instance])
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job(sender, instance, **kwargs):
+    get_search_backend().remove_jobs([instance.pk])
+
+
+# ---------------------------
+# Job company / tag relations
+# ---------------------------
+def loaded_relations(instance):
+    fields = instance.__dict__
+    return fields.get("company"), fields.get("tags"), fields.get("employer_id")
+
+
+@receiver(post_init, sender=Job)
+def remember_job_relations(sender, instance, **kwargs):
+    instance._loaded_relations = loaded_relations(instance)
+
+
+@receiver(pre_save, sender=Job)
+def link_job_employer(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    old_company, _, old_employer_id = instance._loaded_relations
+    if not instance._state.adding:
+        if instance.__dict__.get("company") == old_company:
+            return
+        # A renamed company points at another employer, unless the caller set one explicitly.
+        if instance.__dict__.get("employer_id") == old_employer_id:
+            instance.employer_id = None
+    link_employers([instance])
+
+
+@receiver(post_save, sender=Company)
+def link_new_company_jobs(sender, instance, created, raw=False, **kwargs):
+    # Renames go through onboarding.save_company_changes(), which links as well.
+    if created and not raw:
+        link_company_jobs(instance)
+
+
+@receiver(post_save, sender=Job)
+def sync_job_tags(sender, instance, created, raw=False, **kwargs):
+    old_tags = None if created else instance._loaded_relations[1]
+    tags = instance.__dict__.get("tags")
+    instance._loaded_relations = loaded_relations(instance)
+    if raw or "tags" not in instance.__dict__ or tags == old_tags or (created and not tags):
+        return
+    sync_tags([instance], replace=not created)
+
+
+# ---------------------------
+# Dashboard counters
+# ---------------------------
+@receiver(post_init, sender=Application)
+def remember_application_status(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred status field isn't loaded just for this.
+    instance._loaded_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Application)
+def count_application_save(sender, instance, created, raw=False, **kwargs):
+    old_status = instance._loaded_status
+    new_status = instance._loaded_status = instance.__dict__.get("status")
+    if raw or not stats.counters_enabled():
+        return
+    if created:
+        seeker, recruiter = stats.application_deltas(new_status, 1)
+    elif None not in (old_status, new_status) and old_status != new_status:
+        seeker, recruiter = stats.status_change_deltas(old_status, new_status)
+    else:
+        return
+    stats.bump_counters(instance.applicant_id, **seeker)
+    stats.bump_counters(stats.application_recruiter_id(instance), **recruiter)
+
+
+@receiver(post_delete, sender=Application)
+def count_application_delete(sender, instance, **kwargs):
+    if not stats.counters_enabled():
+        return
+    seeker, recruiter = stats.application_deltas(instance.status, -1)
+    stats.bump_counters(instance.applicant_id, **seeker)
+    stats.bump_counters(stats.application_recruiter_id(instance), **recruiter)
+
+
+@receiver(post_save, sender=Job)
+def count_job_save(sender, instance, created, raw=False, **kwargs):
+    if created and not raw and stats.counters_enabled():
+        stats.bump_counters(instance.recruiter_id, jobs_posted=1)
+
+
+@receiver(post_delete, sender=Job)
+def count_job_delete(sender, instance, **kwargs):
+    if stats.counters_enabled():
+        stats.bump_counters(instance.recruiter_id, jobs_posted=-1)
+
+
+# ---------------------------
+# Dashboard cache invalidation
+# ---------------------------
+def invalidate_on_commit(*owners):
+    # Wait for the commit so a concurrent request can't re-cache pre-commit data.
+    transaction.on_commit(lambda: dashboard_cache.invalidate(*owners))
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_application_owners(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_on_commit(
+        instance.applicant_id, stats.application_recruiter_id(instance), dashboard_cache.GLOBAL_SCOPE
+    )
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_owner(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_on_commit(instance.recruiter_id, dashboard_cache.GLOBAL_SCOPE, dashboard_cache.JOBS_SCOPE)
+
+
+@receiver(post_save, sender=Job)
+def invalidate_job_applicants(sender, instance, created, raw=False, **kwargs):
+    # Applicants' recent-applications responses and feed rows show the job's
+    # title, company, location and salary. Deleting a job deletes its
+    # applications, which invalidates (and discards) their owners' entries.
+    if raw or created:
+        return
+    applicants = set(Application.objects.filter(job_id=instance.pk).values_list("applicant_id", flat=True))
+    if applicants:
+        invalidate_on_commit(*applicants)
+    if feeds.buffer_enabled():
+        owners = (*applicants, instance.recruiter_id, feeds.GLOBAL_FEED)
+        transaction.on_commit(lambda: feeds.buffers.discard(*owners))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    invalidate_on_commit(instance.pk, dashboard_cache.GLOBAL_SCOPE)
+
+
+# ---------------------------
+# Recent applications ring buffers
+# ---------------------------
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def update_recent_feeds(sender, instance, created=False, raw=False, **kwargs):
+    if raw or not feeds.buffer_enabled():
+        return
+    recruiter_id = stats.application_recruiter_id(instance)
+    if created:
+        transaction.on_commit(lambda: feeds.push_application(instance, recruiter_id))
+    else:
+        owners = (instance.applicant_id, recruiter_id, feeds.GLOBAL_FEED)
+        transaction.on_commit(lambda: feeds.buffers.discard(*owners))
+
+
+# ---------------------------
+# Resume blob reference counts
+# ---------------------------
+def adjust_resume_refs(name, delta):
+    if name:
+        ResumeBlob.objects.filter(name=name).update(ref_count=F("ref_count") + delta)
+
+
+@receiver(post_init, sender=Application)
+def remember_resume_name(sender, instance, **kwargs):
+    resume = instance.__dict__.get("resume")
+    instance._loaded_resume = getattr(resume, "name", resume)
+
+
+@receiver(post_save, sender=Application)
+def count_resume_refs(sender, instance, created, raw=False, **kwargs):
+    old_name = None if created else instance._loaded_resume
+    resume = instance.__dict__.get("resume")
+    new_name = instance._loaded_resume = getattr(resume, "name", resume)
+    if raw or "resume" not in instance.__dict__ or old_name == new_name:
+        return
+    adjust_resume_refs(new_name, 1)
+    adjust_resume_refs(old_name, -1)
+
+
+@receiver(post_delete, sender=Application)
+def release_resume_ref(sender, instance, **kwargs):
+    adjust_resume_refs(instance._loaded_resume, -1)
+
+
+# ---------------------------
+# Token revocation on claim changes
+# ---------------------------
+# Every claim baked into issued tokens, plus is_active
+REVOKING_FIELDS = (*CLAIM_FIELDS, "is_active")
+
+
+@receiver(post_init, sender=User)
+def remember_token_claims(sender, instance, **kwargs):
+    instance._loaded_claims = tuple(instance.__dict__.get(field) for field in REVOKING_FIELDS)
+
+
+@receiver(post_save, sender=User)
+def revoke_stale_tokens(sender, instance, created, raw=False, **kwargs):
+    claims = tuple(instance.__dict__.get(field) for field in REVOKING_FIELDS)
+    changed = claims != instance._loaded_claims
+    instance._loaded_claims = claims
+    if not (created or raw) and changed:
+        # Tokens carry these as claims; make the user log in again.
+        transaction.on_commit(lambda: revoke_user_tokens(instance.pk))
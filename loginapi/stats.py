@@ -0,0 +1,188 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import Count, F, Q
+
+from .models import Application, DashboardCounter, Job, User
+
+APPLICATION_STATUSES = ("pending", "accepted", "rejected")
+COUNTER_FIELDS = (
+    "jobs_posted", "applications_received", "pending_received",
+    "applications_sent", "accepted", "rejected", "pending",
+)
+
+
+# ---------------------------
+# Aggregate queries (one query per role)
+# ---------------------------
+def admin_totals():
+    tables = [Job._meta.db_table, User._meta.db_table, Application._meta.db_table]
+    sql = "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in tables)
+    # Raw SQL bypasses the router; ask it which alias to read from.
+    with connections[router.db_for_read(Job)].cursor() as cursor:
+        cursor.execute(sql)
+        jobs, users, applications = cursor.fetchone()
+    return {"jobs": jobs, "users": users, "applications": applications}
+
+
+RECRUITER_AGGREGATES = {
+    "jobs_posted": Count("id", distinct=True),
+    "applications_received": Count("applications"),
+    "pending_received": Count("applications", filter=Q(applications__status="pending")),
+}
+SEEKER_AGGREGATES = {
+    "applications_sent": Count("id"),
+    "accepted": Count("id", filter=Q(status="accepted")),
+    "rejected": Count("id", filter=Q(status="rejected")),
+    "pending": Count("id", filter=Q(status="pending")),
+}
+
+
+def recruiter_totals(user_id):
+    return Job.objects.filter(recruiter_id=user_id).aggregate(**RECRUITER_AGGREGATES)
+
+
+def seeker_totals(user_id):
+    return Application.objects.filter(applicant_id=user_id).aggregate(**SEEKER_AGGREGATES)
+
+
+# ---------------------------
+# Materialized counters
+# ---------------------------
+def counters_enabled():
+    return getattr(settings, "STATS_USE_COUNTERS", False)
+
+
+def refresh_counters(user_id):
+    """
+    Recompute a user's counter row from scratch (used on first touch and by rebuilds).
+
+    The row is created before the source tables are counted, so a concurrent
+    change either lands in the totals or bumps the row; and the totals are
+    applied as increments to the locked row, so a bump made in between is
+    kept instead of overwritten.
+    """
+    DashboardCounter.objects.get_or_create(user_id=user_id)
+    with transaction.atomic():
+        counter = DashboardCounter.objects.select_for_update().get(user_id=user_id)
+        totals = {**recruiter_totals(user_id), **seeker_totals(user_id)}
+        bump_counters(user_id, **{field: totals[field] - getattr(counter, field) for field in COUNTER_FIELDS})
+    counter.refresh_from_db()
+    return counter
+
+
+def bump_counters(user_id, **deltas):
+    """
+    Apply ``field=delta`` increments to a user's counter row in a single UPDATE.
+
+    Users without a row are skipped: refresh_counters() creates the row before
+    it counts the source tables, so every change is in the totals or bumped.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas or user_id is None:
+        return
+    DashboardCounter.objects.filter(user_id=user_id).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+
+
+def get_counters(user_id):
+    counter = DashboardCounter.objects.filter(user_id=user_id).first()
+    return counter if counter is not None else refresh_counters(user_id)
+
+
+# ---------------------------
+# Dashboard payloads
+# ---------------------------
+def dashboard_stats(user):
+    if user.role == "Admin":
+        totals = admin_totals()
+    elif counters_enabled():
+        counter = get_counters(user.id)
+        totals = {field: getattr(counter, field) for field in COUNTER_FIELDS}
+    elif user.role == "Recruiter":
+        totals = recruiter_totals(user.id)
+    else:
+        totals = seeker_totals(user.id)
+    return stats_payload(user.role, totals)
+
+
+async def adashboard_stats(user):
+    """dashboard_stats() on the async ORM, for the ASGI read endpoints."""
+    if user.role == "Admin":
+        # Raw SQL has no async API yet.
+        totals = await sync_to_async(admin_totals)()
+    elif counters_enabled():
+        counter = await DashboardCounter.objects.filter(user_id=user.id).afirst()
+        if counter is None:
+            counter = await sync_to_async(refresh_counters)(user.id)
+        totals = {field: getattr(counter, field) for field in COUNTER_FIELDS}
+    elif user.role == "Recruiter":
+        totals = await Job.objects.filter(recruiter_id=user.id).aaggregate(**RECRUITER_AGGREGATES)
+    else:
+        totals = await Application.objects.filter(applicant_id=user.id).aaggregate(**SEEKER_AGGREGATES)
+    return stats_payload(user.role, totals)
+
+
+def stats_payload(role, totals):
+    if role == "Admin":
+        return [
+            {"title": "Total Jobs", "value": totals["jobs"], "icon": "applied"},
+            {"title": "Total Users", "value": totals["users"], "icon": "favorite"},
+            {"title": "Total Applications", "value": totals["applications"], "icon": "alert"},
+        ]
+    if role == "Recruiter":
+        return [
+            {"title": "Jobs Posted", "value": totals["jobs_posted"], "icon": "applied"},
+            {"title": "Applicants", "value": totals["applications_received"], "icon": "favorite"},
+            {"title": "Pending Applications", "value": totals["pending_received"], "icon": "alert"},
+        ]
+    return [
+        {"title": "Jobs Applied", "value": totals["applications_sent"], "icon": "applied"},
+        {"title": "Accepted", "value": totals["accepted"], "icon": "favorite"},
+        {"title": "Rejected", "value": totals["rejected"], "icon": "alert"},
+        {"title": "Pending", "value": totals["pending"], "icon": "applied"},
+    ]
+
+
+# ---------------------------
+# Counter maintenance hooks (wired in signals.py)
+# ---------------------------
+def application_recruiter_id(application):
+    if Application.job.is_cached(application):
+        return application.job.recruiter_id
+    return Job.objects.filter(pk=application.job_id).values_list("recruiter_id", flat=True).first()
+
+
+def application_deltas(status, sign):
+    """Counter deltas for adding (sign=1) or removing (sign=-1) one application in ``status``."""
+    seeker = {"applications_sent": sign}
+    if status in APPLICATION_STATUSES:
+        seeker[status] = sign
+    recruiter = {"applications_received": sign, "pending_received": sign if status == "pending" else 0}
+    return seeker, recruiter
+
+
+def status_change_deltas(old_status, new_status):
+    seeker = {}
+    if old_status in APPLICATION_STATUSES:
+        seeker[old_status] = -1
+    if new_status in APPLICATION_STATUSES:
+        seeker[new_status] = seeker.get(new_status, 0) + 1
+    recruiter = {"pending_received": (new_status == "pending") - (old_status == "pending")}
+    return seeker, recruiter
+
+
+def count_status_changes(changes):
+    """Counter upkeep for set-based updates: ``changes`` is (applicant_id, recruiter_id, old, new) tuples."""
+    if not counters_enabled():
+        return
+    totals = {}
+    for applicant_id, recruiter_id, old_status, new_status in changes:
+        seeker, recruiter = status_change_deltas(old_status, new_status)
+        for user_id, deltas in ((applicant_id, seeker), (recruiter_id, recruiter)):
+            user_totals = totals.setdefault(user_id, {})
+            for field, delta in deltas.items():
+                user_totals[field] = user_totals.get(field, 0) + delta
+    for user_id, deltas in totals.items():
+        bump_counters(user_id, **deltas)
@@ -0,0 +1,89 @@
+import hashlib
+import os
+import posixpath
+import re
+import tempfile
+
+from django.apps import apps
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+
+DIGEST_NAME = re.compile(r"^[0-9a-f]{64}(\.\w+)?$")
+
+
+# ---------------------------
+# Content-addressed resume storage
+# ---------------------------
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File storage that names files after the SHA-256 of their content.
+
+    Uploads are streamed to a temp file in chunks while being hashed, then moved
+    to ``<upload_to>/<ab>/<sha256><ext>``. Identical content is stored once and
+    tracked by a ``ResumeBlob`` row whose ``ref_count`` follows the Application
+    rows pointing at it; unreferenced blobs are removed by ``gc_resume_blobs``.
+    """
+    chunk_size = 64 * 1024
+    incoming_dir = ".incoming"
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is derived from the content in _save(); identical
+        # content must map to the same name instead of getting a suffix.
+        return name
+
+    def _save(self, name, content):
+        directory = posixpath.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+        incoming = self.path(posixpath.join(directory, self.incoming_dir))
+        os.makedirs(incoming, exist_ok=True)
+
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=incoming)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks(self.chunk_size):
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+            sha256 = digest.hexdigest()
+            final_name = self.store(temp_path, directory, sha256, extension, size)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+        return final_name
+
+    def store(self, temp_path, directory, sha256, extension, size):
+        ResumeBlob = apps.get_model("loginapi", "ResumeBlob")
+        # Renew the blob before handing out its name, so gc_resume_blobs (whose
+        # delete is conditional on last_used_at) can't collect it while the
+        # application referencing it is still being saved.
+        reused = ResumeBlob.objects.filter(sha256=sha256).update(last_used_at=timezone.now())
+        blob = ResumeBlob.objects.filter(sha256=sha256).first() if reused else None
+        name = blob.name if blob else posixpath.join(directory, sha256[:2], sha256 + extension)
+        path = self.path(name)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+            if self.file_permissions_mode is not None:
+                os.chmod(path, self.file_permissions_mode)
+        if blob is None:
+            try:
+                with transaction.atomic():
+                    ResumeBlob.objects.create(sha256=sha256, name=name, size=size)
+            except IntegrityError:
+                # A concurrent upload of the same content registered it first.
+                pass
+        return name
+
+
+def get_resume_storage():
+    return resume_storage
+
+
+resume_storage = ContentAddressedStorage()
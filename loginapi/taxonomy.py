@@ -0,0 +1,76 @@
+from django.db import transaction
+from django.utils import timezone
+
+from . import cache as dashboard_cache
+from .models import Company, Job, Tag
+
+TAG_MAX_LENGTH = Tag._meta.get_field("name").max_length
+
+
+# ---------------------------
+# Job company / tag relations
+# ---------------------------
+def parse_tags(text):
+    """Split a comma-joined tags string into unique, lowercased tag names (in order)."""
+    names = []
+    for part in (text or "").split(","):
+        name = " ".join(part.split()).lower()[:TAG_MAX_LENGTH]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def resolve_employers(names):
+    """Map company names to the oldest Company with exactly that name, in one query."""
+    if not names:
+        return {}
+    # Ordered newest first so the oldest id wins when building the dict.
+    return dict(Company.objects.filter(name__in=names).order_by("-id").values_list("name", "id"))
+
+
+def link_employers(jobs):
+    """Fill ``employer`` from the ``company`` name on unsaved/changed jobs; no writes."""
+    pending = [job for job in jobs if job.employer_id is None and job.company]
+    employers = resolve_employers({job.company for job in pending})
+    for job in pending:
+        job.employer_id = employers.get(job.company)
+
+
+def link_company_jobs(company):
+    """
+    Point jobs posted under ``company``'s name before it existed (or before a
+    rename) at it, in one UPDATE; returns the number of jobs linked.
+    """
+    linked = Job.objects.filter(employer__isnull=True, company=company.name).update(
+        employer_id=company.pk, updated_at=timezone.now()
+    )
+    if linked:
+        # update() sends no signals; ?company= filters and facets read employer_id.
+        transaction.on_commit(lambda: dashboard_cache.invalidate(dashboard_cache.JOBS_SCOPE))
+    return linked
+
+
+def get_tag_ids(names):
+    if not names:
+        return {}
+    Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+    return dict(Tag.objects.filter(name__in=names).values_list("name", "id"))
+
+
+def sync_tags(jobs, replace=True):
+    """
+    Rewrite the tag_set rows of saved ``jobs`` from their ``tags`` strings.
+
+    Costs at most four queries for any number of jobs: tag insert, tag id
+    lookup, and (with ``replace``) one delete plus one insert on the link table.
+    """
+    tags_by_job = {job.pk: parse_tags(job.tags) for job in jobs}
+    tag_ids = get_tag_ids(set().union(*tags_by_job.values()))
+    Link = Job.tag_set.through
+    if replace:
+        Link.objects.filter(job_id__in=list(tags_by_job)).delete()
+    Link.objects.bulk_create([
+        Link(job_id=job_id, tag_id=tag_ids[name])
+        for job_id, names in tags_by_job.items()
+        for name in names
+    ])
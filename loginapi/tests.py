@@ -1,3 +1,1531 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+import logging
+import tempfile
+import threading
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from smtplib import SMTPException
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core import mail
+from django.core.cache import caches
+from django.core.checks import run_checks
+from django.core.files.base import ContentFile
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone as django_timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from . import cache as dashboard_cache
+from . import checks, facets, feeds, hashing, onboarding, outbox, request_metrics, routers, stats
+from .authentication import ClaimsJWTAuthentication, issue_access_token
+from .benchmarks import ROUTES, EndpointBenchmark, Fixtures, covered_names, percentile, route_names
+from .management.commands.gc_resume_blobs import Command as GCResumeBlobs
+from .models import Application, Company, DashboardCounter, Job, OutboundEmail, PasswordResetToken, ResumeBlob, User
+from .pagination import KeysetPagination
+from .parsers import FastJSONParser
+from .read_serializers import read_plan
+from .renderers import FastJSONRenderer
+from .search import BasicSearchBackend
+from .seeding import SEED_PASSWORD, seed
+from .serializers import ApplicationSerializer, JobCreateSerializer
+from .storage import resume_storage
+
+
+def make_user(name, role="Job Seeker", **extra):
+    return User.objects.create_user(username=name, email=f"{name}@example.com", password="pass", role=role, **extra)
+
+
+def auth_client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {issue_access_token(user)}")
+    return client
+
+
+def make_application(job, applicant, **extra):
+    fields = {"name": applicant.username, "email": applicant.email, "phone": "1", "resume": "resumes/test.pdf"}
+    return Application.objects.create(job=job, applicant=applicant, **{**fields, **extra})
+
+
+# ---------------------------
+# Query-count regression harness
+# ---------------------------
+# Maximum number of SQL queries per request, keyed like benchmarks.ROUTES
+# (the URL name, or a case name for a second method or input of one URL). A budget is the
+# query count of the whole request: authentication, the view, the
+# serializer and any signal handlers. Raise a budget only when a new
+# query is intended and does not depend on the number of rows.
+QUERY_BUDGETS = {
+    "signup": 3,
+    "login": 1,
+    "logout": 1,
+    "forgot-password": 5,
+    "reset-password": 5,
+    "reset-password-invalid": 0,
+    "apply-job": 7,
+    "applications": 2,
+    "all-applications": 2,
+    "applications-batch-status": 5,
+    "applications-export": 1,
+    "application-detail": 3,
+    "application-detail-patch": 4,
+    "company-info": 2,
+    "founding-info": 2,
+    "social-media": 2,
+    "contact-info": 2,
+    "company-complete": 2,
+    "company-create": 2,
+    "company-onboarding": 1,
+    "stats": 1,
+    "profile-completion": 1,
+    "recent-applications": 1,
+    "cache-stats": 1,
+    "hash-metrics": 1,
+    "jobs-list": 2,
+    "jobs-detail": 2,
+    "jobs-facets": 6,
+    "jobs-search": 2,
+    "jobs-create": 7,
+    "async-stats": 1,
+    "async-profile-completion": 1,
+    "async-recent-applications": 1,
+    "async-applications": 1,
+    "async-all-applications": 1,
+}
+
+# Dataset sizes; users stay fixed so each user owns ~10x more rows at 10N.
+N = {"users": 20, "companies": 3, "jobs": 12, "applications": 40}
+SCALE = 10
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    LOGIN_HASH_POOL={},
+)
+class QueryCountTests(TestCase):
+    """Every endpoint must issue a bounded number of queries, whatever the data size."""
+
+    def reset_caches(self):
+        # Cached responses would hide the queries; ids are reused after a rollback too.
+        caches["default"].clear()
+        feeds.buffers.clear()
+
+    def query_counts(self, scale):
+        """Seed the dataset at ``scale`` and return {url name: (status, queries)}, then roll back."""
+        counts = {}
+        with transaction.atomic():
+            sizes = {name: size if name in ("users", "companies") else size * scale for name, size in N.items()}
+            seed(prefix="qc", **sizes)
+            bench = EndpointBenchmark(Fixtures.load("qc"))
+            for name, route in ROUTES.items():
+                path = route.path(name, bench.fixtures)
+                self.reset_caches()
+                with transaction.atomic():
+                    headers, data = bench.prepare(route, 0)
+                    with CaptureQueriesContext(connection) as queries:
+                        response = bench.call(route, path, headers, data)
+                        if response.streaming:
+                            b"".join(response.streaming_content)
+                    transaction.set_rollback(True)
+                counts[name] = (response.status_code, [query["sql"] for query in queries.captured_queries])
+            transaction.set_rollback(True)
+        return counts
+
+    def test_budget_table_covers_every_route(self):
+        self.assertEqual(set(QUERY_BUDGETS), set(ROUTES))
+        self.assertEqual(route_names() - covered_names(ROUTES), set())
+
+    def test_query_counts_do_not_grow_with_data(self):
+        small = self.query_counts(1)
+        large = self.query_counts(SCALE)
+        for name, budget in QUERY_BUDGETS.items():
+            with self.subTest(route=name):
+                status, small_queries = small[name]
+                large_status, large_queries = large[name]
+                self.assertLess(status, 500)
+                self.assertEqual(status, large_status)
+                self.assertLessEqual(
+                    len(large_queries), len(small_queries),
+                    f"{name}: {len(small_queries)} queries at N, {len(large_queries)} at {SCALE}N:\n"
+                    + "\n".join(large_queries),
+                )
+                self.assertLessEqual(
+                    len(large_queries), budget,
+                    f"{name}: {len(large_queries)} queries, budget {budget}:\n" + "\n".join(large_queries),
+                )
+
+
+# ---------------------------
+# values()-based read serializers
+# ---------------------------
+class ReadPlanTests(TestCase):
+    """read_plan() output must render to the same bytes as the DRF serializer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed(users=12, companies=2, jobs=10, applications=30, prefix="rp")
+        recruiter = User.objects.filter(role="Recruiter").first()
+        # Mostly defaults and NULLs
+        job = Job.objects.create(title="Bare", recruiter=recruiter)
+        Application.objects.create(job=job, applicant=recruiter, name="No resume", email="n@example.com", phone="1")
+
+    def assertSameJSON(self, serializer_class, queryset, fields=None, request=None):
+        kwargs = {} if fields is None else {"fields": fields}
+        expected = serializer_class(queryset, many=True, context={"request": request}, **kwargs).data
+        plan = read_plan(serializer_class, fields)
+        actual = plan.serialize(plan.values(queryset), request)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_applications(self):
+        queryset = Application.objects.order_by("-applied_at", "-id")
+        request = Request(APIRequestFactory().get("/api/applications/all/"))
+        self.assertSameJSON(ApplicationSerializer, queryset)
+        self.assertSameJSON(ApplicationSerializer, queryset, request=request)
+        self.assertSameJSON(ApplicationSerializer, queryset, fields=["status", "resume", "id"], request=request)
+
+    def test_jobs(self):
+        self.assertSameJSON(JobCreateSerializer, Job.objects.order_by("-created_at", "-id"))
+
+    @override_settings(TIME_ZONE="Asia/Kolkata")
+    def test_non_utc_time_zone(self):
+        self.assertSameJSON(ApplicationSerializer, Application.objects.order_by("-applied_at", "-id"))
+
+
+# ---------------------------
+# JSON renderer, parser and compression
+# ---------------------------
+class FastJSONTests(TestCase):
+    payload = {
+        "when": datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        "naive": datetime(2024, 5, 1, 12, 30),
+        "offset": datetime(2024, 5, 1, 12, 30, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        "day": date(2024, 5, 1),
+        "amount": Decimal("12.50"),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "label": gettext_lazy("Pending"),
+        "text": "caf\u00e9 \u2028 \u2029 \U0001f600",
+        1: [None, True, 1.5, (1, 2)],
+    }
+
+    def test_renders_like_drf(self):
+        self.assertEqual(FastJSONRenderer().render(self.payload), JSONRenderer().render(self.payload))
+        big = {"n": 2 ** 70}
+        self.assertEqual(FastJSONRenderer().render(big), JSONRenderer().render(big))
+        self.assertEqual(
+            FastJSONRenderer().render(self.payload, "application/json; indent=2"),
+            JSONRenderer().render(self.payload, "application/json; indent=2"),
+        )
+
+    def test_float_differences_are_the_documented_ones(self):
+        data = {"finite": [0.1, 123456789.0, -2.5, 1e16, 5e-05]}
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(FastJSONRenderer().render(data))), data)
+        self.assertEqual(FastJSONRenderer().render({"n": [0.1, 1e16]}), b'{"n":[0.1,1e16]}')
+        for value in (float("nan"), float("inf"), -float("inf")):
+            with self.subTest(value=value):
+                self.assertEqual(FastJSONRenderer().render({"value": value}), b'{"value":null}')
+
+    def test_lone_surrogates_fail_like_drf(self):
+        for renderer in (JSONRenderer(), FastJSONRenderer()):
+            with self.subTest(renderer=renderer), self.assertRaises(UnicodeEncodeError):
+                renderer.render({"text": "\ud800 x"})
+
+    def test_parses_big_ints_and_lone_surrogates_like_drf(self):
+        for body in (b'{"n": 18446744073709551616}', b'[-9223372036854775809, 1]', b'"\\ud800 x"', b'1e400'):
+            with self.subTest(body=body):
+                self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(b'{"n": 18446744073709551616}')), {"n": 2 ** 64})
+
+    def test_parses_like_drf(self):
+        body = JSONRenderer().render({"a": [1, "\u00e9", None], "b": {"c": 1.5}})
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), {"a": [1, "\u00e9", None], "b": {"c": 1.5}})
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"a": NaN}'))
+
+    @override_settings(RESPONSE_COMPRESSION={"MIN_SIZE": 1024})
+    def test_gzip_above_threshold(self):
+        seed(users=12, companies=2, jobs=40, applications=10, prefix="gz")
+        small = self.client.get("/api/jobs/?page_size=1", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", small)
+        plain = self.client.get("/api/jobs/?page_size=20")
+        self.assertNotIn("Content-Encoding", plain)
+        large = self.client.get("/api/jobs/?page_size=20", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(large["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", large["Vary"])
+        self.assertEqual(gzip.decompress(large.content), plain.content)
+
+
+# ---------------------------
+# Read-replica routing
+# ---------------------------
+@override_settings(DATABASES={**settings.DATABASES, "replica": settings.DATABASES["default"]})
+class ReplicaRoutingTests(SimpleTestCase):
+    def test_reads_use_replica_only_inside_replica_reads(self):
+        router = routers.ReplicaRouter()
+        self.assertIsNone(router.db_for_read(Job))
+        with routers.replica_reads():
+            self.assertEqual(router.db_for_read(Job), routers.REPLICA_ALIAS)
+            self.assertEqual(router.db_for_write(Job), "default")
+        self.assertIsNone(router.db_for_read(Job))
+
+    def test_shared_decorator_is_thread_safe(self):
+        # One decorated handler, entered by two threads at once, like a view method.
+        barrier = threading.Barrier(2, timeout=5)
+        seen, errors = [], []
+
+        @routers.replica_reads()
+        def handler():
+            barrier.wait()
+            seen.append(routers._use_replica.get())
+            barrier.wait()
+
+        def run():
+            try:
+                handler()
+                seen.append(routers._use_replica.get())
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(seen), [False, False, True, True])
+
+
+# ---------------------------
+# Conditional GET
+# ---------------------------
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("cg-recruiter", "Recruiter")
+        cls.seeker = make_user("cg-seeker")
+        cls.job = Job.objects.create(title="Conditional", recruiter=cls.recruiter)
+        cls.apps = [make_application(cls.job, cls.seeker) for _ in range(5)]
+
+    def setUp(self):
+        caches["default"].clear()
+        self.client = auth_client(self.seeker)
+
+    def touch(self, application):
+        Application.objects.filter(pk=application.pk).update(updated_at=django_timezone.now() + timedelta(seconds=5))
+
+    def test_list_etag_304_and_changes(self):
+        first = self.client.get("/api/applications/")
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn("Last-Modified", first)
+        etag = first["ETag"]
+        self.assertEqual(self.client.get("/api/applications/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.touch(self.apps[0])
+        edited = self.client.get("/api/applications/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(edited.status_code, 200)
+        self.assertNotEqual(edited["ETag"], etag)
+
+        # Deleting the oldest row leaves MAX(updated_at) alone but must still change the ETag.
+        Application.objects.filter(pk=self.apps[1].pk).delete()
+        deleted = self.client.get("/api/applications/", HTTP_IF_NONE_MATCH=edited["ETag"])
+        self.assertEqual(deleted.status_code, 200)
+        self.assertEqual(len(deleted.json()["results"]), 4)
+
+    def test_if_modified_since_alone_never_304s_a_list(self):
+        self.assertEqual(
+            self.client.get("/api/applications/", HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT").status_code,
+            200,
+        )
+
+    def test_only_the_requested_page_is_fingerprinted(self):
+        # Newest first: apps[4], apps[3] on page one; apps[2], apps[1] (+ apps[0] as lookahead) on page two.
+        second_url = self.client.get("/api/applications/?page_size=2").json()["next"]
+        second = self.client.get(second_url)
+        self.touch(self.apps[4])
+        with CaptureQueriesContext(connection) as queries:
+            again = self.client.get(second_url, HTTP_IF_NONE_MATCH=second["ETag"])
+        self.assertEqual(again.status_code, 304)
+        self.assertIn("LIMIT 3", queries.captured_queries[0]["sql"])
+
+        self.touch(self.apps[2])
+        self.assertEqual(self.client.get(second_url, HTTP_IF_NONE_MATCH=second["ETag"]).status_code, 200)
+
+    def test_detail_uses_last_modified(self):
+        client = auth_client(self.recruiter)
+        url = f"/api/applications/{self.apps[0].pk}/"
+        first = client.get(url)
+        self.assertIn("Last-Modified", first)
+        self.assertEqual(client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 304)
+        client.patch(url, {"status": "accepted"}, format="json")
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 200)
+
+
+# ---------------------------
+# Job company / tag relations
+# ---------------------------
+class JobRelationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("rel-recruiter", "Recruiter")
+        cls.acme = Company.objects.create(name="Acme")
+        cls.globex = Company.objects.create(name="Globex")
+
+    def test_employer_follows_company_edits(self):
+        job = Job.objects.create(title="Dev", company="Acme", recruiter=self.recruiter, tags="Python, SQL")
+        self.assertEqual(job.employer_id, self.acme.pk)
+        self.assertEqual(sorted(job.tag_set.values_list("name", flat=True)), ["python", "sql"])
+
+        job = Job.objects.get(pk=job.pk)
+        job.company = "Globex"
+        job.save()
+        self.assertEqual(Job.objects.get(pk=job.pk).employer_id, self.globex.pk)
+
+        job.company = "Nobody Inc"
+        job.save()
+        self.assertIsNone(Job.objects.get(pk=job.pk).employer_id)
+
+    def test_explicit_employer_is_kept(self):
+        job = Job.objects.create(title="Dev", company="Acme", recruiter=self.recruiter)
+        job.company = "Globex Europe"
+        job.employer = self.globex
+        job.save()
+        self.assertEqual(Job.objects.get(pk=job.pk).employer_id, self.globex.pk)
+
+    def test_jobs_posted_before_the_company_are_linked(self):
+        client = auth_client(self.recruiter)
+        job_id = client.post("/api/jobs/create/", {"title": "Early", "company": "Initech"}, format="json").json()["id"]
+        response = self.client.post("/api/company/", {"name": "Initech", "industry": "Software"})
+        company_id = response.json()["id"]
+        listed = self.client.get("/api/jobs/", {"company": company_id}).json()["results"]
+        self.assertEqual([job["id"] for job in listed], [job_id])
+
+        # A rename links the jobs posted under the new name
+        Job.objects.create(title="Later", company="Initrode", recruiter=self.recruiter)
+        response = self.client.patch(
+            f"/api/company/{company_id}/", {"name": "Initrode"}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Job.objects.filter(employer_id=company_id).count(), 2)
+
+    def test_tags_are_resynced(self):
+        job = Job.objects.create(title="Dev", recruiter=self.recruiter, tags="python")
+        job.tags = "Go, rust"
+        job.save()
+        self.assertEqual(sorted(job.tag_set.values_list("name", flat=True)), ["go", "rust"])
+        self.assertEqual(list(Job.objects.filter(tag_set__name="python")), [])
+
+
+# ---------------------------
+# Full-text job search
+# ---------------------------
+class JobSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = make_user("search-recruiter", "Recruiter")
+        cls.job = Job.objects.create(
+            title='<img src=x onerror="alert(1)"> Python developer \x02',
+            description="Build <b>python</b> services & APIs",
+            tags="python",
+            recruiter=recruiter,
+        )
+        Job.objects.create(title="Accountant", description="Numbers", recruiter=recruiter)
+
+    def test_highlights_are_escaped_html(self):
+        response = self.client.get("/api/jobs/search/?q=python")
+        self.assertEqual(response.status_code, 200)
+        [result] = response.json()["results"]
+        title = result["highlight"]["title"]
+        self.assertEqual(title, '&lt;img src=x onerror=&quot;alert(1)&quot;&gt; <mark>Python</mark> developer ')
+        description = result["highlight"]["description"]
+        self.assertIn("&lt;b&gt;<mark>python</mark>&lt;/b&gt;", description)
+        self.assertIn("&amp;", description)
+        # The job itself is returned as stored
+        self.assertEqual(result["job"]["title"], self.job.title)
+
+    def test_basic_backend_escapes_too(self):
+        [hit] = BasicSearchBackend().search("python")
+        self.assertTrue(hit.title.startswith("&lt;img"))
+        self.assertNotIn("<b>", hit.snippet)
+
+
+# ---------------------------
+# Application export
+# ---------------------------
+class ApplicationExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("export-recruiter", "Recruiter")
+        seeker = make_user("export-seeker")
+        cls.job = Job.objects.create(title="=HYPERLINK(\"http://x\")", recruiter=cls.recruiter)
+        cls.application = make_application(cls.job, seeker, name="@SUM(1+1)", phone="+44 20", email="-x@example.com")
+
+    def setUp(self):
+        self.client = auth_client(self.recruiter)
+
+    def test_csv_cells_are_not_formulas(self):
+        response = self.client.get("/api/applications/export/?output=csv")
+        self.assertEqual(response.status_code, 200)
+        [header, row] = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+        row = dict(zip(header, row))
+        self.assertEqual(row["job_title"], "'=HYPERLINK(\"http://x\")")
+        self.assertEqual(row["name"], "'@SUM(1+1)")
+        self.assertEqual(row["phone"], "'+44 20")
+        self.assertEqual(row["email"], "'-x@example.com")
+        self.assertEqual(row["id"], str(self.application.pk))
+
+    def test_ndjson_is_left_as_is(self):
+        response = self.client.get("/api/applications/export/?output=ndjson")
+        [line] = b"".join(response.streaming_content).splitlines()
+        self.assertIn(b'"name":"@SUM(1+1)"', line.replace(b" ", b""))
+
+    def test_job_filter_must_be_an_ascii_integer(self):
+        for job in ("²", "٣", "1.0", "", "-1"):
+            with self.subTest(job=job):
+                response = self.client.get("/api/applications/export/", {"job": job})
+                self.assertEqual(response.status_code, 400)
+        response = self.client.get("/api/applications/export/", {"job": str(self.job.pk)})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 2)
+
+
+# ---------------------------
+# Bulk job ingestion
+# ---------------------------
+class BulkJobCreateTests(TestCase):
+    url = "/api/jobs/create/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("bulk-recruiter", "Recruiter")
+        cls.acme = Company.objects.create(name="Acme")
+
+    def setUp(self):
+        self.client = auth_client(self.recruiter)
+
+    def post(self, items, upsert=False):
+        return self.client.post(self.url + ("?upsert=true" if upsert else ""), items, format="json")
+
+    def test_create_only(self):
+        response = self.post([
+            {"title": "A", "external_id": "a-1", "company": "Acme", "tags": "python"},
+            {"title": "B"},
+            {"title": ""},
+        ])
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual((body["created"], body["updated"]), (2, 0))
+        self.assertEqual([error["index"] for error in body["errors"]], [2])
+        job = Job.objects.get(external_id="a-1")
+        self.assertEqual(job.employer_id, self.acme.pk)
+        self.assertEqual(list(job.tag_set.values_list("name", flat=True)), ["python"])
+
+    def test_existing_and_repeated_external_ids_are_item_errors(self):
+        Job.objects.create(title="Old", external_id="dup", recruiter=self.recruiter)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post([{"title": f"Job {i}", "external_id": f"new-{i}"} for i in range(5)] + [
+                {"title": "Taken", "external_id": "dup"},
+                {"title": "Again", "external_id": "new-0"},
+            ])
+        body = response.json()
+        self.assertEqual(body["created"], 5)
+        self.assertEqual([(error["index"], list(error["errors"])) for error in body["errors"]],
+                         [(5, ["external_id"]), (6, ["external_id"])])
+        self.assertEqual(Job.objects.get(external_id="dup").title, "Old")
+        # One lookup for the whole list, not one per item
+        self.assertEqual(sum('"external_id" IN' in query["sql"] for query in queries.captured_queries), 1)
+
+    def test_upsert_updates_and_counts(self):
+        job = Job.objects.create(title="Old", external_id="u-1", recruiter=self.recruiter, tags="go")
+        response = self.post([
+            {"title": "New", "external_id": "u-1", "tags": "rust", "description": "x", "company": "Acme"},
+            {"title": "Fresh", "external_id": "u-2"},
+        ], upsert=True)
+        body = response.json()
+        self.assertEqual((body["created"], body["updated"]), (1, 1))
+        self.assertEqual(body["jobs"][0]["id"], job.pk)
+        job.refresh_from_db()
+        self.assertEqual((job.title, job.employer_id), ("New", self.acme.pk))
+        self.assertEqual(list(job.tag_set.values_list("name", flat=True)), ["rust"])
+
+    def test_partial_upsert_keeps_omitted_fields(self):
+        job = Job.objects.create(
+            title="Old", external_id="p-1", recruiter=self.recruiter, company="Acme",
+            description="Keep me", tags="python", min_salary=100,
+        )
+        response = self.post([{"title": "Renamed", "external_id": "p-1"}], upsert=True)
+        self.assertEqual(response.json()["updated"], 1)
+        job.refresh_from_db()
+        self.assertEqual(job.title, "Renamed")
+        self.assertEqual((job.description, job.tags, job.min_salary, job.company), ("Keep me", "python", 100, "Acme"))
+        self.assertEqual(job.employer_id, self.acme.pk)
+        self.assertEqual(list(job.tag_set.values_list("name", flat=True)), ["python"])
+
+    @override_settings(RECENT_APPLICATIONS_FEED={"BUFFER": True, "SIZE": 3})
+    def test_upsert_refreshes_applicant_feeds(self):
+        caches["default"].clear()
+        self.addCleanup(feeds.buffers.clear)
+        job = Job.objects.create(title="Old", external_id="f-1", recruiter=self.recruiter)
+        seeker = make_user("bulk-seeker")
+        make_application(job, seeker)
+        seeker_client = auth_client(seeker)
+
+        def titles():
+            return [row["title"] for row in seeker_client.get("/api/recent-applications/").json()]
+
+        self.assertEqual(titles(), ["Old"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post([{"title": "Re-imported", "external_id": "f-1"}], upsert=True)
+        self.assertEqual(titles(), ["Re-imported"])
+        self.assertEqual(feeds.recent_applications(self.recruiter)[0]["title"], "Re-imported")
+
+    def test_failure_in_a_later_batch_writes_nothing(self):
+        bulk_create = Job.objects.bulk_create
+        calls = []
+
+        def fail_second_batch(objs, **kwargs):
+            calls.append(len(objs))
+            if len(calls) == 2:
+                raise IntegrityError("boom")
+            return bulk_create(objs, **kwargs)
+
+        with self.settings(BULK_JOB_BATCH_SIZE=2), \
+                mock.patch.object(Job.objects, "bulk_create", side_effect=fail_second_batch):
+            response = self.post([{"title": f"Job {i}"} for i in range(4)])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(calls, [2, 2])
+        self.assertFalse(Job.objects.exists())
+
+
+# ---------------------------
+# Email outbox
+# ---------------------------
+class FailingBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise SMTPException("relay down")
+
+
+class OutboxTests(TestCase):
+    def enqueue(self, count=1):
+        return [
+            outbox.enqueue_mail(f"Subject {i}", f"reset link {i}", "noreply@example.com", [f"u{i}@example.com"])
+            for i in range(count)
+        ]
+
+    def test_sends_through_the_locmem_backend_and_drops_bodies(self):
+        self.enqueue(2)
+        self.assertEqual(outbox.send_batch(), (2, 0))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ["u0@example.com", "u1@example.com"])
+        self.assertEqual(mail.outbox[0].body[:10], "reset link")
+        self.assertEqual(
+            list(OutboundEmail.objects.values_list("status", "attempts", "body").distinct()), [("sent", 1, "")]
+        )
+        self.assertEqual(outbox.send_batch(), (0, 0))
+
+    def test_claims_are_leased(self):
+        self.enqueue(3)
+        config = outbox.get_config()
+        first = outbox.claim_batch(2, config)
+        second = outbox.claim_batch(2, config)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({message.pk for message in first} & {message.pk for message in second})
+        self.assertEqual(outbox.claim_batch(2, config), [])
+
+        # A dead worker's rows come back once the lease runs out, under a new token.
+        OutboundEmail.objects.filter(pk=first[0].pk).update(next_attempt_at=django_timezone.now() - timedelta(seconds=1))
+        [reclaimed] = outbox.claim_batch(2, config)
+        self.assertEqual(reclaimed.pk, first[0].pk)
+        self.assertNotEqual(reclaimed.claim_token, first[0].claim_token)
+
+    @override_settings(EMAIL_OUTBOX={"MAX_ATTEMPTS": 2, "BACKOFF_SECONDS": 30})
+    def test_failures_back_off_then_give_up(self):
+        [message] = self.enqueue()
+        before = django_timezone.now()
+        self.assertEqual(outbox.send_batch(connection=FailingBackend()), (0, 1))
+        message.refresh_from_db()
+        self.assertEqual((message.status, message.attempts), ("pending", 1))
+        self.assertEqual(message.last_error, "SMTPException: relay down")
+        self.assertGreaterEqual(message.next_attempt_at, before + timedelta(seconds=30))
+        # Not due yet
+        self.assertEqual(outbox.send_batch(connection=FailingBackend()), (0, 0))
+
+        OutboundEmail.objects.update(next_attempt_at=before)
+        outbox.send_batch(connection=FailingBackend())
+        message.refresh_from_db()
+        self.assertEqual((message.status, message.attempts), ("failed", 2))
+        self.assertEqual(message.body, "reset link 0")
+
+    def test_backoff_doubles_up_to_the_cap(self):
+        config = {"BACKOFF_SECONDS": 30, "MAX_BACKOFF_SECONDS": 100}
+        self.assertEqual(
+            [outbox.backoff_delay(attempts, config).total_seconds() for attempts in (1, 2, 3, 4)], [30, 60, 100, 100]
+        )
+
+    def test_purge_removes_old_sent_and_failed_rows(self):
+        old, failed, pending, recent = self.enqueue(4)
+        OutboundEmail.objects.filter(pk__in=[old.pk, recent.pk]).update(status="sent")
+        OutboundEmail.objects.filter(pk=failed.pk).update(status="failed")
+        OutboundEmail.objects.filter(pk__in=[old.pk, failed.pk, pending.pk]).update(
+            created_at=django_timezone.now() - timedelta(days=8)
+        )
+        PasswordResetToken.objects.create(
+            user=make_user("purge-a"), expires_at=django_timezone.now() - timedelta(minutes=1)
+        )
+
+        # Each scheduled job purges only its own table
+        call_command("purge_reset_tokens", stdout=io.StringIO())
+        self.assertEqual(OutboundEmail.objects.count(), 4)
+        PasswordResetToken.objects.create(
+            user=make_user("purge-b"), expires_at=django_timezone.now() - timedelta(minutes=1)
+        )
+        out = io.StringIO()
+        call_command("purge_outbox", batch_size=1, stdout=out)
+        self.assertIn("Purged 2 old outbox emails", out.getvalue())
+        self.assertEqual(sorted(OutboundEmail.objects.values_list("pk", flat=True)), [pending.pk, recent.pk])
+        self.assertEqual(PasswordResetToken.objects.count(), 1)
+
+
+# ---------------------------
+# /metrics
+# ---------------------------
+class MetricsEndpointTests(SimpleTestCase):
+    def test_hidden_without_a_token(self):
+        with override_settings(REQUEST_METRICS={"TOKEN": ""}):
+            self.assertEqual(self.client.get("/metrics").status_code, 404)
+
+    @override_settings(REQUEST_METRICS={"TOKEN": "s3cret"})
+    def test_requires_the_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 401)
+        self.assertEqual(self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3crét").status_code, 401)
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"login_hash_seconds_count", response.content)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    LOGIN_HASH_POOL={},
+    REQUEST_METRICS={"SAMPLE_RATE": 1.0, "SERVER_TIMING": True, "TOKEN": "s3cret"},
+)
+class RequestTimingTests(TestCase):
+    def setUp(self):
+        request_metrics.routes.reset()
+
+    def server_timing(self, response):
+        entries = [entry.split(";") for entry in response["Server-Timing"].split(", ")]
+        return {name: params for name, *params in entries}
+
+    def test_server_timing_counts_queries(self):
+        make_user("timing-user")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/jobs/", HTTP_X_METRICS_TOKEN="s3cret")
+        timing = self.server_timing(response)
+        self.assertEqual(list(timing), ["total", "db", "view", "render"])
+        self.assertEqual(timing["db"][1], f'desc="{len(queries.captured_queries)} queries"')
+
+        response = self.client.post(
+            "/api/login/", {"email": "timing-user@example.com", "password": "pass", "role": "Job Seeker"},
+            HTTP_X_METRICS_TOKEN="s3cret",
+        )
+        self.assertIn("hash", self.server_timing(response))
+
+    def test_server_timing_only_for_staff_and_token_holders(self):
+        self.assertNotIn("Server-Timing", self.client.get("/api/jobs/"))
+        self.assertNotIn("Server-Timing", self.client.get("/api/jobs/", HTTP_X_METRICS_TOKEN="wrong"))
+        self.assertNotIn("Server-Timing", auth_client(make_user("timing-seeker")).get("/api/stats/"))
+        staff = make_user("timing-staff", "Admin", is_staff=True)
+        self.assertIn("Server-Timing", auth_client(staff).get("/api/stats/"))
+        # Requests are still recorded for /metrics
+        self.assertEqual(sum(request_metrics.routes.responses.values()), 4)
+
+    def test_off_by_default(self):
+        with override_settings(REQUEST_METRICS={}):
+            self.assertNotIn("Server-Timing", self.client.get("/api/jobs/", HTTP_X_METRICS_TOKEN="s3cret"))
+        self.assertEqual(request_metrics.routes.responses, {})
+
+    def test_routes_are_recorded_by_pattern(self):
+        job = Job.objects.create(title="Timed", recruiter=make_user("timing-recruiter", "Recruiter"))
+        self.client.get(f"/api/jobs/{job.id}/")
+        self.client.get("/api/jobs/0/")
+        body = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret").content.decode()
+        route = 'route="api/jobs/<int:pk>/",method="GET"'
+        self.assertIn(f'http_requests_total{{{route},status="200"}} 1', body)
+        self.assertIn(f'http_requests_total{{{route},status="404"}} 1', body)
+        self.assertIn(f'http_request_phase_seconds_count{{phase="db",{route}}} 2', body)
+
+    def test_unsampled_and_header_off(self):
+        with override_settings(REQUEST_METRICS={"SAMPLE_RATE": 0, "SERVER_TIMING": True, "TOKEN": "s3cret"}):
+            self.assertNotIn("Server-Timing", self.client.get("/api/jobs/", HTTP_X_METRICS_TOKEN="s3cret"))
+        self.assertEqual(request_metrics.routes.responses, {})
+        with override_settings(REQUEST_METRICS={"SAMPLE_RATE": 1.0, "TOKEN": "s3cret"}):
+            self.assertNotIn("Server-Timing", self.client.get("/api/jobs/", HTTP_X_METRICS_TOKEN="s3cret"))
+        self.assertEqual(sum(request_metrics.routes.responses.values()), 1)
+
+
+# ---------------------------
+# Token claims and revocation
+# ---------------------------
+class TokenRevocationTests(TestCase):
+    def setUp(self):
+        caches[settings.JWT_REVOCATION_CACHE].clear()
+        self.user = make_user("claims-user")
+        self.client = auth_client(self.user)
+
+    def profile_completion(self):
+        return self.client.get("/api/profile-completion/")
+
+    def test_claims_are_served_without_a_user_query(self):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {issue_access_token(self.user)}")
+        with self.assertNumQueries(0):
+            user, _ = ClaimsJWTAuthentication().authenticate(request)
+        self.assertEqual((user.id, user.email, user.role), (self.user.pk, self.user.email, "Job Seeker"))
+
+    def test_changing_any_claim_revokes_tokens(self):
+        for field, value in (("email", "new@example.com"), ("role", "Recruiter"), ("is_active", False)):
+            with self.subTest(field=field):
+                caches[settings.JWT_REVOCATION_CACHE].clear()
+                self.client = auth_client(self.user)
+                self.assertEqual(self.profile_completion().status_code, 200)
+                user = User.objects.get(pk=self.user.pk)
+                setattr(user, field, value)
+                with self.captureOnCommitCallbacks(execute=True):
+                    user.save()
+                self.assertEqual(self.profile_completion().status_code, 401)
+
+    def test_unrelated_saves_keep_tokens(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.last_login = django_timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        self.assertEqual(self.profile_completion().status_code, 200)
+
+    def test_finishing_the_profile_keeps_the_session(self):
+        self.assertEqual(self.profile_completion().json()["profile_complete"], False)
+        user = User.objects.get(pk=self.user.pk)
+        user.profile_complete = True
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        response = self.profile_completion()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["profile_complete"], True)
+        self.assertEqual(self.client.get(reverse("async-profile-completion")).json()["profile_complete"], True)
+
+    def test_per_process_revocation_cache_warns_on_deploy_checks(self):
+        with override_settings(JWT_REVOCATION_CACHE="default"):
+            [warning] = checks.check_revocation_cache(None)
+            self.assertEqual(warning.id, "loginapi.W001")
+            self.assertNotIn(warning, run_checks())
+            self.assertIn(warning, run_checks(include_deployment_checks=True))
+        with override_settings(JWT_REVOCATION_CACHE="files"):
+            self.assertEqual(checks.check_revocation_cache(None), [])
+
+
+# ---------------------------
+# Recent applications ring buffers
+# ---------------------------
+@override_settings(RECENT_APPLICATIONS_FEED={"BUFFER": True, "SIZE": 3})
+class RecentFeedBufferTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("feed-recruiter", "Recruiter")
+        cls.seeker = make_user("feed-seeker")
+        cls.job = Job.objects.create(title="Old title", recruiter=cls.recruiter)
+
+    def setUp(self):
+        feeds.buffers.clear()
+        self.addCleanup(feeds.buffers.clear)
+
+    def titles(self, user):
+        return [row["title"] for row in feeds.recent_applications(user)]
+
+    def test_new_applications_are_pushed_onto_warm_buffers(self):
+        self.assertEqual(self.titles(self.seeker), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            make_application(self.job, self.seeker)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.titles(self.seeker), ["Old title"])
+
+    def test_change_during_a_load_is_not_lost(self):
+        config = feeds.get_config()
+
+        def load_then_race():
+            rows = feeds.load_recent_applications(self.seeker)
+            # An application committed after the query pushes while the load is in flight.
+            feeds.buffers.push([self.seeker.id], {"title": "Raced"})
+            return rows
+
+        self.assertEqual(feeds.buffers.get(self.seeker.id, load_then_race, config), [])
+        self.assertIsNone(feeds.buffers.peek(self.seeker.id, config))
+        self.assertEqual(feeds.buffers.get(self.seeker.id, lambda: [{"title": "Fresh"}], config), [{"title": "Fresh"}])
+        self.assertEqual(feeds.buffers.peek(self.seeker.id, config), [{"title": "Fresh"}])
+
+    def test_job_edits_and_deletes_discard_buffers(self):
+        make_application(self.job, self.seeker)
+        self.assertEqual(self.titles(self.seeker), ["Old title"])
+        self.assertEqual(self.titles(self.recruiter), ["Old title"])
+
+        job = Job.objects.get(pk=self.job.pk)
+        job.title = "New title"
+        with self.captureOnCommitCallbacks(execute=True):
+            job.save()
+        self.assertEqual(self.titles(self.seeker), ["New title"])
+        self.assertEqual(self.titles(self.recruiter), ["New title"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.delete()
+        self.assertEqual(self.titles(self.seeker), [])
+        self.assertEqual(self.titles(self.recruiter), [])
+
+
+# ---------------------------
+# Resume blob garbage collection
+# ---------------------------
+class ResumeBlobGCTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+
+    def orphan(self, content):
+        name = resume_storage.save("resumes/cv.pdf", ContentFile(content))
+        two_days_ago = django_timezone.now() - timedelta(days=2)
+        ResumeBlob.objects.filter(name=name).update(created_at=two_days_ago, last_used_at=two_days_ago)
+        return ResumeBlob.objects.get(name=name)
+
+    def gc(self, *args):
+        call_command("gc_resume_blobs", *args, stdout=io.StringIO())
+
+    def test_file_goes_only_after_the_row_delete_commits(self):
+        blob = self.orphan(b"old resume")
+        self.gc("--dry-run")
+        self.assertTrue(resume_storage.exists(blob.name))
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.gc()
+        self.assertFalse(ResumeBlob.objects.filter(pk=blob.pk).exists())
+        self.assertTrue(resume_storage.exists(blob.name))
+        for callback in callbacks:
+            callback()
+        self.assertFalse(resume_storage.exists(blob.name))
+
+    def test_blob_referenced_after_listing_is_kept(self):
+        blob = self.orphan(b"reused resume")
+        orphans = ResumeBlob.objects.filter(ref_count__lte=0)
+        # Another upload of the same content gets attached before the delete runs.
+        ResumeBlob.objects.filter(pk=blob.pk).update(ref_count=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(GCResumeBlobs.delete_blob(orphans, blob))
+        self.assertTrue(ResumeBlob.objects.filter(pk=blob.pk).exists())
+        self.assertTrue(resume_storage.exists(blob.name))
+
+    def test_reupload_renews_an_old_orphan(self):
+        blob = self.orphan(b"uploaded again")
+        cutoff = django_timezone.now() - timedelta(days=1)
+        orphans = ResumeBlob.objects.filter(ref_count__lte=0, last_used_at__lt=cutoff)
+        # The same content arrives after gc listed the blob, before its application commits.
+        self.assertEqual(resume_storage.save("resumes/again.pdf", ContentFile(b"uploaded again")), blob.name)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(GCResumeBlobs.delete_blob(orphans, blob))
+            self.gc()
+        self.assertTrue(ResumeBlob.objects.filter(pk=blob.pk).exists())
+        self.assertTrue(resume_storage.exists(blob.name))
+
+    def test_referenced_and_recent_blobs_are_kept(self):
+        referenced = self.orphan(b"in use")
+        recruiter, seeker = make_user("gc-recruiter", "Recruiter"), make_user("gc-seeker")
+        make_application(Job.objects.create(title="GC", recruiter=recruiter), seeker, resume=referenced.name)
+        recent = resume_storage.save("resumes/new.pdf", ContentFile(b"just uploaded"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gc()
+        self.assertEqual(sorted(ResumeBlob.objects.values_list("name", flat=True)), sorted([referenced.name, recent]))
+
+
+# ---------------------------
+# Keyset-paginated job search
+# ---------------------------
+class JobListPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = make_user("keyset-recruiter", "Recruiter")
+        cls.jobs = [
+            Job.objects.create(title=f"Job {i}", recruiter=recruiter, is_remote=i % 2 == 0, min_salary=i, max_salary=i)
+            for i in range(7)
+        ]
+        # Ties on created_at are broken by id
+        cls.created = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        Job.objects.filter(pk__in=[job.pk for job in cls.jobs[:5]]).update(created_at=cls.created)
+
+    def walk(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [job["id"] for job in response.json()["results"]]
+            url = response.json()["next"]
+        return ids
+
+    def test_pages_cover_every_job_once_in_order(self):
+        newest, tied = self.jobs[5:], self.jobs[:5]
+        expected = [job.pk for job in reversed(newest)] + [job.pk for job in reversed(tied)]
+        self.assertEqual(self.walk("/api/jobs/?page_size=2"), expected)
+
+    def test_filters_apply_across_pages(self):
+        self.assertEqual(
+            self.walk("/api/jobs/?page_size=1&is_remote=true&min_salary=2"),
+            [job.pk for job in reversed(self.jobs) if job.is_remote and job.max_salary >= 2],
+        )
+        self.assertEqual(self.client.get("/api/jobs/?min_salary=5&max_salary=1").status_code, 400)
+
+    def test_cursor_round_trip(self):
+        pagination = KeysetPagination()
+        cursor = pagination.encode_cursor({"created_at": self.created, "id": 42})
+        self.assertNotIn("=", cursor)
+        request = Request(APIRequestFactory().get("/api/jobs/", {"cursor": cursor}))
+        self.assertEqual(pagination.decode_cursor(request), (self.created, 42))
+
+    def test_bad_cursors_are_404(self):
+        for cursor in ("not-base64!", "e30", "WzEsMiwzXQ", "WyJub3QgYSBkYXRlIiwgMV0"):
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.get("/api/jobs/", {"cursor": cursor}).status_code, 404)
+
+
+# ---------------------------
+# Dashboard stats and counters
+# ---------------------------
+class DashboardStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("stats-recruiter", "Recruiter")
+        cls.seeker = make_user("stats-seeker")
+        cls.admin = make_user("stats-admin", "Admin")
+        cls.job = Job.objects.create(title="Stats", recruiter=cls.recruiter)
+        Job.objects.create(title="Stats 2", recruiter=cls.recruiter)
+        for status in ("pending", "accepted", "rejected", "pending"):
+            make_application(cls.job, cls.seeker, status=status)
+
+    def totals(self, user):
+        return {row["title"]: row["value"] for row in stats.dashboard_stats(user)}
+
+    def test_role_totals_in_one_query(self):
+        with self.assertNumQueries(1):
+            seeker = self.totals(self.seeker)
+        self.assertEqual(seeker, {"Jobs Applied": 4, "Accepted": 1, "Rejected": 1, "Pending": 2})
+        with self.assertNumQueries(1):
+            recruiter = self.totals(self.recruiter)
+        self.assertEqual(recruiter, {"Jobs Posted": 2, "Applicants": 4, "Pending Applications": 2})
+        with self.assertNumQueries(1):
+            admin = self.totals(self.admin)
+        self.assertEqual(admin, {"Total Jobs": 2, "Total Users": 3, "Total Applications": 4})
+
+    def test_counters_match_the_aggregates_after_changes(self):
+        with override_settings(STATS_USE_COUNTERS=True):
+            self.totals(self.seeker), self.totals(self.recruiter)  # build the counter rows
+            application = Application.objects.filter(status="pending").first()
+            application.status = "accepted"
+            application.save()
+            make_application(self.job, self.seeker, status="rejected")
+            Application.objects.filter(status="accepted").first().delete()
+            Job.objects.create(title="Stats 3", recruiter=self.recruiter)
+            with self.assertNumQueries(1):
+                counted = self.totals(self.seeker)
+            counted_recruiter = self.totals(self.recruiter)
+        self.assertEqual(counted, self.totals(self.seeker))
+        self.assertEqual(counted_recruiter, self.totals(self.recruiter))
+        self.assertEqual(counted, {"Jobs Applied": 4, "Accepted": 1, "Rejected": 2, "Pending": 1})
+
+    def test_change_during_the_first_count_is_kept(self):
+        count_seeker = stats.seeker_totals
+
+        def racing_totals(user_id):
+            totals = count_seeker(user_id)
+            # Another request applies after the totals were read, before they are stored.
+            make_application(self.job, self.seeker)
+            return totals
+
+        with override_settings(STATS_USE_COUNTERS=True), mock.patch.object(stats, "seeker_totals", racing_totals):
+            stats.refresh_counters(self.seeker.pk)
+        counter = DashboardCounter.objects.get(user_id=self.seeker.pk)
+        self.assertEqual((counter.applications_sent, counter.pending), (5, 3))
+
+
+# ---------------------------
+# Dashboard response cache
+# ---------------------------
+class DashboardCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("cache-recruiter", "Recruiter")
+        cls.seeker = make_user("cache-seeker")
+        cls.admin = make_user("cache-admin", "Admin")
+        cls.job = Job.objects.create(title="Cached", recruiter=cls.recruiter)
+
+    def setUp(self):
+        caches["default"].clear()
+
+    def get(self, user):
+        response = auth_client(user).get("/api/stats/")
+        return response["X-Cache"], {row["title"]: row["value"] for row in response.json()}
+
+    def test_hits_until_a_change_commits(self):
+        self.assertEqual(self.get(self.seeker), ("MISS", {"Jobs Applied": 0, "Accepted": 0, "Rejected": 0, "Pending": 0}))
+        self.assertEqual(self.get(self.admin)[0], "MISS")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(self.seeker)[0], "HIT")
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            make_application(self.job, self.seeker)
+        # Not invalidated before the commit
+        self.assertEqual(self.get(self.seeker)[0], "HIT")
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.get(self.seeker), ("MISS", {"Jobs Applied": 1, "Accepted": 0, "Rejected": 0, "Pending": 1}))
+        self.assertEqual(self.get(self.admin)[1]["Total Applications"], 1)
+        self.assertEqual(self.get(self.recruiter)[1]["Applicants"], 1)
+
+    def test_other_users_keep_their_entries(self):
+        other = make_user("cache-other")
+        self.get(other)
+        with self.captureOnCommitCallbacks(execute=True):
+            make_application(self.job, self.seeker)
+        self.assertEqual(self.get(other)[0], "HIT")
+
+    def test_editing_a_job_refreshes_its_applicants(self):
+        make_application(self.job, self.seeker)
+        client = auth_client(self.seeker)
+        client.get("/api/recent-applications/")
+        self.assertEqual(client.get("/api/recent-applications/")["X-Cache"], "HIT")
+        self.job.title = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.save()
+        response = client.get("/api/recent-applications/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()[0]["title"], "Renamed")
+
+
+# ---------------------------
+# Application list projection
+# ---------------------------
+class ApplicationListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("list-recruiter", "Recruiter")
+        other_recruiter = make_user("list-other", "Recruiter")
+        cls.seeker = make_user("list-seeker")
+        cls.mine = make_application(Job.objects.create(title="Mine", recruiter=cls.recruiter), cls.seeker)
+        make_application(Job.objects.create(title="Theirs", recruiter=other_recruiter), cls.seeker)
+
+    def test_fields_projects_output_and_sql(self):
+        client = auth_client(self.seeker)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/api/applications/?fields=id,status")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([sorted(row) for row in response.json()["results"]], [["id", "status"]] * 2)
+        for query in queries.captured_queries:
+            self.assertNotIn("cover_letter", query["sql"])
+
+    def test_unknown_fields_are_rejected(self):
+        response = auth_client(self.seeker).get("/api/applications/?fields=id,password")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("password", response.json()["fields"])
+
+    def test_lists_are_scoped_to_the_caller(self):
+        response = auth_client(self.recruiter).get("/api/applications/all/?fields=id")
+        self.assertEqual(response.json()["results"], [{"id": self.mine.pk}])
+        self.assertEqual(len(auth_client(self.seeker).get("/api/applications/all/").json()["results"]), 2)
+
+
+# ---------------------------
+# Password reset tokens
+# ---------------------------
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class PasswordResetTokenTests(TestCase):
+    def setUp(self):
+        self.user = make_user("reset-user")
+
+    def test_one_live_token_per_user(self):
+        first = PasswordResetToken.issue_for(self.user)
+        second = PasswordResetToken.issue_for(self.user)
+        self.assertEqual(list(PasswordResetToken.objects.values_list("token", flat=True)), [second.token])
+        self.assertNotEqual(first.token, second.token)
+
+    def test_forgot_then_reset(self):
+        self.assertEqual(self.client.post("/api/forgot-password/", {"email": self.user.email}).status_code, 200)
+        self.client.post("/api/forgot-password/", {"email": self.user.email})
+        token = PasswordResetToken.objects.get(user=self.user).token
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+        self.assertIn(str(token), OutboundEmail.objects.latest("id").body)
+
+        response = self.client.post("/api/reset-password/", {
+            "token": token, "new_password": "n3w-Passw0rd!", "confirm_password": "n3w-Passw0rd!",
+        })
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("n3w-Passw0rd!"))
+        self.assertFalse(PasswordResetToken.objects.exists())
+
+    def test_expired_tokens_are_refused_and_purged(self):
+        token = PasswordResetToken.issue_for(self.user).token
+        PasswordResetToken.objects.update(expires_at=django_timezone.now() - timedelta(seconds=1))
+        response = self.client.post("/api/reset-password/", {
+            "token": token, "new_password": "n3w-Passw0rd!", "confirm_password": "n3w-Passw0rd!",
+        })
+        self.assertEqual(response.json(), {"error": "Invalid or expired token"})
+
+        for i in range(4):
+            PasswordResetToken.objects.create(
+                user=make_user(f"reset-{i}"), expires_at=django_timezone.now() - timedelta(minutes=i + 1)
+            )
+        out = io.StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command("purge_reset_tokens", batch_size=2, stdout=out)
+        self.assertFalse(PasswordResetToken.objects.exists())
+        self.assertIn("Purged 5 expired reset tokens", out.getvalue())
+        # Three bounded batches of DELETEs
+        table = PasswordResetToken._meta.db_table
+        deletes = [query for query in queries.captured_queries if query["sql"].startswith(f'DELETE FROM "{table}"')]
+        self.assertEqual(len(deletes), 3)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"], LOGIN_HASH_POOL={})
+class LoginHashingTests(TestCase):
+    def setUp(self):
+        self.user = make_user("hash-user")
+        hashing.metrics.reset()
+
+    def saturated_executor(self):
+        """A one-worker, no-queue pool whose only slot is held until the test ends."""
+        executor = hashing.BoundedExecutor(workers=1, queue_size=0)
+        started, release = threading.Event(), threading.Event()
+        worker = threading.Thread(target=executor.run, args=(lambda: (started.set(), release.wait(5)),))
+        worker.start()
+        self.addCleanup(worker.join)
+        self.addCleanup(release.set)
+        self.assertTrue(started.wait(5))
+        return executor
+
+    def test_incomplete_login_skips_hashing(self):
+        with mock.patch.object(hashing, "authenticate") as authenticate:
+            response = self.client.post("/api/login/", {"email": self.user.email, "password": "pass"})
+        self.assertEqual(response.status_code, 400)
+        authenticate.assert_not_called()
+        self.assertEqual(hashing.metrics.snapshot()["count"], 0)
+
+    def test_login_is_timed(self):
+        response = self.client.post("/api/login/", {"email": self.user.email, "password": "pass", "role": "Job Seeker"})
+        self.assertEqual(response.status_code, 200)
+        snapshot = hashing.metrics.snapshot()
+        self.assertEqual(snapshot["count"], 1)
+        self.assertEqual(snapshot["buckets"][str(hashing.BUCKETS[-1])], 1)
+
+    def test_saturated_pool_fails_fast(self):
+        executor = self.saturated_executor()
+        with self.assertRaises(hashing.PoolFull):
+            executor.run(lambda: None)
+
+        with mock.patch.object(hashing, "get_executor", return_value=executor):
+            response = self.client.post(
+                "/api/login/", {"email": self.user.email, "password": "pass", "role": "Job Seeker"}
+            )
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertEqual(hashing.metrics.snapshot()["rejected"], 1)
+
+    def test_slot_is_released_after_each_call(self):
+        executor = hashing.BoundedExecutor(workers=1, queue_size=0)
+        for value in range(3):
+            self.assertEqual(executor.run(lambda v=value: v), value)
+        with self.assertRaises(ZeroDivisionError):
+            executor.run(lambda: 1 / 0)
+        self.assertIsNone(executor.run(lambda: None))
+
+
+# ---------------------------
+# Batch application status
+# ---------------------------
+class ApplicationBatchStatusTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("batch-recruiter", "Recruiter")
+        cls.seeker = make_user("batch-seeker")
+        cls.job = Job.objects.create(title="Batch", recruiter=cls.recruiter)
+        other_job = Job.objects.create(title="Not mine", recruiter=make_user("batch-other", "Recruiter"))
+        cls.mine = [make_application(cls.job, cls.seeker, status=status) for status in ("pending", "pending", "accepted")]
+        cls.foreign = make_application(other_job, cls.seeker)
+
+    def post(self, user, ids, new_status="Accepted"):
+        return auth_client(user).post(
+            "/api/applications/batch-status/", {"ids": ids, "status": new_status}, format="json"
+        )
+
+    def test_one_update_for_the_owned_rows(self):
+        ids = [application.id for application in self.mine] + [self.foreign.id, 999999]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(self.recruiter, ids)
+        self.assertEqual(response.json(), {"updated": 2, "rejected_ids": sorted([self.foreign.id, 999999])})
+        table = Application._meta.db_table
+        updates = [query for query in queries.captured_queries if query["sql"].startswith(f'UPDATE "{table}"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(Application.objects.filter(job=self.job).values_list("status", flat=True).distinct()), ["accepted"]
+        )
+        self.assertEqual(Application.objects.get(pk=self.foreign.pk).status, "pending")
+
+    def test_seekers_and_bad_input_are_refused(self):
+        self.assertEqual(self.post(self.seeker, [self.mine[0].id]).status_code, 403)
+        self.assertEqual(self.post(self.recruiter, [self.mine[0].id], "hired").status_code, 400)
+        self.assertEqual(self.post(self.recruiter, []).status_code, 400)
+        self.assertFalse(Application.objects.filter(status="hired").exists())
+
+    def test_counters_and_cache_follow_the_update(self):
+        caches["default"].clear()
+        with override_settings(STATS_USE_COUNTERS=True):
+            stats.dashboard_stats(self.seeker), stats.dashboard_stats(self.recruiter)  # build the counter rows
+            auth_client(self.seeker).get("/api/stats/")
+            with self.captureOnCommitCallbacks(execute=True):
+                self.post(self.recruiter, [application.id for application in self.mine], "rejected")
+            seeker = {row["title"]: row["value"] for row in stats.dashboard_stats(self.seeker)}
+            recruiter = {row["title"]: row["value"] for row in stats.dashboard_stats(self.recruiter)}
+            response = auth_client(self.seeker).get("/api/stats/")
+        self.assertEqual(seeker, {"Jobs Applied": 4, "Accepted": 0, "Rejected": 3, "Pending": 1})
+        self.assertEqual(recruiter["Pending Applications"], 0)
+        self.assertEqual(response["X-Cache"], "MISS")
+
+
+# ---------------------------
+# Company onboarding writes
+# ---------------------------
+class CompanyOnboardingTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Acme", industry="Tools")
+        self.url = f"/api/company/{self.company.id}/"
+
+    def test_etag_round_trip_and_stale_if_match(self):
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        self.assertEqual(etag, onboarding.company_etag(self.company))
+
+        response = self.client.patch(
+            self.url, {"founder_name": "Ada"}, content_type="application/json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["version"], 2)
+
+        # A second writer still holding the first ETag
+        response = self.client.patch(
+            self.url, {"founder_name": "Bob"}, content_type="application/json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(Company.objects.get(pk=self.company.pk).founder_name, "Ada")
+
+    def test_only_changed_columns_are_written(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                self.url, {"name": "Acme", "headquarters": "Oslo"}, content_type="application/json"
+            )
+        self.assertEqual(response.status_code, 200)
+        (update,) = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertIn('"headquarters"', update)
+        self.assertNotIn('"name"', update)
+
+        # Nothing changed: no UPDATE and no new version
+        with CaptureQueriesContext(connection) as queries:
+            self.client.patch(self.url, {"headquarters": "Oslo"}, content_type="application/json")
+        self.assertFalse([query for query in queries.captured_queries if query["sql"].startswith("UPDATE")])
+        self.assertEqual(Company.objects.get(pk=self.company.pk).version, 2)
+
+    def test_concurrent_write_is_a_conflict(self):
+        def racing_save(company, data, expected_version=None):
+            Company.objects.filter(pk=company.pk).update(version=company.version + 1, twitter="https://x.com/acme")
+            return onboarding.save_company_changes(company, data, expected_version)
+
+        with mock.patch("loginapi.views.save_company_changes", racing_save):
+            response = self.client.patch(self.url, {"twitter": "https://x.com/other"}, content_type="application/json")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Company.objects.get(pk=self.company.pk).twitter, "https://x.com/acme")
+
+    def test_malformed_if_match_is_refused(self):
+        response = self.client.patch(
+            self.url, {"phone": "123"}, content_type="application/json", HTTP_IF_MATCH='"nonsense"'
+        )
+        self.assertEqual(response.status_code, 412)
+        self.assertIsNone(onboarding.parse_if_match("*"))
+
+
+# ---------------------------
+# Job search facets
+# ---------------------------
+class JobFacetsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("facets-recruiter", "Recruiter")
+        for job_type, country, min_salary, max_salary in [
+            ("Full Time", "NO", 24999, 25000),
+            ("Full Time", "NO", 60000, 250000),
+            ("Part Time", "SE", None, 75000),
+            ("Full Time", "SE", 0, None),
+        ]:
+            Job.objects.create(
+                title=job_type, recruiter=cls.recruiter, job_type=job_type, location_country=country,
+                min_salary=min_salary, max_salary=max_salary,
+            )
+
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_counts_and_histograms_per_facet(self):
+        # One GROUP BY per facet column plus one aggregate for the histograms
+        with self.assertNumQueries(len(facets.FACET_FIELDS) + 1):
+            data = facets.compute_facets(Job.objects.all())
+        self.assertEqual(data["count"], 4)
+        self.assertEqual(data["facets"]["job_type"], [
+            {"value": "Full Time", "count": 3}, {"value": "Part Time", "count": 1},
+        ])
+        self.assertEqual(data["facets"]["location_country"], [{"value": "NO", "count": 2}, {"value": "SE", "count": 2}])
+        self.assertEqual(data["facets"]["is_remote"], [{"value": False, "count": 4}])
+        # Bucket edges are lower-inclusive; NULL salaries are left out
+        self.assertEqual([bucket["count"] for bucket in data["salary"]["min_salary"]], [2, 0, 1, 0, 0, 0, 0])
+        self.assertEqual([bucket["count"] for bucket in data["salary"]["max_salary"]], [0, 1, 0, 1, 0, 0, 1])
+        self.assertEqual(data["salary"]["max_salary"][-1], {"from": 200000, "to": None, "count": 1})
+
+    def test_cached_per_filter_until_a_job_changes(self):
+        facets.counters.reset()
+        dashboard_cache.counters.reset()
+        response = self.client.get("/api/jobs/facets/", {"location_country": "SE"})
+        self.assertEqual((response["X-Cache"], response.json()["count"]), ("MISS", 2))
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/jobs/facets/", {"location_country": "SE"})["X-Cache"], "HIT")
+        self.assertEqual(self.client.get("/api/jobs/facets/")["X-Cache"], "MISS")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Job.objects.create(title="New", recruiter=self.recruiter, location_country="SE")
+        response = self.client.get("/api/jobs/facets/", {"location_country": "SE"})
+        self.assertEqual((response["X-Cache"], response.json()["count"]), ("MISS", 3))
+        self.assertEqual((facets.counters.hits, facets.counters.misses), (1, 3))
+        self.assertEqual((dashboard_cache.counters.hits, dashboard_cache.counters.misses), (0, 0))
+
+    def test_invalid_filters_are_refused(self):
+        response = self.client.get("/api/jobs/facets/", {"min_salary": 10, "max_salary": 5})
+        self.assertEqual(response.status_code, 400)
+
+
+# ---------------------------
+# Async read endpoints
+# ---------------------------
+class AsyncViewTests(TestCase):
+    # async URL name -> the sync endpoint it mirrors
+    TWINS = {
+        "async-stats": "stats",
+        "async-profile-completion": "profile-completion",
+        "async-recent-applications": "recent-applications",
+        "async-applications": "applications",
+        "async-all-applications": "all-applications",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("async-recruiter", "Recruiter")
+        cls.seeker = make_user("async-seeker")
+        job = Job.objects.create(title="Async", recruiter=cls.recruiter)
+        for status in ("pending", "accepted", "pending"):
+            make_application(job, cls.seeker, status=status)
+
+    def setUp(self):
+        caches["default"].clear()
+        feeds.buffers.clear()
+
+    def test_responses_match_the_sync_views(self):
+        for user in (self.seeker, self.recruiter):
+            client = auth_client(user)
+            for async_name, sync_name in self.TWINS.items():
+                with self.subTest(user=user.username, view=async_name):
+                    expected = client.get(reverse(sync_name), {"page_size": 2})
+                    response = client.get(reverse(async_name), {"page_size": 2})
+                    self.assertEqual(response.status_code, expected.status_code)
+                    data, expected = response.json(), expected.json()
+                    if isinstance(data, dict) and "next" in data:
+                        # Same cursor, on the async URL
+                        cursor = (data.pop("next") or "").partition("?")[2]
+                        self.assertEqual(cursor, (expected.pop("next") or "").partition("?")[2])
+                    self.assertEqual(data, expected)
+
+    def test_errors_are_json(self):
+        response = self.client.get(reverse("async-stats"))
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["WWW-Authenticate"], 'Bearer realm="api"')
+        self.assertIn("detail", response.json())
+        self.assertEqual(auth_client(self.seeker).post(reverse("async-stats")).status_code, 405)
+
+
+# ---------------------------
+# Seeding and endpoint benchmarks
+# ---------------------------
+class SeedAndBenchmarkTests(TestCase):
+    def test_seed_counts_and_side_tables(self):
+        counts = seed(users=20, companies=2, jobs=15, applications=40, prefix="sd", batch_size=7)
+        self.assertEqual(counts, {"users": 20, "companies": 2, "jobs": 15, "applications": 40})
+        self.assertEqual(User.objects.filter(email__startswith="sd-", role="Recruiter").count(), 2)
+        self.assertFalse(Job.objects.filter(employer=None).exists())
+        self.assertFalse(Job.objects.filter(tag_set=None).exists())
+        self.assertTrue(BasicSearchBackend().search("engineer", limit=5))
+        user = User.objects.get(email="sd-3@example.com")
+        self.assertTrue(user.check_password(SEED_PASSWORD))
+
+        with self.assertRaisesMessage(CommandError, "already exist"):
+            call_command("seed_data", prefix="sd", stdout=io.StringIO())
+
+    def test_same_random_seed_same_data(self):
+        def snapshot(prefix):
+            with transaction.atomic():
+                seed(users=12, companies=2, jobs=8, applications=20, prefix=prefix)
+                rows = list(Job.objects.order_by("id").values_list("title", "min_salary", "tags", "location_city"))
+                transaction.set_rollback(True)
+            return rows
+
+        self.assertEqual(snapshot("sa"), snapshot("sb"))
+
+    def test_benchmark_report(self):
+        self.assertEqual([percentile([1, 2, 3, 4], fraction) for fraction in (0.5, 0.99)], [2, 4])
+        self.assertIsNone(percentile([], 0.5))
+        with self.assertRaises(CommandError):
+            call_command("bench_endpoints", prefix="missing", stdout=io.StringIO())
+
+        seed(users=12, companies=2, jobs=8, applications=20, prefix="bm")
+        # The command quiets django.request for the rest of the process
+        request_logger = logging.getLogger("django.request")
+        self.addCleanup(request_logger.setLevel, request_logger.level)
+        out = io.StringIO()
+        call_command("bench_endpoints", prefix="bm", requests=2, warmup=0, only=["jobs-list", "stats"], stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(set(report["endpoints"]), {"jobs-list", "stats"})
+        self.assertEqual(report["endpoints"]["stats"]["status_codes"], {"200": 2})
+        self.assertEqual(report["endpoints"]["jobs-list"]["requests"], 2)
+        self.assertIn("signup", report["unbenchmarked"])
+        self.assertEqual(report["meta"]["dataset"]["jobs"], 8)
+        self.assertNotIn("throughput_rps", report["endpoints"]["stats"])
+
+    def test_benchmark_uploads_are_cleaned_up(self):
+        seed(users=6, companies=1, jobs=2, applications=2, prefix="bm")
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+        report = EndpointBenchmark(
+            Fixtures.load("bm"), requests=2, warmup=0, routes={"apply-job": ROUTES["apply-job"]}
+        ).run()
+        self.assertEqual(report["endpoints"]["apply-job"]["status_codes"], {"201": 2})
+        self.assertEqual(list(Path(media.name).rglob("*")), [])
+        self.assertEqual(settings.MEDIA_ROOT, media.name)
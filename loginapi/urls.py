@@ -1,19 +1,24 @@
 from django.urls import path
-from .views import StatsAPIView, ProfileCompletionAPIView, RecentApplicationsAPIView
+from .views import StatsAPIView, ProfileCompletionAPIView, RecentApplicationsAPIView, DashboardCacheStatsAPIView, HashMetricsAPIView
 from .views import SignupView, LoginView, ApplicationView, AllApplicationsView, ApplicationDetailView, ForgotPasswordView, ResetPasswordView
+from .views import ApplicationExportView, ApplicationBatchStatusView, LogoutView
 from .views import (
     CompanyInfoView,
     FoundingInfoView,
     SocialMediaView,
     ContactInfoView,
-    CompanyCompleteView
+    CompanyCompleteView,
+    CompanyOnboardingView,
+    CompanyOnboardingCreateView,
 )
-from .views import JobCreateAPIView
+from . import async_views
+from .views import JobCreateAPIView, JobDetailAPIView, JobFacetsAPIView, JobListAPIView, JobSearchAPIView
 
 urlpatterns = [
     # Auth
     path("signup/", SignupView.as_view(), name="signup"),
     path("login/", LoginView.as_view(), name="login"),
+    path("logout/", LogoutView.as_view(), name="logout"),
     path('forgot-password/', ForgotPasswordView.as_view(), name='forgot-password'),
     path('reset-password/', ResetPasswordView.as_view(), name='reset-password'),
 
@@ -23,6 +28,8 @@ urlpatterns = [
 
     # Applications (Recruiter/Admin)
     path("applications/all/", AllApplicationsView.as_view(), name="all-applications"),  # View all
+    path("applications/batch-status/", ApplicationBatchStatusView.as_view(), name="applications-batch-status"),  # Bulk status change
+    path("applications/export/", ApplicationExportView.as_view(), name="applications-export"),  # Stream CSV/NDJSON
     path("applications/<int:pk>/", ApplicationDetailView.as_view(), name="application-detail"),  # Update status
 
 
@@ -31,10 +38,25 @@ urlpatterns = [
     path('social-media/<int:id>/', SocialMediaView.as_view(), name='social-media'),
     path('contact-info/<int:id>/', ContactInfoView.as_view(), name='contact-info'),
     path('company-complete/<int:id>/', CompanyCompleteView.as_view(), name='company-complete'),
+    path('company/', CompanyOnboardingCreateView.as_view(), name='company-create'),
+    path('company/<int:id>/', CompanyOnboardingView.as_view(), name='company-onboarding'),
 
     path('stats/', StatsAPIView.as_view(), name='stats'),
     path('profile-completion/', ProfileCompletionAPIView.as_view(), name='profile-completion'),
     path('recent-applications/', RecentApplicationsAPIView.as_view(), name='recent-applications'),
+    path('cache-stats/', DashboardCacheStatsAPIView.as_view(), name='cache-stats'),
+    path('hash-metrics/', HashMetricsAPIView.as_view(), name='hash-metrics'),
 
+    path('jobs/', JobListAPIView.as_view(), name='jobs-list'),
+    path('jobs/<int:pk>/', JobDetailAPIView.as_view(), name='jobs-detail'),
+    path('jobs/facets/', JobFacetsAPIView.as_view(), name='jobs-facets'),
+    path('jobs/search/', JobSearchAPIView.as_view(), name='jobs-search'),
     path('jobs/create/', JobCreateAPIView.as_view(), name='jobs-create'),
+
+    # Async twins of the polled read endpoints (serve under ASGI)
+    path('async/stats/', async_views.stats_view, name='async-stats'),
+    path('async/profile-completion/', async_views.profile_completion_view, name='async-profile-completion'),
+    path('async/recent-applications/', async_views.recent_applications_view, name='async-recent-applications'),
+    path('async/applications/', async_views.my_applications_view, name='async-applications'),
+    path('async/applications/all/', async_views.all_applications_view, name='async-all-applications'),
 ]
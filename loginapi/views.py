@@ -1,16 +1,40 @@
-from django.contrib.auth import authenticate
+import csv
+import hmac
+import json
+from datetime import datetime
+
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import generics, permissions, status
-from .serializers import UserSerializer, SignupSerializer, ApplicationSerializer, RecentApplicationSerializer, Company, JobCreateSerializer
+from rest_framework.exceptions import ValidationError
+from .serializers import UserSerializer, SignupSerializer, ApplicationSerializer, Company, JobCreateSerializer
 from rest_framework.permissions import IsAuthenticated
 from .models import User, Job, Application
 
 from django.utils import timezone
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.core.mail import send_mail
-from .serializers import ForgotPasswordSerializer, ResetPasswordSerializer
+from django.db import IntegrityError, transaction
+from .serializers import ForgotPasswordSerializer, ResetPasswordSerializer, ApplicationStatusBatchSerializer
 from .models import PasswordResetToken
+from .filters import parse_job_filters, filter_jobs
+from .pagination import ApplicationPagination, KeysetPagination
+from .read_serializers import read_plan
+from .search import get_search_backend
+from .stats import count_status_changes, dashboard_stats
+from . import cache as dashboard_cache
+from .cache import cached_dashboard
+from .conditional import conditional_get
+from . import facets
+from .facets import job_facets
+from . import feeds
+from .routers import replica_reads
+from .outbox import enqueue_mail
+from .ingest import bulk_write_jobs
+from .onboarding import VersionConflict, company_etag, parse_if_match, save_company_changes
+from . import hashing
+from . import request_metrics
+from .hashing import PoolFull, authenticate_bounded
+from .authentication import CLAIMS_AUTHENTICATION, issue_access_token, revoke_token, revoke_user_tokens
 
 # -----------------------------
 # SIGNUP VIEW
@@ -46,23 +70,40 @@ class LoginView(APIView):
         password = request.data.get('password')
         role = request.data.get('role')
 
-        user = authenticate(request, email=email, password=password)
-
+        # Reject incomplete requests before paying for a password hash
         if not email or not password or not role:
             return Response({"error": "Email, password, and role are required"}, status=status.HTTP_400_BAD_REQUEST)
 
+        try:
+            user = authenticate_bounded(request, email=email, password=password)
+        except PoolFull:
+            return Response(
+                {"error": "Too many login attempts in progress, retry shortly"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
+
         if not user:
             return Response({"error": "Invalid email or password"}, status=status.HTTP_401_UNAUTHORIZED)
 
         if user.role != role:
             return Response({"error": "Role mismatch"}, status=status.HTTP_401_UNAUTHORIZED)
 
-        refresh = RefreshToken.for_user(user)
         return Response({
             "user": UserSerializer(user).data,
-            "token": str(refresh.access_token)
+            "token": str(issue_access_token(user))
         }, status=status.HTTP_200_OK)
 
+
+class LogoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        # Only token-authenticated requests carry something to revoke
+        if request.auth is not None and hasattr(request.auth, "payload"):
+            revoke_token(request.auth)
+        return Response({"message": "Logged out"}, status=status.HTTP_200_OK)
+
 class ForgotPasswordView(APIView):
     def post(self, request):
         serializer = ForgotPasswordSerializer(data=request.data)
@@ -70,15 +111,15 @@ class ForgotPasswordView(APIView):
             email = serializer.validated_data['email']
             try:
                 user = User.objects.get(email=email)
-                token_obj = PasswordResetToken.objects.create(user=user)
-                # Send email (console backend will print)
-                send_mail(
-                    subject="Password Reset Token",
-                    message=f"Use this token to reset your password: {token_obj.token}",
-                    from_email="noreply@example.com",
-                    recipient_list=[user.email],
-                    fail_silently=False
-                )
+                with transaction.atomic():
+                    token_obj = PasswordResetToken.issue_for(user)
+                    # Queued in the outbox; delivered by `manage.py send_queued_mail`
+                    enqueue_mail(
+                        subject="Password Reset Token",
+                        message=f"Use this token to reset your password: {token_obj.token}",
+                        from_email="noreply@example.com",
+                        recipient_list=[user.email],
+                    )
                 return Response({"message": "Password reset token sent to email"})
             except User.DoesNotExist:
                 return Response({"error": "User with this email does not exist"}, status=status.HTTP_404_NOT_FOUND)
@@ -91,60 +132,190 @@ class ResetPasswordView(APIView):
             token = serializer.validated_data['token']
             new_password = serializer.validated_data['new_password']
 
-            try:
-                token_obj = PasswordResetToken.objects.get(token=token)
-            except PasswordResetToken.DoesNotExist:
-                return Response({"error": "Invalid token"}, status=status.HTTP_400_BAD_REQUEST)
-
-            if token_obj.expires_at < timezone.now():
-                return Response({"error": "Token expired"}, status=status.HTTP_400_BAD_REQUEST)
+            # Expiry is part of the lookup, so expired rows are never loaded.
+            token_obj = (
+                PasswordResetToken.objects.select_related("user")
+                .filter(token=token, expires_at__gt=timezone.now())
+                .first()
+            )
+            if token_obj is None:
+                return Response({"error": "Invalid or expired token"}, status=status.HTTP_400_BAD_REQUEST)
 
             user = token_obj.user
             user.set_password(new_password)
-            user.save()
-            token_obj.delete()
+            with transaction.atomic():
+                user.save(update_fields=["password"])
+                token_obj.delete()
+            revoke_user_tokens(user.id)
             return Response({"message": "Password reset successful"}, status=status.HTTP_200_OK)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 # ApplyJob
 
+def scope_applications(user, queryset):
+    """Recruiters see applications to their jobs, admins see all, job seekers their own."""
+    if user.role == "Recruiter":
+        return queryset.filter(job__recruiter_id=user.id)
+    if user.role == "Admin" or user.is_staff:
+        return queryset
+    return queryset.filter(applicant_id=user.id)
+
+
+def requested_fields(request, serializer_class):
+    """Parse ``?fields=a,b`` against the serializer's fields; None means all fields."""
+    raw = request.query_params.get("fields")
+    if not raw:
+        return None
+    fields = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = set(fields) - set(serializer_class().fields)
+    if unknown:
+        raise ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}"})
+    return fields
+
+
 # ----------------------------
 # Job Seeker: Apply & View Own Applications
 # ----------------------------
 class ApplicationView(APIView):
+    authentication_classes = CLAIMS_AUTHENTICATION
     permission_classes = [permissions.IsAuthenticated]
 
     # Apply for a job
     def post(self, request):
         serializer = ApplicationSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save(applicant=request.user)
+            serializer.save(applicant_id=request.user.id)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     # Get only the logged-in user’s applications
+    @replica_reads()
+    @conditional_get(
+        lambda view, request: Application.objects.filter(applicant_id=request.user.id), ApplicationPagination
+    )
     def get(self, request):
-        apps = Application.objects.filter(applicant=request.user)
-        serializer = ApplicationSerializer(apps, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        plan = read_plan(ApplicationSerializer, requested_fields(request, ApplicationSerializer))
+        apps = plan.values(Application.objects.filter(applicant_id=request.user.id), "id", "applied_at")
+        paginator = ApplicationPagination()
+        page = paginator.paginate_queryset(apps, request, view=self)
+        return paginator.get_paginated_response(plan.serialize(page))
 
 
 # ----------------------------
 # Recruiter/Admin: Manage Applications
 # ----------------------------
 class AllApplicationsView(generics.ListAPIView):
-    queryset = Application.objects.all().order_by("-applied_at")
+    queryset = Application.objects.all()
     serializer_class = ApplicationSerializer
+    pagination_class = ApplicationPagination
+    authentication_classes = CLAIMS_AUTHENTICATION
     permission_classes = [permissions.IsAdminUser | permissions.IsAuthenticated]
 
     def get_queryset(self):
-        user = self.request.user
-        # Recruiter: show only applications for jobs they posted
-        if hasattr(user, "role") and user.role == "Recruiter":
-            return Application.objects.filter(job__posted_by=user).order_by("-applied_at")
-        # Admin: show all
-        return super().get_queryset()
+        return scope_applications(self.request.user, super().get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        # Same output as ApplicationSerializer, built from values() rows
+        plan = read_plan(self.serializer_class, requested_fields(request, self.serializer_class))
+        page = self.paginate_queryset(plan.values(self.filter_queryset(self.get_queryset()), "id", "applied_at"))
+        return self.get_paginated_response(plan.serialize(page, request))
+
+    @replica_reads()
+    @conditional_get(
+        lambda view, request: scope_applications(request.user, Application.objects.all()), ApplicationPagination
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+# ----------------------------
+# Recruiter/Admin: Export Applications
+# ----------------------------
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Echo:
+    """File-like object whose write() hands the row back instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+class ApplicationExportView(APIView):
+    authentication_classes = CLAIMS_AUTHENTICATION
+    permission_classes = [permissions.IsAuthenticated]
+    chunk_size = 2000
+    columns = [
+        ("id", "id"),
+        ("job_id", "job_id"),
+        ("job_title", "job__title"),
+        ("applicant_id", "applicant_id"),
+        ("applicant_email", "applicant__email"),
+        ("name", "name"),
+        ("email", "email"),
+        ("phone", "phone"),
+        ("status", "status"),
+        ("resume", "resume"),
+        ("applied_at", "applied_at"),
+    ]
+
+    def get(self, request):
+        output = request.query_params.get("output", "csv")
+        if output not in ("csv", "ndjson"):
+            return Response({"error": "output must be 'csv' or 'ndjson'"}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = scope_applications(request.user, Application.objects.all())
+        job_id = request.query_params.get("job")
+        if job_id is not None:
+            try:
+                # isdigit() takes "²" and isdecimal() alone takes other scripts' digits
+                if not (job_id.isascii() and job_id.isdecimal()):
+                    raise ValueError(job_id)
+                job_id = int(job_id)
+            except ValueError:
+                return Response({"error": "job must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(job_id=job_id)
+
+        # values_list() + iterator() streams plain tuples from the cursor in
+        # chunks, so memory stays flat regardless of the number of rows.
+        rows = (
+            queryset.order_by("id")
+            .values_list(*(lookup for _, lookup in self.columns))
+            .iterator(chunk_size=self.chunk_size)
+        )
+        if output == "csv":
+            response = StreamingHttpResponse(self.stream_csv(rows), content_type="text/csv")
+        else:
+            response = StreamingHttpResponse(self.stream_ndjson(rows), content_type="application/x-ndjson")
+        response["Content-Disposition"] = f'attachment; filename="applications.{output}"'
+        return response
+
+    @staticmethod
+    def format_row(row):
+        return [value.isoformat() if isinstance(value, datetime) else value for value in row]
+
+    @staticmethod
+    def csv_cell(value):
+        # Spreadsheets run cells starting with these as formulas (CSV injection).
+        if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+            return "'" + value
+        return value
+
+    def stream_csv(self, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow([name for name, _ in self.columns])
+        for row in rows:
+            yield writer.writerow([self.csv_cell(value) for value in self.format_row(row)])
+
+    def stream_ndjson(self, rows):
+        names = [name for name, _ in self.columns]
+        for row in rows:
+            yield json.dumps(dict(zip(names, self.format_row(row)))) + "\n"
+
+
+def can_manage_applications(user):
+    return user.role in ("Recruiter", "Admin") or user.is_staff
 
 
 class ApplicationDetailView(generics.RetrieveUpdateAPIView):
@@ -152,140 +323,389 @@ class ApplicationDetailView(generics.RetrieveUpdateAPIView):
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAdminUser | permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        return scope_applications(self.request.user, super().get_queryset())
+
+    @conditional_get(lambda view, request, pk: view.get_queryset().filter(pk=pk))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
     def patch(self, request, *args, **kwargs):
         """Recruiter/Admin can update application status only"""
+        if not can_manage_applications(request.user):
+            return Response({"error": "Only recruiters can change application status"}, status=status.HTTP_403_FORBIDDEN)
         application = self.get_object()
-        new_status = request.data.get("status")
+        new_status = str(request.data.get("status", "")).lower()
 
-        if new_status not in ["Pending", "Accepted", "Rejected"]:
+        if new_status not in dict(Application._meta.get_field("status").choices):
             return Response({"error": "Invalid status"}, status=status.HTTP_400_BAD_REQUEST)
 
         application.status = new_status
-        application.save()
+        application.save(update_fields=["status", "updated_at"])
         serializer = self.get_serializer(application)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+class ApplicationBatchStatusView(APIView):
+    """Set one status on many applications with a single set-based UPDATE."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        if not can_manage_applications(request.user):
+            return Response({"error": "Only recruiters can change application status"}, status=status.HTTP_403_FORBIDDEN)
+        serializer = ApplicationStatusBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = set(serializer.validated_data["ids"])
+        new_status = serializer.validated_data["status"]
+
+        with transaction.atomic():
+            # One SELECT to check ownership and learn the old statuses
+            rows = list(
+                scope_applications(request.user, Application.objects.select_for_update(of=("self",)))
+                .filter(id__in=ids)
+                .values_list("id", "applicant_id", "job__recruiter_id", "status")
+            )
+            changes = [row for row in rows if row[3] != new_status]
+            affected = 0
+            if changes:
+                affected = Application.objects.filter(id__in=[row[0] for row in changes]).update(
+                    status=new_status, updated_at=timezone.now()
+                )
+            count_status_changes(
+                (applicant_id, recruiter_id, old_status, new_status)
+                for _, applicant_id, recruiter_id, old_status in changes
+            )
+            owners = {owner for row in changes for owner in row[1:3]}
+            transaction.on_commit(lambda: dashboard_cache.invalidate(*owners, dashboard_cache.GLOBAL_SCOPE))
+            transaction.on_commit(lambda: feeds.buffers.discard(*owners, feeds.GLOBAL_FEED))
+
+        allowed = {row[0] for row in rows}
+        return Response({
+            "updated": affected,
+            "rejected_ids": sorted(ids - allowed),
+        }, status=status.HTTP_200_OK)
+
+
 from .serializers import (
     CompanyInfoSerializer,
     FoundingInfoSerializer,
     SocialMediaSerializer,
     ContactInfoSerializer,
-    CompanyCompleteSerializer
+    CompanyCompleteSerializer,
+    CompanyOnboardingSerializer,
 )
 
-# Step 1: Company Info
-class CompanyInfoView(generics.CreateAPIView):
+
+class CompanyWriteMixin:
+    """
+    Routes company updates through save_company_changes(): only changed
+    columns are written, and an If-Match header (the ETag we return) is
+    checked against the row version.
+    """
     queryset = Company.objects.all()
+    lookup_field = 'id'
+
+    def perform_update(self, serializer):
+        expected = parse_if_match(self.request.headers.get("If-Match"))
+        save_company_changes(serializer.instance, serializer.validated_data, expected)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, VersionConflict):
+            # 412 when the client's If-Match is stale, 409 when a concurrent write won the race.
+            conflict_status = (
+                status.HTTP_412_PRECONDITION_FAILED if "If-Match" in self.request.headers
+                else status.HTTP_409_CONFLICT
+            )
+            return Response(
+                {"error": "Company was modified by someone else; reload and retry"},
+                status=conflict_status,
+            )
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        company = getattr(self, "company", None)
+        if company is not None and response.status_code < 300:
+            response["ETag"] = company_etag(company)
+        return response
+
+    def get_object(self):
+        self.company = super().get_object()
+        return self.company
+
+    def perform_create(self, serializer):
+        self.company = serializer.save()
+
+
+# Single-call onboarding: any subset of the wizard's fields
+class CompanyOnboardingView(CompanyWriteMixin, generics.RetrieveUpdateAPIView):
+    serializer_class = CompanyOnboardingSerializer
+
+
+class CompanyOnboardingCreateView(CompanyWriteMixin, generics.CreateAPIView):
+    serializer_class = CompanyOnboardingSerializer
+
+
+# Step 1: Company Info
+class CompanyInfoView(CompanyWriteMixin, generics.CreateAPIView):
     serializer_class = CompanyInfoSerializer
 
 # Step 2: Founding Info
-class FoundingInfoView(generics.UpdateAPIView):
-    queryset = Company.objects.all()
+class FoundingInfoView(CompanyWriteMixin, generics.UpdateAPIView):
     serializer_class = FoundingInfoSerializer
-    lookup_field = 'id'
 
 # Step 3: Social Media
-class SocialMediaView(generics.UpdateAPIView):
-    queryset = Company.objects.all()
+class SocialMediaView(CompanyWriteMixin, generics.UpdateAPIView):
     serializer_class = SocialMediaSerializer
-    lookup_field = 'id'
 
 # Step 4: Contact Info
-class ContactInfoView(generics.UpdateAPIView):
-    queryset = Company.objects.all()
+class ContactInfoView(CompanyWriteMixin, generics.UpdateAPIView):
     serializer_class = ContactInfoSerializer
-    lookup_field = 'id'
 
 # Step 5: Complete Profile
-class CompanyCompleteView(generics.UpdateAPIView):
-    queryset = Company.objects.all()
+class CompanyCompleteView(CompanyWriteMixin, generics.UpdateAPIView):
     serializer_class = CompanyCompleteSerializer
-    lookup_field = 'id'
 
     def patch(self, request, *args, **kwargs):
         company = self.get_object()
-        company.status = "completed"
-        company.save()
+        save_company_changes(company, {"status": "completed"}, parse_if_match(request.headers.get("If-Match")))
         return Response({"status": "completed"})
 
 
-
-
-
 # Role-based stats
 class StatsAPIView(APIView):
+    authentication_classes = CLAIMS_AUTHENTICATION
     permission_classes = [IsAuthenticated]
 
+    @replica_reads()
+    @cached_dashboard("stats")
     def get(self, request):
-        user = request.user
-        role = user.role
-
-        if role == 'admin':
-            data = [
-                {"title": "Total Jobs", "value": Job.objects.count(), "icon": "applied"},
-                {"title": "Total Users", "value": User.objects.count(), "icon": "favorite"},
-                {"title": "Total Applications", "value": Application.objects.count(), "icon": "alert"},
-            ]
-        elif role == 'recruiter':
-            jobs_posted = Job.objects.filter(recruiter=user).count()
-            applicants_count = Application.objects.filter(job__recruiter=user).count()
-            pending_apps = Application.objects.filter(job__recruiter=user, status='pending').count()
-            data = [
-                {"title": "Jobs Posted", "value": jobs_posted, "icon": "applied"},
-                {"title": "Applicants", "value": applicants_count, "icon": "favorite"},
-                {"title": "Pending Applications", "value": pending_apps, "icon": "alert"},
-            ]
-        else:  # jobseeker
-            jobs_applied = Application.objects.filter(applicant=user).count()
-            accepted = Application.objects.filter(applicant=user, status='accepted').count()
-            rejected = Application.objects.filter(applicant=user, status='rejected').count()
-            pending = Application.objects.filter(applicant=user, status='pending').count()
-            data = [
-                {"title": "Jobs Applied", "value": jobs_applied, "icon": "applied"},
-                {"title": "Accepted", "value": accepted, "icon": "favorite"},
-                {"title": "Rejected", "value": rejected, "icon": "alert"},
-                {"title": "Pending", "value": pending, "icon": "applied"},
-            ]
-
-        return Response(data)
+        return Response(dashboard_stats(request.user))
 
 
 # Profile completion API
 class ProfileCompletionAPIView(APIView):
+    authentication_classes = CLAIMS_AUTHENTICATION
     permission_classes = [IsAuthenticated]
 
+    @cached_dashboard("profile-completion")
     def get(self, request):
-        user = request.user
+        # Not a token claim; read it from the row (the response is cached per user)
+        complete = User.objects.filter(pk=request.user.id).values_list("profile_complete", flat=True).first()
         return Response({
-            "profile_complete": user.profile_complete,
-            "message": "Complete your profile editing & build your custom Resume" if not user.profile_complete else ""
+            "profile_complete": bool(complete),
+            "message": "Complete your profile editing & build your custom Resume" if not complete else ""
         })
 
 
 # Recent applications API
 class RecentApplicationsAPIView(APIView):
+    authentication_classes = CLAIMS_AUTHENTICATION
     permission_classes = [IsAuthenticated]
 
+    @replica_reads()
+    @cached_dashboard("recent-applications")
+    def get(self, request):
+        return Response(feeds.recent_applications(request.user))
+
+
+# Dashboard cache hit/miss counters (this process only)
+class DashboardCacheStatsAPIView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
     def get(self, request):
-        user = request.user
-        role = user.role
+        config = dashboard_cache.get_config()
+        return Response({
+            "alias": config["ALIAS"],
+            "ttl": config["TTL"],
+            **dashboard_cache.counters.snapshot(),
+            # jobs/facets/ results share the cache but are counted separately
+            "facets": facets.counters.snapshot(),
+        })
+
 
-        if role == 'recruiter':
-            queryset = Application.objects.filter(job__recruiter=user).order_by('-applied_on')[:5]
-        elif role == 'jobseeker':
-            queryset = Application.objects.filter(applicant=user).order_by('-applied_on')[:5]
-        else:  # admin sees all
-            queryset = Application.objects.all().order_by('-applied_on')[:5]
 
-        serializer = RecentApplicationSerializer(queryset, many=True)
-        return Response(serializer.data)
+# Login password-hash timings (this process only)
+class HashMetricsAPIView(APIView):
+    permission_classes = [permissions.IsAdminUser]
 
+    def get(self, request):
+        return Response({**hashing.hasher_info(), **hashing.metrics.snapshot()})
+
+
+# Prometheus scrape endpoint: per-route timings, login hashing, dashboard cache
+def metrics_view(request):
+    # Fail closed: without a configured token the endpoint does not exist
+    token = request_metrics.get_config()["TOKEN"]
+    if not token:
+        return HttpResponse(status=404)
+    supplied = request.headers.get("Authorization", "").encode()
+    if not hmac.compare_digest(supplied, f"Bearer {token}".encode()):
+        return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+
+    lines = request_metrics.routes.render()
+    hashes = hashing.metrics.snapshot()
+    lines += [
+        "# HELP login_hash_seconds Password hashing time at login.",
+        "# TYPE login_hash_seconds histogram",
+        *(
+            request_metrics.sample("login_hash_seconds_bucket", {"le": bound}, count)
+            for bound, count in hashes["buckets"].items()
+        ),
+        request_metrics.sample("login_hash_seconds_bucket", {"le": "+Inf"}, hashes["count"]),
+        request_metrics.sample("login_hash_seconds_sum", {}, hashes["total_seconds"]),
+        request_metrics.sample("login_hash_seconds_count", {}, hashes["count"]),
+        "# TYPE login_hash_rejected_total counter",
+        request_metrics.sample("login_hash_rejected_total", {}, hashes["rejected"]),
+    ]
+    cache_counts = dashboard_cache.counters.snapshot()
+    for name in ("hits", "misses", "invalidations"):
+        lines += [
+            f"# TYPE dashboard_cache_{name}_total counter",
+            request_metrics.sample(f"dashboard_cache_{name}_total", {}, cache_counts[name]),
+        ]
+    facet_counts = facets.counters.snapshot()
+    for name in ("hits", "misses"):
+        lines += [
+            f"# TYPE facets_cache_{name}_total counter",
+            request_metrics.sample(f"facets_cache_{name}_total", {}, facet_counts[name]),
+        ]
+    return HttpResponse("\n".join(lines) + "\n", content_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 class JobCreateAPIView(generics.CreateAPIView):
     serializer_class = JobCreateSerializer
     permission_classes = [permissions.IsAuthenticated]
+    max_bulk_items = 1000
+
+    def create(self, request, *args, **kwargs):
+        # A JSON list switches to bulk mode; ?upsert=true updates by external_id
+        if isinstance(request.data, list):
+            return self.bulk_create(request)
+        return super().create(request, *args, **kwargs)
 
     def perform_create(self, serializer):
         serializer.save(recruiter=self.request.user)
+
+    def bulk_create(self, request):
+        items = request.data
+        if not items or len(items) > self.max_bulk_items:
+            return Response(
+                {"error": f"Send between 1 and {self.max_bulk_items} jobs"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        upsert = request.query_params.get("upsert", "").lower() in ("1", "true", "yes")
+        context = {**self.get_serializer_context(), "bulk": True}
+
+        valid, indexes, errors, seen = [], [], [], {}
+        for index, item in enumerate(items):
+            serializer = self.get_serializer_class()(data=item, context=context)
+            if not serializer.is_valid():
+                errors.append({"index": index, "errors": serializer.errors})
+                continue
+            external_id = serializer.validated_data.get("external_id")
+            if external_id and external_id in seen:
+                errors.append({"index": index, "errors": {"external_id": [f"Duplicate of item {seen[external_id]}"]}})
+                continue
+            if external_id:
+                seen[external_id] = index
+            valid.append(serializer.validated_data)
+            indexes.append(index)
+
+        if seen and not upsert:
+            taken = set(
+                Job.objects.filter(recruiter_id=request.user.id, external_id__in=list(seen))
+                .values_list("external_id", flat=True)
+            )
+            for external_id in taken:
+                errors.append({"index": seen[external_id], "errors": {
+                    "external_id": ["A job with this external_id already exists."]
+                }})
+            kept = [(index, data) for index, data in zip(indexes, valid) if data.get("external_id") not in taken]
+            indexes, valid = [index for index, _ in kept], [data for _, data in kept]
+            errors.sort(key=lambda error: error["index"])
+
+        if not valid:
+            return Response({"created": 0, "updated": 0, "jobs": [], "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            jobs, updated = bulk_write_jobs(request.user.id, valid, upsert=upsert)
+        except IntegrityError:
+            # Another request created one of these external_ids since the check above
+            return Response(
+                {"error": "Jobs changed concurrently; nothing was written, retry the request"},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response({
+            "created": len(jobs) - updated,
+            "updated": updated,
+            "jobs": [{"index": index, "id": job.pk} for index, job in zip(indexes, jobs)],
+            "errors": errors,
+        }, status=status.HTTP_201_CREATED)
+
+
+# Job search: filtered, keyset-paginated list
+class JobListAPIView(generics.ListAPIView):
+    serializer_class = JobCreateSerializer
+    pagination_class = KeysetPagination
+
+    def get_queryset(self):
+        filters = parse_job_filters(self.request.query_params)
+        return filter_jobs(Job.objects.all(), filters)
+
+    def list(self, request, *args, **kwargs):
+        plan = read_plan(self.serializer_class)
+        page = self.paginate_queryset(plan.values(self.filter_queryset(self.get_queryset()), "id", "created_at"))
+        return self.get_paginated_response(plan.serialize(page, request))
+
+    @replica_reads()
+    @conditional_get(lambda view, request: view.get_queryset(), KeysetPagination)
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+class JobDetailAPIView(generics.RetrieveAPIView):
+    queryset = Job.objects.all()
+    serializer_class = JobCreateSerializer
+
+    @replica_reads()
+    @conditional_get(lambda view, request, pk: Job.objects.filter(pk=pk))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+# Facet counts and salary histograms for the /jobs/ filters
+class JobFacetsAPIView(APIView):
+    @replica_reads()
+    def get(self, request):
+        filters = parse_job_filters(request.query_params)
+        data, hit = job_facets(Job.objects.all(), filters)
+        return Response(data, headers={"X-Cache": "HIT" if hit else "MISS"})
+
+
+# Job search: full-text, BM25-ranked
+class JobSearchAPIView(APIView):
+    max_limit = 50
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response({"error": "Query parameter 'q' is required"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(int(request.query_params.get("limit", 20)), self.max_limit)
+        except ValueError:
+            return Response({"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        hits = get_search_backend().search(query, limit=max(limit, 1))
+        jobs = Job.objects.in_bulk([hit.job_id for hit in hits])
+        results = [
+            {
+                "rank": hit.rank,
+                # HTML: the job's own text escaped, matches wrapped in <mark></mark>
+                "highlight": {"title": hit.title, "description": hit.snippet},
+                "job": JobCreateSerializer(jobs[hit.job_id]).data,
+            }
+            for hit in hits
+            if hit.job_id in jobs
+        ]
+        return Response({"count": len(results), "results": results})